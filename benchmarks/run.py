@@ -0,0 +1,224 @@
+"""
+Benchmarks for the parse, next run and iteration hot paths.
+
+Run from the repository root with the package installed:
+
+    $ python benchmarks/run.py --save        # record a baseline
+    $ python benchmarks/run.py --compare     # compare against the baseline
+
+Comparing exits with a non-zero code if any benchmark is slower, or uses more peak
+memory, than the baseline by more than its tolerance, so upgrades can be gated on it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import datetime as dt
+import functools
+import itertools
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+from croninfo import Crontab
+from croninfo.crontab import CronPartMinute
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+START = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+UTC = dt.timezone.utc
+
+COMMA_LIST = ",".join(str(i) for i in range(0, 60, 2))
+EXPRESSIONS = {
+    "dense": "* * * * * /usr/bin/true",
+    "sparse_leap_day": "0 0 29 2 * /usr/bin/true",
+    "sparse_intersection": "0 12 13 * 5 /usr/bin/true",
+    "comma_list": f"{COMMA_LIST} 1,3,5,7,9,11,13,15,17,19 * * * /usr/bin/true",
+    "macro": "@weekly /usr/bin/true",
+}
+ITER_RUNS = 10_000
+
+
+class Case(NamedTuple):
+    name: str
+    func: Callable[[], Any]
+
+
+class Result(NamedTuple):
+    ops_per_sec: float
+    peak_bytes: int
+
+
+def _cases() -> list[Case]:
+    cases = [
+        Case(
+            "CronPart._parse[comma_list]",
+            functools.partial(CronPartMinute.from_expr, COMMA_LIST),
+        ),
+        Case(
+            "CronPart._parse[range_step]",
+            functools.partial(CronPartMinute.from_expr, "5-55/5"),
+        ),
+    ]
+    for label, expr in EXPRESSIONS.items():
+        crontab = Crontab.from_parse(expr=expr, tz=UTC)
+        cases += [
+            Case(
+                f"Crontab.from_parse[{label}]",
+                functools.partial(Crontab.from_parse, expr=expr, tz=UTC),
+            ),
+            Case(
+                f"Crontab.next_run[{label}]", functools.partial(crontab.next_run, START)
+            ),
+            Case(f"Crontab.iter[{label}]", functools.partial(_consume_iter, crontab)),
+        ]
+    return cases
+
+
+def _consume_iter(crontab: Crontab) -> None:
+    collections.deque(itertools.islice(crontab.iter(START), ITER_RUNS), maxlen=0)
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> Result:
+    # Warm up any caches so the numbers reflect steady state usage.
+    func()
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(ops_per_sec=number / best, peak_bytes=peak)
+
+
+def _format_row(name: str, result: Result, change: str = "") -> str:
+    return f"{name:<45} {result.ops_per_sec:>14,.1f} ops/s {result.peak_bytes / 1024:>10,.1f} KiB  {change}"
+
+
+def run(*, pattern: str | None, repeat: int) -> dict[str, Result]:
+    results = {}
+    for case in _cases():
+        if pattern and pattern not in case.name:
+            continue
+        results[case.name] = _measure(case.func, repeat)
+        print(_format_row(case.name, results[case.name]), flush=True)
+    return results
+
+
+def compare(
+    results: dict[str, Result],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float,
+    memory_tolerance: float,
+) -> bool:
+    """
+    Print the change against the baseline, returning False if any benchmark regressed.
+    """
+    ok = True
+    print(
+        f"\nCompared to baseline ({baseline['python']}, tolerance {tolerance:.0%}, "
+        f"memory tolerance {memory_tolerance:.0%}):"
+    )
+    for name, result in results.items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            print(_format_row(name, result, "new"))
+            continue
+        speed = result.ops_per_sec / previous["ops_per_sec"] - 1
+        memory = result.peak_bytes / max(previous["peak_bytes"], 1) - 1
+        regressed = speed < -tolerance or memory > memory_tolerance
+        ok = ok and not regressed
+        print(
+            _format_row(
+                name,
+                result,
+                f"{speed:+.1%} ops/s {memory:+.1%} memory"
+                f"{' REGRESSED' if regressed else ''}",
+            )
+        )
+    return ok
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "-k",
+        dest="pattern",
+        help="Only run benchmarks whose name contains this string.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timing repeats, the best is kept.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Path of the baseline JSON file.",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Save the results as the new baseline."
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Compare the results against the baseline.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed fractional slowdown before failing, defaults to 0.1.",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed fractional increase in peak memory before failing, "
+        "defaults to 0.1.",
+    )
+    args = parser.parse_args(argv)
+
+    print(f"{'Benchmark':<45} {'Throughput':>20} {'Peak Memory':>15}")
+    results = run(pattern=args.pattern, repeat=args.repeat)
+
+    if args.save:
+        data: dict[str, Any] = {
+            "python": platform.python_version(),
+            "results": {name: result._asdict() for name, result in results.items()},
+        }
+        args.baseline.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline saved to {args.baseline}")
+    if args.compare:
+        if not args.baseline.exists():
+            print(
+                f"\nNo baseline found at {args.baseline}, run with --save first.",
+                file=sys.stderr,
+            )
+            return 2
+        baseline = json.loads(args.baseline.read_text())
+        if not compare(
+            results,
+            baseline,
+            tolerance=args.tolerance,
+            memory_tolerance=args.memory_tolerance,
+        ):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,12 @@
 from __future__ import annotations
 
 import sys
+from typing import Any
 
-from croninfo.crontab import Crontab
+from croninfo.crontab import Crontab, ScheduleCache
+from croninfo.schedule_set import ScheduleSet
 
-# Import metadata (using importlib_metadata backport for python versions <3.8)
-if sys.version_info >= (3, 8):
-    from importlib import metadata
-else:
-    import importlib_metadata as metadata
-
-__all__ = ("Crontab",)
-
-__version__ = metadata.version("croninfo")
+__all__ = ("Crontab", "ScheduleCache", "ScheduleSet")
 
 # Check major python version
 if sys.version_info[0] < 3:
@@ -20,6 +14,22 @@ if sys.version_info[0] < 3:
 # Check minor python version
 elif sys.version_info[1] < 7:
     raise Exception(
-        "Croninfo %s only supports Python 3.7+. "
-        "Use a later version of Python for support." % __version__
+        "Croninfo only supports Python 3.7+. "
+        "Use a later version of Python for support."
     )
+
+
+def __getattr__(name: str) -> Any:
+    # The version is looked up lazily as importing the package metadata is
+    # comparatively slow and most users of the library never need it.
+    if name == "__version__":
+        # Import metadata (using importlib_metadata backport for python versions <3.8)
+        if sys.version_info >= (3, 8):
+            from importlib import metadata
+        else:
+            import importlib_metadata as metadata
+
+        version = metadata.version("croninfo")
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
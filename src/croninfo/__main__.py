@@ -3,5 +3,4 @@ from __future__ import annotations
 from croninfo.cli import cli
 
 if __name__ == "__main__":
-    cli.app(prog_name="croninfo")
-    cli()
+    cli(prog_name="croninfo")
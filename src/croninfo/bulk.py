@@ -0,0 +1,99 @@
+"""
+Parallel analysis of large numbers of crontab lines across a process pool.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import datetime as dt
+import functools
+import itertools
+import os
+from typing import Any, Iterable, Iterator
+
+from croninfo.crontab import ScheduleCache
+from croninfo.reader import iter_crontab
+
+# Schedules repeat across chunks so each worker process keeps its own cache.
+_cache = ScheduleCache()
+
+
+def analyse(
+    lines: Iterable[str],
+    *,
+    tz: dt.tzinfo,
+    now: dt.datetime | None = None,
+    system: bool = False,
+    workers: int | None = None,
+    chunk_size: int = 1000,
+) -> Iterator[dict[str, Any]]:
+    """
+    Parses crontab lines and finds their next run after ``now`` across a pool of
+    ``workers`` processes (defaults to the number of CPUs), in chunks of
+    ``chunk_size`` lines.
+
+    Yields ``CrontabLine.as_dict`` or ``CrontabLineError.as_dict`` for each entry in
+    input order, as soon as each chunk and those before it have completed. Input is
+    read lazily with a bounded number of chunks in flight, so memory use does not
+    grow with the number of lines.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    workers = workers or os.cpu_count() or 1
+    chunks = _iter_chunks(lines, chunk_size)
+    task = functools.partial(
+        _analyse_chunk, tz=tz, now=now or dt.datetime.now(tz=tz), system=system
+    )
+
+    # Avoid the cost of starting processes when there is nothing to parallelise.
+    if workers == 1:
+        for chunk in chunks:
+            yield from task(chunk)
+        return
+
+    max_pending = 2 * workers
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: collections.deque[concurrent.futures.Future[list[dict[str, Any]]]] = (
+            collections.deque()
+        )
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(task, chunk))
+                while pending and (len(pending) >= max_pending or pending[0].done()):
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Stop outstanding work if the consumer stops early or a chunk fails.
+            for future in pending:
+                future.cancel()
+
+
+def _iter_chunks(lines: Iterable[str], size: int) -> Iterator[tuple[int, list[str]]]:
+    """
+    Yields chunks of lines along with the line number of the first in each.
+    """
+    lines = iter(lines)
+    start = 1
+    while True:
+        chunk = list(itertools.islice(lines, size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _analyse_chunk(
+    chunk: tuple[int, list[str]], *, tz: dt.tzinfo, now: dt.datetime, system: bool
+) -> list[dict[str, Any]]:
+    start, lines = chunk
+    return [
+        entry.as_dict(now)
+        for entry in iter_crontab(
+            lines, tz=tz, system=system, cache=_cache, start=start
+        )
+    ]
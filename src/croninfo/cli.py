@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import contextlib
 import datetime as dt
+import sys
+import time
 from enum import Enum
+from typing import List, Optional
 
-import typer
-import tzlocal
-from rich.console import Console
-from rich.panel import Panel
+import croninfo
+from croninfo.crontab import Crontab, ScheduleCache
 
-from croninfo import __version__
-from croninfo.crontab import Crontab
+try:
+    import typer
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "The croninfo CLI requires extra dependencies, "
+        "install with `pip install croninfo[cli]`"
+    ) from e
 
+# Only typer is needed to build the CLI, other dependencies (including croninfo
+# modules beyond the package itself) are imported within the commands which use
+# them to keep startup (E.G. --version) fast.
 cli = typer.Typer()
 
 
@@ -25,20 +35,42 @@ def parse(
     tz_type: ParseTZOpts = typer.Option(  # noqa: B008
         ParseTZOpts.UTC.value, "--tz-type", case_sensitive=False
     ),
+    tz_names: Optional[List[str]] = typer.Option(  # noqa: B008
+        None,
+        "--tz",
+        help="IANA timezone to also output the next run in, E.G. Europe/London. "
+        "Can be repeated.",
+    ),
+    show_stats: bool = typer.Option(  # noqa: B008
+        False,
+        "--stats",
+        help="Output the wall time and search counters, useful for finding slow expressions.",
+    ),
 ) -> None:
     """
     Accept the input of a Crontab expression, which is then parsed into a data structure.
     All datetime info is parsed in the timezone provided, defaults to UTC.
     """
-    tz = (
-        dt.timezone.utc
-        if tz_type.value == ParseTZOpts.UTC.value
-        else tzlocal.get_localzone()
+    from rich.console import Console
+    from rich.panel import Panel
+
+    from croninfo.stats import Stats, collect
+
+    zones = [_resolve_zone(name) for name in tz_names or []]
+    tz = _resolve_tz(tz_type)
+
+    collector: contextlib.AbstractContextManager[Stats | None] = (
+        collect() if show_stats else contextlib.nullcontext()
     )
-    crontab = Crontab.from_parse(expr=expression, tz=tz)
+    started = time.perf_counter()
+    with collector as stats:
+        crontab = Crontab.from_parse(expr=expression, tz=tz)
 
-    # Determine next scheduled run of crontab.
-    next_run = crontab.next_scheduled_run
+        # Determine next scheduled run of crontab.
+        next_run = crontab.next_scheduled_run
+        now = dt.datetime.now(tz=dt.timezone.utc)
+        zone_runs = crontab.next_run_in_zones(zones, now) if zones else {}
+    wall_seconds = time.perf_counter() - started
     next_run_delta = next_run - dt.datetime.now(tz=crontab.tz)
 
     # Map of desired header name->value
@@ -72,6 +104,276 @@ def parse(
     console = Console()
     console.print(panel, justify="left")
 
+    if zone_runs:
+        zones_output = [
+            f"[bold]{str(zone):<20}[/bold] {run.isoformat()} "
+            f"(in {_format_friendly_timedelta(run - now)})"
+            for zone, run in zone_runs.items()
+        ]
+        panel = Panel(
+            "\n".join(zones_output),
+            title="Next Scheduled Run by Zone",
+            title_align="left",
+            expand=False,
+        )
+        console.print(panel, justify="left")
+
+    if stats is not None:
+        stats_output = [f"[bold]{'Wall Time':<20}[/bold] {wall_seconds * 1000:.3f}ms"]
+        for name, value in stats.as_dict().items():
+            if name == "parse_seconds":
+                stats_output.append(
+                    f"[bold]{'Parse Time':<20}[/bold] {value * 1000:.3f}ms"
+                )
+                continue
+            header = name.replace("_", " ").title()
+            stats_output.append(f"[bold]{header:<20}[/bold] {value}")
+        panel = Panel(
+            "\n".join(stats_output),
+            title="Stats",
+            title_align="left",
+            expand=False,
+        )
+        console.print(panel, justify="left")
+
+
+@cli.command()
+def batch(
+    file: typer.FileText = typer.Argument(  # noqa: B008
+        "-", help="File of expressions, one per line. Defaults to stdin."
+    ),
+    tz_type: ParseTZOpts = typer.Option(  # noqa: B008
+        ParseTZOpts.UTC.value, "--tz-type", case_sensitive=False
+    ),
+    chunk_size: int = typer.Option(  # noqa: B008
+        1000, "--chunk-size", min=1, help="Number of records written per flush."
+    ),
+) -> None:
+    """
+    Parse many Crontab expressions, one per line, and output one JSON object per line.
+    Lines which fail to parse output an error record and the exit code will be 1.
+    """
+    import json
+
+    from croninfo.reader import CrontabLineError, iter_crontab
+
+    tz = _resolve_tz(tz_type)
+    now = dt.datetime.now(tz=tz)
+    cache = ScheduleCache()
+
+    has_errors = False
+    chunk = []
+    for entry in iter_crontab(file, tz=tz, cache=cache):
+        has_errors = has_errors or isinstance(entry, CrontabLineError)
+        chunk.append(json.dumps(entry.as_dict(now)))
+        if len(chunk) >= chunk_size:
+            _write_chunk(chunk)
+            chunk = []
+    _write_chunk(chunk)
+
+    if has_errors:
+        raise typer.Exit(code=1)
+
+
+@cli.command()
+def bulk(
+    file: typer.FileText = typer.Argument(  # noqa: B008
+        "-", help="File of expressions, one per line. Defaults to stdin."
+    ),
+    tz_type: ParseTZOpts = typer.Option(  # noqa: B008
+        ParseTZOpts.UTC.value, "--tz-type", case_sensitive=False
+    ),
+    workers: Optional[int] = typer.Option(  # noqa: B008
+        None,
+        "--workers",
+        min=1,
+        help="Number of worker processes. Defaults to the number of CPUs.",
+    ),
+    chunk_size: int = typer.Option(  # noqa: B008
+        1000,
+        "--chunk-size",
+        min=1,
+        help="Number of lines sent to a worker at a time and written per flush.",
+    ),
+) -> None:
+    """
+    Like "batch" but parses expressions across a pool of processes, outputting
+    one JSON object per line in input order as they complete.
+    Lines which fail to parse output an error record and the exit code will be 1.
+    """
+    import json
+
+    from croninfo.bulk import analyse
+
+    tz = _resolve_tz(tz_type)
+
+    has_errors = False
+    chunk = []
+    for record in analyse(file, tz=tz, workers=workers, chunk_size=chunk_size):
+        has_errors = has_errors or "error" in record
+        chunk.append(json.dumps(record))
+        if len(chunk) >= chunk_size:
+            _write_chunk(chunk)
+            chunk = []
+    _write_chunk(chunk)
+
+    if has_errors:
+        raise typer.Exit(code=1)
+
+
+@cli.command()
+def load(
+    file: typer.FileText = typer.Argument(  # noqa: B008
+        "-", help="File of expressions, one per line. Defaults to stdin."
+    ),
+    tz_type: ParseTZOpts = typer.Option(  # noqa: B008
+        ParseTZOpts.UTC.value, "--tz-type", case_sensitive=False
+    ),
+    days: int = typer.Option(  # noqa: B008
+        7, "--days", min=1, help="Number of days from now to count firings over."
+    ),
+    top: int = typer.Option(  # noqa: B008
+        10, "--top", min=1, help="Number of peak minutes to output."
+    ),
+) -> None:
+    """
+    Count how many of the Crontab expressions, one per line, fire in each minute and
+    output the busiest minutes along with the lines which fire in them.
+    Lines which fail to parse are reported and the exit code will be 1.
+    """
+    from rich.console import Console
+    from rich.panel import Panel
+
+    from croninfo.load import LoadHistogram
+    from croninfo.reader import CrontabLineError, iter_crontab
+
+    tz = _resolve_tz(tz_type)
+    console = Console()
+    error_console = Console(stderr=True)
+
+    linenos = []
+    crontabs = []
+    has_errors = False
+    for entry in iter_crontab(file, tz=tz, cache=ScheduleCache()):
+        if isinstance(entry, CrontabLineError):
+            has_errors = True
+            error_console.print(f"Line {entry.lineno}: {entry.error}", markup=False)
+            continue
+        linenos.append(entry.lineno)
+        crontabs.append(entry.crontab)
+
+    # Start from the next whole minute as runs in the current one have passed.
+    start = dt.datetime.now(tz=dt.timezone.utc).replace(second=0, microsecond=0)
+    start += dt.timedelta(minutes=1)
+    histogram = LoadHistogram(crontabs, start, start + dt.timedelta(days=days))
+
+    peaks_output = []
+    for peak in histogram.peaks(top):
+        lines = [str(linenos[index]) for index in peak.schedules]
+        if len(lines) > 10:
+            lines[10:] = [f"and {len(lines) - 10} more"]
+        minute = peak.minute.astimezone(tz).isoformat()
+        peaks_output.append(
+            f"[bold]{minute:<26}[/bold] {peak.firings:>6}  lines {', '.join(lines)}"
+        )
+
+    panel = Panel(
+        "\n".join(peaks_output) or "No runs",
+        title="Peak Load",
+        title_align="left",
+        subtitle=f"{len(crontabs)} schedules over {days} days",
+        subtitle_align="left",
+        expand=False,
+    )
+    console.print(panel, justify="left")
+
+    if has_errors:
+        raise typer.Exit(code=1)
+
+
+@cli.command(name="rebalance")
+def rebalance_command(
+    file: typer.FileText = typer.Argument(  # noqa: B008
+        "-", help="File of expressions, one per line. Defaults to stdin."
+    ),
+    tz_type: ParseTZOpts = typer.Option(  # noqa: B008
+        ParseTZOpts.UTC.value, "--tz-type", case_sensitive=False
+    ),
+    hours: int = typer.Option(  # noqa: B008
+        0,
+        "--hours",
+        min=0,
+        max=23,
+        help="Number of hours schedules may be moved earlier or later by.",
+    ),
+) -> None:
+    """
+    Suggest new minutes for the Crontab expressions, one per line, which spread
+    them out to lower the most running in any minute, keeping how often each runs.
+    Outputs the rewritten expressions in order, with the peak before and after
+    to stderr. Lines which fail to parse are reported and the exit code will be 1.
+    """
+    from rich.console import Console
+
+    from croninfo.reader import CrontabLineError, iter_crontab
+    from croninfo.rebalance import peak_load, rebalance
+
+    tz = _resolve_tz(tz_type)
+    error_console = Console(stderr=True)
+
+    crontabs = []
+    has_errors = False
+    for entry in iter_crontab(file, tz=tz, cache=ScheduleCache()):
+        if isinstance(entry, CrontabLineError):
+            has_errors = True
+            error_console.print(f"Line {entry.lineno}: {entry.error}", markup=False)
+            continue
+        crontabs.append(entry.crontab)
+
+    at = dt.datetime.now(tz=dt.timezone.utc)
+    rebalanced = rebalance(crontabs, max_hour_shift=hours, at=at)
+    _write_chunk([crontab.to_expr() for crontab in rebalanced])
+    if crontabs:
+        error_console.print(
+            f"Peak load {peak_load(crontabs, at)} -> {peak_load(rebalanced, at)}",
+            markup=False,
+        )
+
+    if has_errors:
+        raise typer.Exit(code=1)
+
+
+def _write_chunk(lines: list[str]) -> None:
+    if not lines:
+        return
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _resolve_zone(name: str) -> dt.tzinfo:
+    # Backports is required for Python versions <3.9
+    if sys.version_info >= (3, 9):
+        import zoneinfo
+    else:
+        from backports import zoneinfo
+
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        raise typer.BadParameter(
+            f"'{name}' is not a valid IANA timezone", param_hint="'--tz'"
+        )
+
+
+def _resolve_tz(tz_type: ParseTZOpts) -> dt.tzinfo:
+    import tzlocal
+
+    return (
+        dt.timezone.utc
+        if tz_type.value == ParseTZOpts.UTC.value
+        else tzlocal.get_localzone()
+    )
+
 
 def _format_friendly_timedelta(delta: dt.timedelta) -> str:
     days = delta.days
@@ -101,7 +403,7 @@ def _format_friendly_timedelta(delta: dt.timedelta) -> str:
 
 def _version_callback(value: bool) -> None:
     if value:
-        typer.echo(f"Version: {__version__}")
+        typer.echo(f"Version: {croninfo.__version__}")
         raise typer.Exit()
 
 
@@ -1,9 +1,30 @@
 from __future__ import annotations
 
+import bisect
 import calendar
 import dataclasses
 import datetime as dt
-from typing import ClassVar, Iterator
+import functools
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import ClassVar, Hashable, Iterable, Iterator, NamedTuple
+
+from croninfo.stats import current as current_stats
+from croninfo.tz import UTC, localize, offset_changes, transition_table
+
+# Upper bound (exclusive) for generating schedules, this will give us good buffer.
+MAX_YEAR = 2099
+# Lower bound (inclusive) when walking schedules backwards.
+MIN_YEAR = 1970
+# Leap years and weekdays repeat every 400 years in the Gregorian calendar.
+GREGORIAN_CYCLE_YEARS = 400
+# Most days each month can have, including February in leap years.
+MAX_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+# Schedules have a resolution of one minute.
+MINUTE = dt.timedelta(minutes=1)
+MINUTES_PER_DAY = 24 * 60
 
 # Definitions based on spec here:
 # https://www.freebsd.org/cgi/man.cgi?crontab%285%29
@@ -20,12 +41,251 @@ CRON_MACROS = {
 }
 
 
+@functools.lru_cache(maxsize=512)
+def month_starts(year: int) -> tuple[int, ...]:
+    """
+    Day of year offsets of each month, such that day ``d`` of month ``m`` is bit
+    ``starts[m] + d`` of a year mask. Index 0 is unused and index 13 is the number
+    of days in the year.
+    """
+    starts = [0, 0]
+    for month in range(1, 13):
+        starts.append(starts[-1] + calendar.monthrange(year, month)[1])
+    return tuple(starts)
+
+
+@functools.lru_cache(maxsize=512)
+def _first_weekdays(year: int) -> tuple[int, ...]:
+    """
+    Weekday of the first of each month, Monday == 0 and Sunday == 6. Index 0 is unused.
+    """
+    starts = month_starts(year)
+    first_weekday = calendar.weekday(year, 1, 1)
+    return (0, *((first_weekday + starts[month]) % 7 for month in range(1, 13)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _weekday_days_mask(weekday_mask: int, first_weekday: int) -> int:
+    """
+    Bitmask of the days 1-31 of a month starting on ``first_weekday`` which fall
+    on one of the weekdays in the mask.
+    """
+    # Bits 1-7 of the weekday mask map to Monday-Sunday. Rotate the mask so that
+    # bit 1 lines up with the weekday of the first of the month, then repeat
+    # the week across the month.
+    week = 0
+    for day in range(1, 8):
+        if weekday_mask >> ((first_weekday + day - 1) % 7 + 1) & 1:
+            week |= 1 << day
+    return week | week << 7 | week << 14 | week << 21 | week << 28
+
+
+@functools.lru_cache(maxsize=4096)
+def year_days_mask(
+    year: int, month_mask: int, monthday_mask: int, weekday_mask: int
+) -> int:
+    """
+    Bitmask of the days of the year which satisfy the month, monthday and weekday
+    masks, where bit 1 is the 1st of January. See ``month_starts``.
+
+    Shared by every schedule with the same masks, so finding valid dates within a
+    year is a bit scan rather than a walk of the calendar.
+    """
+    starts = month_starts(year)
+    first_weekdays = _first_weekdays(year)
+
+    mask = 0
+    for month in mask_values(month_mask):
+        days = monthday_mask & range_mask(1, starts[month + 1] - starts[month])
+        days &= _weekday_days_mask(weekday_mask, first_weekdays[month])
+        mask |= days << starts[month]
+    return mask
+
+
+def _year_days_count(
+    year: int, month_mask: int, monthday_mask: int, weekday_mask: int
+) -> int:
+    """
+    Number of days in the year which satisfy the month, monthday and weekday masks.
+    """
+    return _popcount(year_days_mask(year, month_mask, monthday_mask, weekday_mask))
+
+
+@functools.lru_cache(maxsize=256)
+def _cycle_days_count(month_mask: int, monthday_mask: int, weekday_mask: int) -> int:
+    """
+    Number of valid days in a 400 year Gregorian cycle, after which both leap
+    years and weekdays repeat exactly.
+    """
+    # Bypass the year cache as these years are unlikely to be looked up again.
+    return sum(
+        _popcount(
+            year_days_mask.__wrapped__(year, month_mask, monthday_mask, weekday_mask)
+        )
+        for year in range(2000, 2000 + GREGORIAN_CYCLE_YEARS)
+    )
+
+
+def _day_of_year_date(year: int, day_of_year: int) -> tuple[int, int, int]:
+    """
+    Converts a bit position of a year mask back into (year, month, day).
+    """
+    starts = month_starts(year)
+    month = bisect.bisect_left(starts, day_of_year, 1) - 1
+    return year, month, day_of_year - starts[month]
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_satisfiable(month_mask: int, monthday_mask: int) -> bool:
+    """
+    Whether any of the months contains any of the days of month. February is
+    treated as having 29 days as it does in leap years.
+    """
+    return any(
+        monthday_mask & range_mask(1, MAX_DAYS_IN_MONTH[month])
+        for month in mask_values(month_mask)
+    )
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def range_mask(start: int, end: int, step: int = 1) -> int:
+    """
+    Bitmask with every ``step`` bit set from ``start`` to ``end`` (inclusive).
+    """
+    if step == 1:
+        return (1 << (end + 1)) - (1 << start)
+
+    mask = 0
+    for value in range(start, end + 1, step):
+        mask |= 1 << value
+    return mask
+
+
+def _next_bit(mask: int, value: int) -> int | None:
+    """
+    Returns the position of the lowest set bit in ``mask`` which is >= ``value``.
+    """
+    value = max(value, 0)
+    remaining = mask >> value
+    if not remaining:
+        return None
+    return value + (remaining & -remaining).bit_length() - 1
+
+
+def _prev_bit(mask: int, value: int) -> int | None:
+    """
+    Returns the position of the highest set bit in ``mask`` which is <= ``value``.
+    """
+    if value < 0:
+        return None
+    remaining = mask & ((1 << (value + 1)) - 1)
+    if not remaining:
+        return None
+    return remaining.bit_length() - 1
+
+
+@functools.lru_cache(maxsize=1024)
+def mask_values(mask: int) -> tuple[int, ...]:
+    """
+    Expands a bitmask into its set bit positions in ascending order.
+
+    Cached as the same few masks (*, 0, */15...) are shared by most schedules.
+    """
+    values = []
+    while mask:
+        lowest = mask & -mask
+        values.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return tuple(values)
+
+
+def _civil_from_days(days: int) -> tuple[int, int, int]:
+    """
+    Converts days since the epoch (1970-01-01) into (year, month, day).
+
+    Pure arithmetic, see http://howardhinnant.github.io/date_algorithms.html
+    """
+    days += 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 if shifted_month < 10 else shifted_month - 9
+    return year_of_era + era * 400 + (month <= 2), month, day
+
+
+def local_fields(ts: dt.datetime, tz: dt.tzinfo) -> tuple[int, int, int, int, int]:
+    """
+    Returns the (minute, hour, monthday, month, weekday) of ``ts`` in ``tz``.
+
+    ``ts`` must be timezone aware, naive datetimes raise ValueError rather than being
+    read in the system's local timezone.
+
+    Fields are resolved arithmetically from the timestamp to avoid allocating a
+    converted datetime, using the cached offsets of ``tz`` for the year. Only
+    timestamps in the first or last year datetime supports fall back to astimezone.
+    """
+    if ts.utcoffset() is None:
+        raise ValueError(f"Timestamp must be timezone aware, got naive {ts}")
+
+    seconds = ts.timestamp()
+    fixed_offset = tz.utcoffset(None)
+    if fixed_offset is not None:
+        offset = fixed_offset.total_seconds()
+    else:
+        year, _, _ = _civil_from_days(int(seconds // 86400))
+        if not dt.MINYEAR < year < dt.MAXYEAR:
+            local = ts.astimezone(tz)
+            return local.minute, local.hour, local.day, local.month, local.isoweekday()
+        starts, offsets = offset_changes(tz, year)
+        offset = offsets[bisect.bisect_right(starts, seconds) - 1]
+
+    minutes = int((seconds + offset) // 60)
+    days, minute_of_day = divmod(minutes, MINUTES_PER_DAY)
+    hour, minute = divmod(minute_of_day, 60)
+    _, month, day = _civil_from_days(days)
+    # Epoch (1970-01-01) was a Thursday, weekdays are 1-based from Monday.
+    weekday = (days + 3) % 7 + 1
+    return minute, hour, day, month, weekday
+
+
+def match_many(crontabs: Iterable[Crontab], ts: dt.datetime) -> list[bool]:
+    """
+    Returns whether each crontab fires at the minute of ``ts``.
+
+    The fields of ``ts`` are only resolved once for each distinct timezone.
+    """
+    fields_by_tz: dict[dt.tzinfo, tuple[int, int, int, int, int]] = {}
+    result = []
+    for crontab in crontabs:
+        try:
+            fields = fields_by_tz[crontab.tz]
+        except KeyError:
+            fields = fields_by_tz[crontab.tz] = local_fields(ts, crontab.tz)
+        result.append(crontab._matches_fields(fields))
+    return result
+
+
 @dataclasses.dataclass(frozen=True)
 class CronPart:
     """
     Definition of a Crontab part.
+
+    Parsed values are stored as an integer bitmask where bit ``n`` is set when
+    value ``n`` is part of the expression. E.G. minutes ``0,15`` = ``0b1000000000000001``.
     """
 
+    __slots__ = ("mask",)
+
     # Friendly name for Part.
     name: ClassVar[str]
 
@@ -36,8 +296,8 @@ class CronPart:
     # A cron part can have word aliases which convert to integers. E.G Months
     aliases: ClassVar[dict[str, int]]
 
-    # Parsed value of the cron expression.
-    values: list[int]
+    # Parsed value of the cron expression as a bitmask.
+    mask: int
 
     @classmethod
     def __init_subclass__(
@@ -53,12 +313,87 @@ class CronPart:
         cls.max_value = max_value
         cls.aliases = aliases or {}
 
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int) or value < 0:
+            return False
+        return bool(self.mask >> value & 1)
+
     def __iter__(self) -> Iterator[int]:
-        return iter(self.values)
+        return iter(mask_values(self.mask))
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(mask_values(self.mask))
+
+    def __len__(self) -> int:
+        return len(mask_values(self.mask))
 
     def __str__(self) -> str:
         return str(self.values)
 
+    def __reduce__(self) -> tuple[type[CronPart], tuple[int]]:
+        # Frozen dataclasses with __slots__ can not be unpickled via the default
+        # protocol as it relies on setattr.
+        return (self.__class__, (self.mask,))
+
+    @property
+    def values(self) -> list[int]:
+        """
+        Parsed values of the cron expression in ascending order.
+        """
+        return list(mask_values(self.mask))
+
+    def to_expr(self) -> str:
+        """
+        Returns the shortest of the supported forms of cron expression for the values,
+        E.G. ``*/15``, ``5-59/15`` or ``1-3,7``.
+        """
+        values = mask_values(self.mask)
+        if self.mask == range_mask(self.min_value, self.max_value):
+            return "*"
+
+        first, last = values[0], values[-1]
+        step = values[1] - first if len(values) > 2 else 0
+        if step > 1 and self.mask == range_mask(first, last, step):
+            if first == self.min_value and last + step > self.max_value:
+                return f"*/{step}"
+            return f"{first}-{last}/{step}"
+
+        # Runs of three or more consecutive values are written as a range.
+        parts = []
+        run_start = first
+        for value, following in zip(values, (*values[1:], None)):
+            if following == value + 1:
+                continue
+            if value - run_start >= 2:
+                parts.append(f"{run_start}-{value}")
+            else:
+                parts.extend(str(x) for x in range(run_start, value + 1))
+            if following is not None:
+                run_start = following
+        return ",".join(parts)
+
+    def next_value(self, value: int) -> int | None:
+        """
+        Returns the lowest value which is >= ``value``, None if there is no such value.
+        """
+        return _next_bit(self.mask, value)
+
+    def prev_value(self, value: int) -> int | None:
+        """
+        Returns the highest value which is <= ``value``, None if there is no such value.
+        """
+        return _prev_bit(self.mask, value)
+
+    @classmethod
+    def from_values(cls, values: Iterable[int]):  # type: ignore
+        """
+        Builds the part from already expanded values, E.G. [0, 15, 30, 45].
+        """
+        mask = 0
+        for value in values:
+            mask |= 1 << cls._try_parse_int(value)
+        return cls(mask=mask)
+
     @classmethod
     def from_expr(cls, expr: str):  # type: ignore
         """
@@ -69,29 +404,26 @@ class CronPart:
         -   range of values
         /   step values
         """
-        values = cls._parse(expr=expr)
-        return cls(values=values)
+        mask = cls._parse(expr=expr)
+        return cls(mask=mask)
 
     @classmethod
-    def _parse(cls, *, expr: str, step: int = 1) -> list[int]:
+    def _parse(cls, *, expr: str, step: int = 1) -> int:
         # Expressions can be delimited by commas.
         if "," in expr:
             # "parse" needs to be recursed to capture all possible values.
-            values = {
-                x
-                for sub_expr in expr.split(",", maxsplit=2)
-                for x in cls._parse(expr=sub_expr, step=step)
-            }
-            return list(values)
+            mask = 0
+            for sub_expr in expr.split(",", maxsplit=2):
+                mask |= cls._parse(expr=sub_expr, step=step)
+            return mask
 
         # Wildcard, need to return all possible values
         elif expr == "*":
-            # +1 as range arg are 0-based and we need result to be 1-based.
-            return list(range(cls.min_value, cls.max_value + 1, step))
+            return range_mask(cls.min_value, cls.max_value, step)
 
         # Single numeric value
         elif expr.isnumeric():
-            return [cls._try_parse_int(expr)]
+            return 1 << cls._try_parse_int(expr)
 
         # Step values
         # The rhs of an expression containing a / is the "step" value,
@@ -123,17 +455,10 @@ class CronPart:
                 raise ValueError(
                     f"{cls.name} range start value must not be > than end value"
                 )
-            return list(
-                # +1 as range arg are 0-based and we need result to be 1-based.
-                range(
-                    start,
-                    end + 1,
-                    step,
-                )
-            )
+            return range_mask(start, end, step)
         # Parse any remaining values. Will catch aliases here.
         else:
-            return [cls._try_parse_int(expr)]
+            return 1 << cls._try_parse_int(expr)
 
     @classmethod
     def _try_parse_int(cls, value: str | int) -> int:
@@ -167,6 +492,8 @@ class CronPartMinute(CronPart, name="Minute", min_value=0, max_value=59):
     Crontab expression minute part.
     """
 
+    __slots__ = ()
+
 
 @dataclasses.dataclass(frozen=True)
 class CronPartHour(CronPart, name="Hour", min_value=0, max_value=23):
@@ -174,6 +501,8 @@ class CronPartHour(CronPart, name="Hour", min_value=0, max_value=23):
     Crontab expression hour part.
     """
 
+    __slots__ = ()
+
 
 @dataclasses.dataclass(frozen=True)
 class CronPartMonthday(CronPart, name="Monthday", min_value=1, max_value=31):
@@ -181,6 +510,8 @@ class CronPartMonthday(CronPart, name="Monthday", min_value=1, max_value=31):
     Crontab expression day part.
     """
 
+    __slots__ = ()
+
 
 @dataclasses.dataclass(frozen=True)
 class CronPartMonth(
@@ -207,6 +538,8 @@ class CronPartMonth(
     Crontab expression month part.
     """
 
+    __slots__ = ()
+
 
 @dataclasses.dataclass(frozen=True)
 class CronPartWeekday(
@@ -231,6 +564,84 @@ class CronPartWeekday(
     Crontab expression weekday part.
     """
 
+    __slots__ = ()
+
+
+# Part of each field of a Crontab, in expression order.
+FIELD_PARTS: tuple[type[CronPart], ...] = (
+    CronPartMinute,
+    CronPartHour,
+    CronPartMonthday,
+    CronPartMonth,
+    CronPartWeekday,
+)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ScheduleCache:
+    """
+    Bounded LRU cache of parsed schedules, to be passed to ``Crontab.from_parse``.
+
+    Parsed parts are immutable so a single cached Crontab is shared by every caller
+    which parses the same schedule, only the command is swapped in.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError(f"{self.__class__.__qualname__} maxsize must be >= 1")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Crontab] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Crontab | None:
+        with self._lock:
+            try:
+                crontab = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return crontab
+
+    def put(self, key: Hashable, crontab: Crontab) -> None:
+        with self._lock:
+            self._entries[key] = crontab
+            self._entries.move_to_end(key)
+            # Evict the least recently used entries once over the size bound.
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the hit/miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+        )
+
 
 @dataclasses.dataclass(frozen=True)
 class Crontab:
@@ -263,6 +674,22 @@ class Crontab:
             ]
         )
 
+    def to_expr(self) -> str:
+        """
+        Returns an equivalent cron expression including the command, which parses
+        back to the same schedule.
+        """
+        fields = [
+            self.minute.to_expr(),
+            self.hour.to_expr(),
+            self.monthday.to_expr(),
+            self.month.to_expr(),
+            self.weekday.to_expr(),
+        ]
+        if self.command:
+            fields.append(self.command)
+        return " ".join(fields)
+
     @classmethod
     def from_parse(
         cls,
@@ -270,23 +697,47 @@ class Crontab:
         expr: str,
         tz: dt.tzinfo,
         now: dt.datetime | None = None,
+        cache: ScheduleCache | None = None,
     ) -> Crontab:
         """
         Parses Crontab expression which also includes the command to run.
+
+        If a ``cache`` is provided the parsed schedule is looked up by the normalised
+        expression and tz first, only the command differs between cache hits.
         """
+        stats = current_stats()
+        if stats is None:
+            return cls._parse_expr(expr=expr, tz=tz, now=now, cache=cache)
+
+        started = time.perf_counter()
+        try:
+            return cls._parse_expr(expr=expr, tz=tz, now=now, cache=cache)
+        finally:
+            stats.parses += 1
+            stats.parse_seconds += time.perf_counter() - started
+
+    @classmethod
+    def _parse_expr(
+        cls,
+        *,
+        expr: str,
+        tz: dt.tzinfo,
+        now: dt.datetime | None,
+        cache: ScheduleCache | None,
+    ) -> Crontab:
         # Resolve macros (@weekly, @daily etc) to equivalent cron expressions.
         # Split the expression to see if it contains a macro in the first indices.
         # This would be the case if a macro and command was passsed in like "@annually /usr/bin/find"
-        x = expr.split()
-        try:
-            macro_val = CRON_MACROS[x[0]]
-            value = f"{macro_val} {x[1]}"
-        except KeyError:
+        x = expr.split(maxsplit=1)
+        if x and x[0] in CRON_MACROS:
+            value = " ".join([CRON_MACROS[x[0]], *x[1:]])
+        else:
             value = expr
 
         # 5 for cron schedule + 1 for cron command = 6
+        # The command may itself contain whitespace so is everything after the schedule.
         fields_len_constraint = 6
-        fields = value.split()
+        fields = value.split(maxsplit=fields_len_constraint - 1)
         fields_len = len(fields)
         if fields_len != fields_len_constraint:
             raise ValueError(
@@ -294,32 +745,267 @@ class Crontab:
                 f"Received: {fields_len}"
             )
 
-        fields_iter = iter(fields)
         now = (now or dt.datetime.now(tz=tz)).astimezone(tz)
+        tz = now.tzinfo or tz
+        command = fields.pop().rstrip()
+
+        if cache is None:
+            return cls._from_fields(fields, tz=tz, command=command)
+
+        # Aliases are case insensitive so normalise them for the cache key.
+        key = (cls, tuple(field.upper() for field in fields), tz)
+        crontab = cache.get(key)
+        if crontab is None:
+            crontab = cls._from_fields(fields, tz=tz, command=command)
+            cache.put(key, crontab)
+        elif crontab.command != command:
+            crontab = dataclasses.replace(crontab, command=command)
+        return crontab
 
-        return cls(
+    @classmethod
+    def _from_fields(cls, fields: list[str], *, tz: dt.tzinfo, command: str) -> Crontab:
+        fields_iter = iter(fields)
+        crontab = cls(
             minute=CronPartMinute.from_expr(next(fields_iter)),
             hour=CronPartHour.from_expr(next(fields_iter)),
             monthday=CronPartMonthday.from_expr(next(fields_iter)),
             month=CronPartMonth.from_expr(next(fields_iter)),
             weekday=CronPartWeekday.from_expr(next(fields_iter)),
-            command=str(next(fields_iter)),
-            tz=now.tzinfo or tz,
+            command=command,
+            tz=tz,
+        )
+
+        # Reject schedules such as "0 0 31 2 *" up front, as there is no point
+        # searching for a run which can never occur.
+        if not crontab.is_satisfiable:
+            raise ValueError(
+                f"{cls.__qualname__} expression can never run, "
+                f"no month contains the day(s) of month {crontab.monthday}"
+            )
+        return crontab
+
+    @property
+    def masks(self) -> tuple[int, int, int, int, int]:
+        """
+        Bitmasks of the minute, hour, monthday, month and weekday fields, in the
+        order of ``FIELD_PARTS`` and of the fields returned by ``local_fields``.
+        """
+        return (
+            self.minute.mask,
+            self.hour.mask,
+            self.monthday.mask,
+            self.month.mask,
+            self.weekday.mask,
         )
 
+    @property
+    def is_satisfiable(self) -> bool:
+        """
+        Whether the schedule can ever run, E.G. "0 0 30 2 *" can not.
+        """
+        return _is_satisfiable(self.month.mask, self.monthday.mask)
+
+    def next_possible_year(self, year: int | None = None) -> int | None:
+        """
+        Returns the first year at or after ``year`` (defaults to this year) in which
+        the schedule runs. Useful for rare schedules such as those only valid on a
+        leap day, E.G. "0 0 29 2 MON" only runs every 28 years or so.
+        """
+        year = year if year is not None else dt.datetime.now(tz=self.tz).year
+        match = self._next_date(year, 1, 1)
+        return match[0] if match else None
+
     @property
     def next_scheduled_run(self) -> dt.datetime:
-        return next(self.iter())
+        return self.next_run()
+
+    @property
+    def previous_scheduled_run(self) -> dt.datetime:
+        return self.previous_run()
+
+    def next_run(self, start: dt.datetime | None = None) -> dt.datetime:
+        """
+        Returns the first schedule at or after ``start`` (defaults to now).
+
+        Unlike ``iter`` this jumps straight to the next valid month, day, hour and
+        minute so the cost does not depend on how sparse the expression is.
+        """
+        anchor = start.astimezone(self.tz) if start else dt.datetime.now(tz=self.tz)
+        match = self._next_datetime(
+            anchor.year, anchor.month, anchor.day, anchor.hour, anchor.minute
+        )
+        if match is None:
+            raise StopIteration(f"{self.__class__.__qualname__} has no future schedule")
+
+        year, month, day, hour, minute = match
+        return dt.datetime(
+            year=year, month=month, day=day, hour=hour, minute=minute, tzinfo=self.tz
+        )
+
+    def next_run_in_zones(
+        self, zones: Iterable[dt.tzinfo], start: dt.datetime | None = None
+    ) -> dict[dt.tzinfo, dt.datetime]:
+        """
+        Returns the first schedule at or after ``start`` (defaults to now) with the
+        expression evaluated in each of the given timezones.
+
+        The schedule is only parsed once and zones whose wall clock time is the same
+        at ``start`` (E.G. the same UTC offset) share a single solve.
+        """
+        start = start or dt.datetime.now(tz=UTC)
+        solved: dict[tuple[int, int, int, int, int], tuple[int, int, int, int, int]] = (
+            {}
+        )
+
+        result = {}
+        for zone in zones:
+            anchor = start.astimezone(zone)
+            fields = (anchor.year, anchor.month, anchor.day, anchor.hour, anchor.minute)
+            try:
+                match = solved[fields]
+            except KeyError:
+                next_match = self._next_datetime(*fields)
+                if next_match is None:
+                    raise StopIteration(
+                        f"{self.__class__.__qualname__} has no future schedule"
+                    )
+                match = solved[fields] = next_match
+
+            year, month, day, hour, minute = match
+            result[zone] = dt.datetime(
+                year=year, month=month, day=day, hour=hour, minute=minute, tzinfo=zone
+            )
+        return result
+
+    def previous_run(self, start: dt.datetime | None = None) -> dt.datetime:
+        """
+        Returns the last schedule at or before ``start`` (defaults to now).
+        """
+        anchor = start.astimezone(self.tz) if start else dt.datetime.now(tz=self.tz)
+        match = self._prev_datetime(
+            anchor.year, anchor.month, anchor.day, anchor.hour, anchor.minute
+        )
+        if match is None:
+            raise StopIteration(f"{self.__class__.__qualname__} has no past schedule")
+
+        year, month, day, hour, minute = match
+        return dt.datetime(
+            year=year, month=month, day=day, hour=hour, minute=minute, tzinfo=self.tz
+        )
+
+    def count_between(self, start: dt.datetime, end: dt.datetime) -> int:
+        """
+        Returns the number of schedules from ``start`` (inclusive) to ``end`` (exclusive).
+
+        Equivalent to counting ``iter(start)`` up to ``end`` but computed from the
+        number of valid days and the firings per day, so the cost does not grow with
+        the length of the window.
+        """
+        first = start.astimezone(self.tz).replace(tzinfo=None, second=0, microsecond=0)
+        last = end.astimezone(self.tz).replace(tzinfo=None)
+        # Any minute which starts before end is included.
+        if last.second or last.microsecond:
+            last = last.replace(second=0, microsecond=0) + MINUTE
+        if last <= first:
+            return 0
+
+        # Count every firing of each day in the window, then remove those on the
+        # first day before the start and on the last day at or after the end.
+        per_day = len(self.hour) * len(self.minute)
+        total = self._count_days(first.date(), last.date()) * per_day
+        if self._is_valid_date(first.year, first.month, first.day):
+            total -= self._count_day_before(first.hour, first.minute)
+        if self._is_valid_date(last.year, last.month, last.day):
+            total -= per_day - self._count_day_before(last.hour, last.minute)
+        return total
 
-    def iter(self, start: dt.datetime | None = None) -> Iterator[dt.datetime]:
+    def matches(self, ts: dt.datetime) -> bool:
         """
-        Yields future schedules for this crontab expression.
+        Returns whether the crontab fires at the minute of ``ts``, in the crontab's tz.
+        Raises ValueError if ``ts`` is naive.
         """
+        return self._matches_fields(local_fields(ts, self.tz))
+
+    def matches_many(self, timestamps: Iterable[dt.datetime]) -> list[bool]:
+        """
+        Returns whether the crontab fires at the minute of each timestamp.
+        """
+        return [self._matches_fields(local_fields(ts, self.tz)) for ts in timestamps]
+
+    def _matches_fields(self, fields: tuple[int, int, int, int, int]) -> bool:
+        minute, hour, day, month, weekday = fields
+        return (
+            self.minute.mask >> minute & 1
+            and self.hour.mask >> hour & 1
+            and self.monthday.mask >> day & 1
+            and self.month.mask >> month & 1
+            and self.weekday.mask >> weekday & 1
+        ) == 1
+
+    def iter(
+        self,
+        start: dt.datetime | None = None,
+        end: dt.datetime | None = None,
+        *,
+        limit: int | None = None,
+        dst_aware: bool = False,
+    ) -> Iterator[dt.datetime]:
+        """
+        Yields future schedules for this crontab expression, from ``start`` (defaults
+        to now) until before ``end`` and at most ``limit`` of them when given.
+
+        By default schedules are yielded as wall clock times in the crontab's tz,
+        which may not exist or be ambiguous across DST transitions. Set ``dst_aware``
+        to follow cron's DST policy instead, see ``croninfo.tz``.
+        """
+        anchor = start.astimezone(self.tz) if start else dt.datetime.now(tz=self.tz)
+        runs: Iterator[dt.datetime]
+        if dst_aware:
+            runs = self._iter_dst(anchor)
+            if end is not None:
+                runs = itertools.takewhile(end.__gt__, runs)
+        else:
+            runs = self._iter_wall(anchor, tzinfo=self.tz)
+            if end is not None:
+                # Wall clock times are not ordered in UTC across DST transitions.
+                end_wall = end.astimezone(self.tz).replace(tzinfo=None)
+                runs = itertools.takewhile(
+                    lambda x: x.replace(tzinfo=None) < end_wall, runs
+                )
+        if limit is not None:
+            runs = itertools.islice(runs, limit)
+        return runs
+
+    def nth_run(
+        self, n: int, start: dt.datetime | None = None, *, dst_aware: bool = False
+    ) -> dt.datetime:
+        """
+        Returns the ``n``th (from 0) schedule at or after ``start`` (defaults to now),
+        the same as the ``n``th item yielded by ``iter``.
+
+        Whole years, months and days are skipped using the number of firings per day,
+        so the cost barely grows with ``n``. Together with ``iter`` this pages through
+        schedules, E.G. ``iter(nth_run(page * size, start), limit=size)``.
+        """
+        if n < 0:
+            raise ValueError("n must not be negative")
+
         anchor = start.astimezone(self.tz) if start else dt.datetime.now(tz=self.tz)
+        match = self._nth_dst(n, anchor) if dst_aware else self._nth_wall(n, anchor)
+        if match is None:
+            raise StopIteration(f"{self.__class__.__qualname__} has no future schedule")
+        return match
+
+    def _iter_wall(
+        self, anchor: dt.datetime, *, tzinfo: dt.tzinfo | None
+    ) -> Iterator[dt.datetime]:
         anchor_date = anchor.date()
+        stats = current_stats()
 
         for day_date in self._generate_future_dates(anchor_date):
             is_start_day = day_date == anchor_date
+            if stats is not None:
+                stats.days_scanned += 1
 
             for valid_hour in self.hour:
                 is_start_hour = is_start_day and valid_hour == anchor.hour
@@ -327,12 +1013,139 @@ class Crontab:
                 # If today is the date the job should start but the hour has
                 # passed we need to skip
                 if is_start_day and valid_hour < anchor.hour:
+                    if stats is not None:
+                        stats.rejected_hours += 1
                     continue
 
                 for valid_minute in self.minute:
                     # If today is the date the job and the hour it should start
                     # but the minute has passed we need to skip.
                     if is_start_hour and valid_minute < anchor.minute:
+                        if stats is not None:
+                            stats.rejected_minutes += 1
+                        continue
+
+                    yield dt.datetime(
+                        year=day_date.year,
+                        month=day_date.month,
+                        day=day_date.day,
+                        hour=valid_hour,
+                        minute=valid_minute,
+                        tzinfo=tzinfo,
+                    )
+
+    def _iter_dst(self, anchor: dt.datetime) -> Iterator[dt.datetime]:
+        anchor_utc = anchor.astimezone(UTC).replace(
+            tzinfo=None, second=0, microsecond=0
+        )
+
+        # Schedules skipped by clocks springing forward just before the anchor are
+        # moved to after it, so start from the wall clock time in the prior offset.
+        prior_offset = (anchor - dt.timedelta(days=1)).utcoffset() or dt.timedelta()
+        wall_start = min(anchor.replace(tzinfo=None), anchor_utc + prior_offset)
+
+        last = None
+        for wall in self._iter_wall(wall_start, tzinfo=None):
+            utc, local = localize(self.tz, wall)
+            # Skip repeated wall times which have already passed and schedules
+            # which have been merged at the end of a skipped interval.
+            if utc < anchor_utc or (last is not None and utc <= last):
+                continue
+            last = utc
+            yield local
+
+    def _nth_wall(self, n: int, anchor: dt.datetime) -> dt.datetime | None:
+        match = self._nth_datetime(
+            n, anchor.year, anchor.month, anchor.day, anchor.hour, anchor.minute
+        )
+        if match is None:
+            return None
+
+        year, month, day, hour, minute = match
+        return dt.datetime(
+            year=year, month=month, day=day, hour=hour, minute=minute, tzinfo=self.tz
+        )
+
+    def _nth_dst(self, n: int, anchor: dt.datetime) -> dt.datetime | None:
+        """
+        Returns the ``n``th schedule of ``_iter_dst``.
+
+        Away from DST transitions every wall clock time runs exactly once, so
+        schedules up to each transition are counted and skipped as wall clock times,
+        and only those around it are stepped through.
+        """
+        position = anchor.astimezone(UTC).replace(tzinfo=None)
+        while True:
+            window = self._next_transition_window(position)
+            if window is None:
+                start = position.replace(tzinfo=UTC)
+                return self._nth_wall(n, start.astimezone(self.tz))
+
+            window_start, window_end = window
+            if position < window_start:
+                start = position.replace(tzinfo=UTC)
+                count = self.count_between(start, window_start.replace(tzinfo=UTC))
+                if n < count:
+                    return self._nth_wall(n, start.astimezone(self.tz))
+                n -= count
+                position = window_start
+
+            start = position.replace(tzinfo=UTC)
+            for run in self._iter_dst(start.astimezone(self.tz)):
+                if run >= window_end.replace(tzinfo=UTC):
+                    break
+                if n == 0:
+                    return run
+                n -= 1
+            position = window_end
+
+    def _next_transition_window(
+        self, position: dt.datetime
+    ) -> tuple[dt.datetime, dt.datetime] | None:
+        """
+        Returns the first window, as naive UTC datetimes, around a DST transition of
+        the crontab's tz which ends after ``position``.
+
+        Windows span the wall clock times skipped or repeated by the transition, with
+        a minute either side so both ends have a single unambiguous wall clock time.
+        """
+        for year in range(position.year, MAX_YEAR):
+            for transition in transition_table(self.tz, year).transitions:
+                shift = abs(transition.after - transition.before)
+                window_end = transition.at + shift + MINUTE
+                if window_end > position:
+                    return transition.at - MINUTE, window_end
+        return None
+
+    def iter_previous(self, start: dt.datetime | None = None) -> Iterator[dt.datetime]:
+        """
+        Yields past schedules for this crontab expression, most recent first.
+        """
+        anchor = start.astimezone(self.tz) if start else dt.datetime.now(tz=self.tz)
+        anchor_date = anchor.date()
+        stats = current_stats()
+
+        for day_date in self._generate_past_dates(anchor_date):
+            is_start_day = day_date == anchor_date
+            if stats is not None:
+                stats.days_scanned += 1
+
+            for valid_hour in reversed(self.hour):
+                is_start_hour = is_start_day and valid_hour == anchor.hour
+
+                # If today is the date the job should start but the hour is
+                # still to come we need to skip
+                if is_start_day and valid_hour > anchor.hour:
+                    if stats is not None:
+                        stats.rejected_hours += 1
+                    continue
+
+                for valid_minute in reversed(self.minute):
+                    # If today is the date the job and the hour it should start
+                    # but the minute is still to come we need to skip.
+                    if is_start_hour and valid_minute > anchor.minute:
+                        if stats is not None:
+                            stats.rejected_minutes += 1
                         continue
 
                     yield dt.datetime(
@@ -344,46 +1157,307 @@ class Crontab:
                         tzinfo=self.tz,
                     )
 
+    def _count_days(self, start: dt.date, end: dt.date) -> int:
+        """
+        Returns the number of valid dates from ``start`` to ``end`` (both inclusive).
+        """
+        masks = (self.month.mask, self.monthday.mask, self.weekday.mask)
+
+        total = 0
+        year = start.year
+        cycles, _ = divmod(end.year - year, GREGORIAN_CYCLE_YEARS)
+        if cycles:
+            total += cycles * _cycle_days_count(*masks)
+            year += cycles * GREGORIAN_CYCLE_YEARS
+        for y in range(year, end.year):
+            total += _year_days_count(y, *masks)
+
+        total -= self._count_year_before(start.year, start.month, start.day)
+        total += self._count_year_before(end.year, end.month, end.day)
+        total += self._is_valid_date(end.year, end.month, end.day)
+        return total
+
+    def _count_year_before(self, year: int, month: int, day: int) -> int:
+        """
+        Returns the number of valid dates in the year before the one given.
+        """
+        position = month_starts(year)[month] + day
+        return _popcount(self._days_mask(year) & ((1 << position) - 1))
+
+    def _count_day_before(self, hour: int, minute: int) -> int:
+        """
+        Returns the number of firings in a valid day before the hour and minute given.
+        """
+        total = len(self.minute) * _popcount(self.hour.mask & ((1 << hour) - 1))
+        if hour in self.hour:
+            total += _popcount(self.minute.mask & ((1 << minute) - 1))
+        return total
+
+    def _nth_datetime(
+        self, n: int, year: int, month: int, day: int, hour: int, minute: int
+    ) -> tuple[int, int, int, int, int] | None:
+        """
+        Returns the ``n``th (from 0) valid (year, month, day, hour, minute) at or after
+        the one given.
+        """
+        if not self.is_satisfiable:
+            return None
+
+        # Runs on the first day are counted from its first firing, then the rest are
+        # spread over the following valid days.
+        per_day = len(self.hour) * len(self.minute)
+        if self._is_valid_date(year, month, day):
+            n += self._count_day_before(hour, minute)
+            if n < per_day:
+                return (year, month, day, *self._nth_day_run(n))
+            n -= per_day
+
+        days, n = divmod(n, per_day)
+        match = self._nth_date_after(year, month, day, days)
+        if match is None:
+            return None
+        return (*match, *self._nth_day_run(n))
+
+    def _nth_date_after(
+        self, year: int, month: int, day: int, n: int
+    ) -> tuple[int, int, int] | None:
+        """
+        Returns the ``n``th (from 0) valid (year, month, day) after the one given,
+        skipping whole years and months by the number of valid days within them.
+        """
+        position = month_starts(year)[month] + day + 1
+        while year < MAX_YEAR:
+            days_mask = self._days_mask(year) >> position << position
+            count = _popcount(days_mask)
+            if n >= count:
+                n -= count
+                year, position = year + 1, 0
+                continue
+
+            starts = month_starts(year)
+            for month in range(1, 13):
+                month_days = days_mask >> starts[month] & range_mask(
+                    1, starts[month + 1] - starts[month]
+                )
+                count = _popcount(month_days)
+                if n < count:
+                    for _ in range(n):
+                        month_days &= month_days - 1
+                    return year, month, (month_days & -month_days).bit_length() - 1
+                n -= count
+        return None
+
+    def _nth_day_run(self, n: int) -> tuple[int, int]:
+        """
+        Returns the (hour, minute) of the ``n``th (from 0) firing within a valid day.
+        """
+        hour_index, minute_index = divmod(n, len(self.minute))
+        return (
+            mask_values(self.hour.mask)[hour_index],
+            mask_values(self.minute.mask)[minute_index],
+        )
+
+    def _is_valid_date(self, year: int, month: int, day: int) -> bool:
+        return self._days_mask(year) >> (month_starts(year)[month] + day) & 1 == 1
+
+    def _days_mask(self, year: int) -> int:
+        return year_days_mask(
+            year, self.month.mask, self.monthday.mask, self.weekday.mask
+        )
+
     def _generate_future_dates(self, start: dt.date | None = None) -> Iterator[dt.date]:
         """
         Yields future dates for the crontab expression based on the
         month, monthday and weekdays parts.
         """
-        cal = calendar.Calendar()
         anchor = start if start else dt.date.today()
+        if not self.is_satisfiable:
+            return
 
-        # Cap generation at year 2099, this will give us good buffer.
-        while anchor.year < 2099:
-            for valid_month in self.month:
-                # Check if the month is lower the current month.
-                # If so we need to skip because it will be in the past.
-                if valid_month < anchor.month:
-                    continue
+        stats = current_stats()
+        position = anchor.timetuple().tm_yday
+        for year in range(anchor.year, MAX_YEAR):
+            # Bit 1 of the days mask is the 1st of January.
+            ordinal = dt.date(year, 1, 1).toordinal() - 1
+            days_mask = self._days_mask(year) >> position << position
+            while days_mask:
+                lowest = days_mask & -days_mask
+                yield dt.date.fromordinal(ordinal + lowest.bit_length() - 1)
+                days_mask ^= lowest
 
-                for day_no, weekday_no in cal.itermonthdays2(anchor.year, valid_month):
-                    # itermonthdays yields all days required to get a full week,
-                    # but those outside the current month are 0 so we should ignore
-                    # those.
-                    if day_no == 0:
-                        continue
+            position = 0
+            if stats is not None:
+                stats.years_rolled += 1
 
-                    # It is the same month, but the day is in the past so we should skip.
-                    if valid_month == anchor.month and day_no < anchor.day:
-                        continue
+    def _generate_past_dates(self, start: dt.date | None = None) -> Iterator[dt.date]:
+        """
+        Yields past dates for the crontab expression based on the
+        month, monthday and weekdays parts, most recent first.
+        """
+        anchor = start if start else dt.date.today()
+        if not self.is_satisfiable:
+            return
 
-                    # Check if this weekday is valid.
-                    # In the calendar module, dates are 0-based. Monday == 0 and Sunday == 6.
-                    # Our approach is 1-based so we need to add 1 to the value to lookup correctly
-                    if weekday_no + 1 not in self.weekday:
-                        continue
+        stats = current_stats()
+        days_mask = self._days_mask(anchor.year) & (
+            (1 << (anchor.timetuple().tm_yday + 1)) - 1
+        )
+        for year in range(anchor.year, MIN_YEAR - 1, -1):
+            if year != anchor.year:
+                days_mask = self._days_mask(year)
+                if stats is not None:
+                    stats.years_rolled += 1
 
-                    # Check if this monthday is valid.
-                    if day_no not in self.monthday:
-                        continue
+            # Bit 1 of the days mask is the 1st of January.
+            ordinal = dt.date(year, 1, 1).toordinal() - 1
+            while days_mask:
+                highest = days_mask.bit_length() - 1
+                yield dt.date.fromordinal(ordinal + highest)
+                days_mask ^= 1 << highest
+
+    def _next_date(
+        self, year: int, month: int, day: int
+    ) -> tuple[int, int, int] | None:
+        """
+        Returns the first valid (year, month, day) at or after the one given.
+
+        Values are allowed to overflow (E.G. day 32 or month 13) and will be carried
+        into the following month or year.
+        """
+        if not self.is_satisfiable:
+            return None
+
+        stats = current_stats()
+        while year < MAX_YEAR:
+            # Days past the end of the month are the start of the next month in the
+            # year mask, so overflowing days are carried for free.
+            position = month_starts(year)[min(month, 13)] + day
+            valid_position = _next_bit(self._days_mask(year), position)
+            match = (
+                None
+                if valid_position is None
+                else _day_of_year_date(year, valid_position)
+            )
+            if stats is not None:
+                scanned = max((match[1] if match else 12) - month + 1, 0)
+                stats.months_scanned += scanned
+                stats.rejected_months += scanned - (match is not None)
+                stats.rejected_days += valid_position != position
+                stats.years_rolled += match is None
+            if match is not None:
+                return match
+
+            year, month, day = year + 1, 1, 1
+        return None
+
+    def _next_datetime(
+        self, year: int, month: int, day: int, hour: int, minute: int
+    ) -> tuple[int, int, int, int, int] | None:
+        """
+        Returns the first valid (year, month, day, hour, minute) at or after the one
+        given, carrying any field that has no valid value left into the next one.
+        """
+        stats = current_stats()
+        while True:
+            match = self._next_date(year, month, day)
+            if match is None:
+                return None
+
+            # Moving to a later day means we need to start from its first minute.
+            if match != (year, month, day):
+                hour, minute = 0, 0
+            year, month, day = match
+
+            valid_hour = self.hour.next_value(hour)
+            if stats is not None:
+                stats.days_scanned += 1
+                stats.rejected_hours += valid_hour != hour
+            if valid_hour is None:
+                day, hour, minute = day + 1, 0, 0
+                continue
+            if valid_hour != hour:
+                hour, minute = valid_hour, 0
+
+            valid_minute = self.minute.next_value(minute)
+            if stats is not None:
+                stats.rejected_minutes += valid_minute != minute
+            if valid_minute is None:
+                hour, minute = hour + 1, 0
+                continue
+
+            return year, month, day, hour, valid_minute
+
+    def _prev_date(
+        self, year: int, month: int, day: int
+    ) -> tuple[int, int, int] | None:
+        """
+        Returns the last valid (year, month, day) at or before the one given.
+
+        Values are allowed to underflow (E.G. day 0 or month 0) and will be borrowed
+        from the previous month or year.
+        """
+        if not self.is_satisfiable:
+            return None
+
+        stats = current_stats()
+        while year >= MIN_YEAR:
+            match = None
+            position = 0
+            if month >= 1:
+                # Day 0 is the end of the previous month in the year mask, so
+                # underflowing days are borrowed for free. Days past the end of
+                # the month are clamped to its last day.
+                starts = month_starts(year)
+                position = starts[month] + min(day, starts[month + 1] - starts[month])
+                valid_position = _prev_bit(self._days_mask(year), position)
+                if valid_position is not None:
+                    match = _day_of_year_date(year, valid_position)
+                if stats is not None:
+                    scanned = month - (match[1] if match else 1) + 1
+                    stats.months_scanned += scanned
+                    stats.rejected_months += scanned - (match is not None)
+                    stats.rejected_days += valid_position != position
+            if match is not None:
+                return match
+
+            if stats is not None:
+                stats.years_rolled += 1
+            year, month, day = year - 1, 12, 31
+        return None
+
+    def _prev_datetime(
+        self, year: int, month: int, day: int, hour: int, minute: int
+    ) -> tuple[int, int, int, int, int] | None:
+        """
+        Returns the last valid (year, month, day, hour, minute) at or before the one
+        given, borrowing from the previous field when there is no valid value left.
+        """
+        stats = current_stats()
+        while True:
+            match = self._prev_date(year, month, day)
+            if match is None:
+                return None
+
+            # Moving to an earlier day means we need to start from its last minute.
+            if match != (year, month, day):
+                hour, minute = 23, 59
+            year, month, day = match
+
+            valid_hour = self.hour.prev_value(hour)
+            if stats is not None:
+                stats.days_scanned += 1
+                stats.rejected_hours += valid_hour != hour
+            if valid_hour is None:
+                day, hour, minute = day - 1, 23, 59
+                continue
+            if valid_hour != hour:
+                hour, minute = valid_hour, 59
 
-                    # Success! Valid date.
-                    yield dt.date(year=anchor.year, month=valid_month, day=day_no)
+            valid_minute = self.minute.prev_value(minute)
+            if stats is not None:
+                stats.rejected_minutes += valid_minute != minute
+            if valid_minute is None:
+                hour, minute = hour - 1, 59
+                continue
 
-            # After exhausting each month for the current anchor year, we need
-            # to start again from a new year.
-            anchor = dt.date(year=anchor.year + 1, month=1, day=1)
+            return year, month, day, hour, valid_minute
@@ -0,0 +1,183 @@
+"""
+Inverted index over the fields of many Crontabs, to find those which fire at a time.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+import re
+from typing import Iterable, Sequence
+
+from croninfo.crontab import FIELD_PARTS, Crontab, local_fields, mask_values
+
+# Number of schedules with the same field for its slots to be applied as a bitset.
+_SHARED_FIELD_SIZE = 64
+
+_NON_ZERO_RE = re.compile(rb"[^\x00]")
+# Positions of the bits set in each byte value.
+_BYTE_BITS = [
+    tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)
+]
+
+
+class _ZoneIndex:
+    """
+    Index of the schedules in a single timezone.
+
+    Each schedule is given a slot, and for every value of every field there is an
+    integer bitset with the bit of each slot whose field contains the value set.
+    """
+
+    def __init__(self) -> None:
+        self.bitsets = [[0] * (part.max_value + 1) for part in FIELD_PARTS]
+        self.keys: list[int | None] = []
+        # Slots of removed schedules, reused before the bitsets are grown.
+        self.free: list[int] = []
+
+    def extend(self, items: Sequence[tuple[int, Crontab]]) -> list[int]:
+        """
+        Adds schedules by key, returning the slot of each.
+
+        Python integers are immutable so setting a single bit copies the whole bitset.
+        Instead slots are gathered into a buffer for each value, then each bitset is
+        updated once. Fields shared by many schedules, E.G. ``*``, are gathered once
+        and applied to each of their values.
+        """
+        slots_by_mask: list[dict[int, list[int]]] = [{} for _ in FIELD_PARTS]
+        slots = []
+        for key, crontab in items:
+            if self.free:
+                slot = self.free.pop()
+                self.keys[slot] = key
+            else:
+                slot = len(self.keys)
+                self.keys.append(key)
+            slots.append(slot)
+            for by_mask, mask in zip(slots_by_mask, crontab.masks):
+                by_mask.setdefault(mask, []).append(slot)
+
+        size = len(self.keys) // 8 + 1
+        for bitsets, by_mask in zip(self.bitsets, slots_by_mask):
+            buffers: dict[int, bytearray] = {}
+            for mask, mask_slots in by_mask.items():
+                if len(mask_slots) >= _SHARED_FIELD_SIZE:
+                    bits = _to_bitset(mask_slots, bytearray(size))
+                    for value in mask_values(mask):
+                        bitsets[value] |= bits
+                    continue
+
+                for value in mask_values(mask):
+                    buffer = buffers.get(value)
+                    if buffer is None:
+                        buffer = buffers[value] = bytearray(size)
+                    for slot in mask_slots:
+                        buffer[slot >> 3] |= 1 << (slot & 7)
+
+            for value, buffer in buffers.items():
+                bitsets[value] |= int.from_bytes(buffer, "little")
+        return slots
+
+    def remove(self, slot: int, crontab: Crontab) -> None:
+        bit = 1 << slot
+        for bitsets, mask in zip(self.bitsets, crontab.masks):
+            for value in mask_values(mask):
+                bitsets[value] &= ~bit
+        self.keys[slot] = None
+        self.free.append(slot)
+
+    def matching(self, fields: tuple[int, int, int, int, int]) -> list[int]:
+        matched = -1
+        for bitsets, value in zip(self.bitsets, fields):
+            matched &= bitsets[value]
+            if not matched:
+                return []
+
+        # Clearing bits one at a time would copy the bitset for each match, instead
+        # find the non-zero bytes of it and look up the bits set in each.
+        data = matched.to_bytes((matched.bit_length() + 7) // 8, "little")
+        keys = []
+        for match in _NON_ZERO_RE.finditer(data):
+            position = match.start()
+            for bit in _BYTE_BITS[data[position]]:
+                key = self.keys[position * 8 + bit]
+                assert key is not None
+                keys.append(key)
+        return keys
+
+
+class ScheduleIndex:
+    """
+    Collection of many Crontabs which finds those firing at the minute of a timestamp.
+
+    Schedules are indexed by the values of each of their fields, so a lookup is the
+    intersection of five bitsets per timezone. Only the matching schedules are then
+    visited, rather than checking each one.
+    """
+
+    def __init__(self, crontabs: Iterable[Crontab] = ()) -> None:
+        self._crontabs: dict[int, Crontab] = {}
+        self._slots: dict[int, int] = {}
+        self._zones: dict[dt.tzinfo, _ZoneIndex] = {}
+        self._keys = itertools.count()
+
+        self.update(crontabs)
+
+    def __len__(self) -> int:
+        return len(self._crontabs)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._crontabs
+
+    def __getitem__(self, key: int) -> Crontab:
+        return self._crontabs[key]
+
+    def add(self, crontab: Crontab) -> int:
+        """
+        Adds a schedule and returns the key to later remove it by.
+        """
+        (key,) = self.update([crontab])
+        return key
+
+    def update(self, crontabs: Iterable[Crontab]) -> list[int]:
+        """
+        Adds many schedules and returns their keys, faster than adding each in turn.
+        """
+        items_by_tz: dict[dt.tzinfo, list[tuple[int, Crontab]]] = {}
+        keys = []
+        for crontab in crontabs:
+            key = next(self._keys)
+            keys.append(key)
+            self._crontabs[key] = crontab
+            items_by_tz.setdefault(crontab.tz, []).append((key, crontab))
+
+        for tz, items in items_by_tz.items():
+            zone = self._zones.get(tz)
+            if zone is None:
+                zone = self._zones[tz] = _ZoneIndex()
+            slots = zone.extend(items)
+            self._slots.update((key, slot) for (key, _), slot in zip(items, slots))
+        return keys
+
+    def remove(self, key: int) -> None:
+        """
+        Removes a schedule so it no longer matches. Raises KeyError if not present.
+        """
+        crontab = self._crontabs.pop(key)
+        self._zones[crontab.tz].remove(self._slots.pop(key), crontab)
+
+    def matching(self, ts: dt.datetime) -> list[int]:
+        """
+        Returns the keys of the schedules which fire at the minute of ``ts``, see
+        ``Crontab.matches``. Keys are in no particular order.
+        """
+        keys = []
+        for tz, zone in self._zones.items():
+            keys.extend(zone.matching(local_fields(ts, tz)))
+        return keys
+
+
+def _to_bitset(slots: list[int], buffer: bytearray) -> int:
+    for slot in slots:
+        buffer[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(buffer, "little")
@@ -0,0 +1,197 @@
+"""
+Number of schedules firing in each minute of a window, to find thundering herds.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import heapq
+from typing import Iterable, NamedTuple
+
+from croninfo.crontab import MINUTE, MINUTES_PER_DAY, Crontab, year_days_mask
+from croninfo.tz import UTC, localize, transition_table
+
+_DAY = dt.timedelta(days=1)
+
+
+class Peak(NamedTuple):
+    minute: dt.datetime
+    firings: int
+    # Indexes of the crontabs firing in the minute, in the order they were given.
+    schedules: tuple[int, ...]
+
+
+class _Group(NamedTuple):
+    """
+    Crontabs with identical fields and timezone, which always fire together.
+    """
+
+    crontab: Crontab
+    indexes: list[int]
+    # Minutes of the day the group fires in, E.G. 60 for 01:00.
+    offsets: frozenset[int]
+
+
+class LoadHistogram:
+    """
+    Number of crontabs firing in each minute from ``start`` (inclusive) to ``end``
+    (exclusive), following cron's DST policy.
+
+    Firings are not generated per schedule. Schedules with the same fields and
+    timezone are grouped, then each day in the window contributes the combined
+    firings of the groups valid that day. Days with the same groups share the
+    combined firings, so the cost depends on the number of distinct schedules
+    rather than the number of crontabs or their firings.
+    """
+
+    def __init__(
+        self, crontabs: Iterable[Crontab], start: dt.datetime, end: dt.datetime
+    ) -> None:
+        self.start = start.astimezone(UTC).replace(second=0, microsecond=0)
+        # Any minute which starts before end is included.
+        size = -((self.start - end) // MINUTE)
+        self.counts = [0] * max(size, 0)
+
+        self._groups: list[_Group] = []
+        # Days placed arithmetically as (minute index of local midnight, groups).
+        self._placements: list[tuple[int, tuple[int, ...]]] = []
+        # Groups placed individually around DST transitions, by minute index.
+        self._shifted: dict[int, list[int]] = {}
+
+        groups_by_key: dict[tuple[object, ...], _Group] = {}
+        groups_by_tz: dict[dt.tzinfo, list[int]] = {}
+        for index, crontab in enumerate(crontabs):
+            key = (
+                crontab.minute.mask,
+                crontab.hour.mask,
+                crontab.monthday.mask,
+                crontab.month.mask,
+                crontab.weekday.mask,
+                crontab.tz,
+            )
+            group = groups_by_key.get(key)
+            if group is None:
+                offsets = frozenset(
+                    hour * 60 + minute
+                    for hour in crontab.hour
+                    for minute in crontab.minute
+                )
+                group = groups_by_key[key] = _Group(crontab, [], offsets)
+                groups_by_tz.setdefault(crontab.tz, []).append(len(self._groups))
+                self._groups.append(group)
+            group.indexes.append(index)
+
+        if self.counts:
+            for tz, group_ids in groups_by_tz.items():
+                self._place_zone(tz, group_ids, end)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def minute(self, index: int) -> dt.datetime:
+        """
+        Returns the start of the minute at ``index`` of ``counts``, in UTC.
+        """
+        return self.start + index * MINUTE
+
+    def schedules(self, index: int) -> tuple[int, ...]:
+        """
+        Returns the indexes of the crontabs firing in the minute at ``index``.
+        """
+        group_ids = list(self._shifted.get(index, ()))
+        for base, placed in self._placements:
+            offset = index - base
+            if 0 <= offset < MINUTES_PER_DAY:
+                group_ids.extend(x for x in placed if offset in self._groups[x].offsets)
+        return tuple(sorted(i for x in group_ids for i in self._groups[x].indexes))
+
+    def peaks(self, top: int = 10) -> list[Peak]:
+        """
+        Returns the ``top`` minutes with the most firings, earliest first for ties.
+        """
+        indexes = heapq.nlargest(top, range(len(self.counts)), self.counts.__getitem__)
+        return [
+            Peak(self.minute(index), self.counts[index], self.schedules(index))
+            for index in indexes
+            if self.counts[index]
+        ]
+
+    def _place_zone(
+        self, tz: dt.tzinfo, group_ids: list[int], end: dt.datetime
+    ) -> None:
+        start = self.start.replace(tzinfo=None)
+        # The local day before the start may still overlap it across a transition.
+        day = self.start.astimezone(tz).date() - _DAY
+        last_day = end.astimezone(tz).date()
+
+        # Days either side of a transition have their firings resolved individually.
+        shifted_days: set[dt.date] = set()
+        for year in range(day.year, last_day.year + 1):
+            for transition in transition_table(tz, year).transitions:
+                local = (transition.at + transition.before).date()
+                shifted_days.update((local - _DAY, local, local + _DAY))
+
+        firings_by_key: dict[tuple[int, ...], list[tuple[int, int]]] = {}
+        while day <= last_day:
+            day_of_year = day.timetuple().tm_yday
+            placed = tuple(
+                x for x in group_ids if self._day_mask(x, day.year) >> day_of_year & 1
+            )
+            midnight = dt.datetime(day.year, day.month, day.day)
+            day += _DAY
+            if not placed:
+                continue
+            if midnight.date() in shifted_days:
+                self._place_shifted(tz, midnight, placed, start)
+                continue
+
+            firings = firings_by_key.get(placed)
+            if firings is None:
+                firings = firings_by_key[placed] = self._combine(placed)
+
+            utc, _ = localize(tz, midnight)
+            base = (utc - start) // MINUTE
+            self._placements.append((base, placed))
+            for offset, count in firings:
+                index = base + offset
+                if 0 <= index < len(self.counts):
+                    self.counts[index] += count
+
+    def _place_shifted(
+        self,
+        tz: dt.tzinfo,
+        midnight: dt.datetime,
+        group_ids: tuple[int, ...],
+        start: dt.datetime,
+    ) -> None:
+        for group_id in group_ids:
+            group = self._groups[group_id]
+            last = None
+            for offset in sorted(group.offsets):
+                utc, _ = localize(tz, midnight + offset * MINUTE)
+                # Wall times skipped by a transition merge into a single firing.
+                if last is not None and utc <= last:
+                    continue
+                last = utc
+
+                index = (utc - start) // MINUTE
+                if 0 <= index < len(self.counts):
+                    self.counts[index] += len(group.indexes)
+                    self._shifted.setdefault(index, []).append(group_id)
+
+    def _combine(self, group_ids: tuple[int, ...]) -> list[tuple[int, int]]:
+        """
+        Returns the (minute of day, count) firings of the groups combined.
+        """
+        counts: dict[int, int] = {}
+        for group_id in group_ids:
+            group = self._groups[group_id]
+            for offset in group.offsets:
+                counts[offset] = counts.get(offset, 0) + len(group.indexes)
+        return sorted(counts.items())
+
+    def _day_mask(self, group_id: int, year: int) -> int:
+        crontab = self._groups[group_id].crontab
+        return year_days_mask(
+            year, crontab.month.mask, crontab.monthday.mask, crontab.weekday.mask
+        )
@@ -0,0 +1,475 @@
+"""
+Find when schedules run at the same time, E.G. jobs which share a lock or database.
+
+Runs are compared as instants following cron's DST policy, see ``croninfo.tz``. Two
+schedules in the same timezone coincide either when all of their fields intersect,
+or when both have a run moved to the end of the same skipped interval.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import functools
+from typing import Iterable, NamedTuple
+
+from croninfo.crontab import (
+    FIELD_PARTS,
+    MAX_YEAR,
+    MINUTE,
+    MINUTES_PER_DAY,
+    CronPartHour,
+    CronPartMinute,
+    CronPartMonth,
+    CronPartMonthday,
+    CronPartWeekday,
+    Crontab,
+    mask_values,
+    month_starts,
+    range_mask,
+    year_days_mask,
+)
+from croninfo.tz import UTC, Transition, transition_table
+
+_HOUR = dt.timedelta(hours=1)
+_DAY_TIMES_MASK = range_mask(0, MINUTES_PER_DAY - 1)
+
+# Bitsets of group numbers are rarely seen twice, so are expanded without the cache.
+_group_numbers = mask_values.__wrapped__
+
+
+class Overlap(NamedTuple):
+    # Indexes of the crontabs, in the order they were given.
+    first: int
+    second: int
+    # First instant at which both run.
+    run: dt.datetime
+
+
+def first_overlap(
+    a: Crontab,
+    b: Crontab,
+    start: dt.datetime | None = None,
+    end: dt.datetime | None = None,
+) -> dt.datetime | None:
+    """
+    Returns the first instant at or after ``start`` (defaults to now) at which both
+    schedules run, or None if they never do (before ``end``).
+
+    Schedules in the same timezone are solved from the intersection of their fields.
+    Schedules in different timezones are first ruled out by their times of day and
+    dates where possible, otherwise each steps to the next run of the other until
+    they meet.
+    """
+    start = start or dt.datetime.now(tz=UTC)
+    zone = _zone(a.tz, start, end)
+    if a.tz == b.tz:
+        gap_run = None
+        for gap in zone.gaps:
+            if _runs_at_gap(a, gap) and _runs_at_gap(b, gap):
+                gap_run = gap.run
+                break
+        return _first_same_zone(a, b, start, end, gap_run)
+
+    other = _zone(b.tz, start, end)
+    a_gaps = any(_runs_at_gap(a, gap) for gap in zone.gaps)
+    b_gaps = any(_runs_at_gap(b, gap) for gap in other.gaps)
+    if not _may_coincide(
+        _profile(a, zone, a_gaps), _profile(b, other, b_gaps), _shifts(zone, other)
+    ):
+        return None
+    return _leapfrog(a, b, start, end)
+
+
+def find_overlaps(
+    crontabs: Iterable[Crontab],
+    start: dt.datetime | None = None,
+    end: dt.datetime | None = None,
+) -> list[Overlap]:
+    """
+    Returns every pair of crontabs which run at the same instant at or after
+    ``start`` (defaults to now), and before ``end``, along with the first instant
+    they do. Pairs are ordered by their indexes.
+
+    Identical schedules are grouped, then each group is indexed by the values of its
+    fields so that only groups whose fields intersect are compared.
+    """
+    start = start or dt.datetime.now(tz=UTC)
+
+    groups: list[_IdenticalSchedules] = []
+    groups_by_key: dict[tuple[object, ...], _IdenticalSchedules] = {}
+    for index, crontab in enumerate(crontabs):
+        key = (*crontab.masks, crontab.tz)
+        group = groups_by_key.get(key)
+        if group is None:
+            group = groups_by_key[key] = _IdenticalSchedules(crontab, len(groups))
+            groups.append(group)
+        group.indexes.append(index)
+
+    zones: dict[dt.tzinfo, _ZoneGroups] = {}
+    for group in groups:
+        tz = group.crontab.tz
+        zone_groups = zones.get(tz)
+        if zone_groups is None:
+            zone_groups = zones[tz] = _ZoneGroups(_zone(tz, start, end))
+        zone_groups.add(group)
+
+    overlaps = []
+    for group in groups:
+        if len(group.indexes) > 1:
+            run = _first_run(group.crontab, start, end)
+            if run is not None:
+                overlaps.extend(_pairs(group, group, run))
+
+        own = zones[group.crontab.tz]
+        # Only compare each pair of groups once, against those after it.
+        later = ~((2 << group.number) - 1)
+        for other_number in _group_numbers(own.candidates(group) & later):
+            other = groups[other_number]
+            gap_runs = group.gaps & other.gaps
+            gap_run = None
+            if gap_runs:
+                gap = own.zone.gaps[(gap_runs & -gap_runs).bit_length() - 1]
+                gap_run = gap.run
+            run = _first_same_zone(group.crontab, other.crontab, start, end, gap_run)
+            if run is not None:
+                overlaps.extend(_pairs(group, other, run))
+
+        # Schedules in other zones are compared by their times of day and dates
+        # under each difference in UTC offset, then confirmed by stepping runs.
+        profile = own.profile_of(group)
+        for tz, zone_groups in zones.items():
+            if tz == group.crontab.tz:
+                continue
+            shifts = _shifts(own.zone, zone_groups.zone)
+            candidates = zone_groups.time_candidates(profile[0], shifts) & later
+            for other_number in _group_numbers(candidates):
+                other = groups[other_number]
+                if not _may_coincide(profile, zone_groups.profile_of(other), shifts):
+                    continue
+                run = _leapfrog(group.crontab, other.crontab, start, end)
+                if run is not None:
+                    overlaps.extend(_pairs(group, other, run))
+
+    return sorted(overlaps)
+
+
+class _Gap(NamedTuple):
+    # Instant at the end of the interval, where runs within it are moved to.
+    run: dt.datetime
+    # Wall clock times from the start of the interval up to and including its end,
+    # as (year, month, day, hour, minutes mask) for each hour.
+    walls: tuple[tuple[int, int, int, int, int], ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class _Zone:
+    tz: dt.tzinfo
+    # Intervals skipped by clocks springing forward within the window, in order.
+    gaps: tuple[_Gap, ...]
+    # UTC offsets in effect across the window, in minutes.
+    offsets: tuple[int, ...]
+    # Local times of day and dates at which the skipped intervals end, see
+    # ``_day_times`` and ``_window_days``.
+    gap_times: int
+    gap_days: int
+    # First and last year of the window, padded as local dates may be in a different
+    # year to UTC.
+    years: tuple[int, int]
+
+
+class _IdenticalSchedules:
+    """
+    Crontabs with identical fields and timezone, which always run together.
+    """
+
+    def __init__(self, crontab: Crontab, number: int) -> None:
+        self.crontab = crontab
+        self.number = number
+        self.indexes: list[int] = []
+        # Bit ``n`` is set when the schedule runs at the end of the zone's nth gap.
+        self.gaps = 0
+
+
+class _ZoneGroups:
+    """
+    Groups within a timezone, indexed by the values of their fields.
+    """
+
+    def __init__(self, zone: _Zone) -> None:
+        self.zone = zone
+        self.numbers = 0
+        # For each field, the bitset of group numbers containing each value.
+        self.fields = [[0] * (part.max_value + 1) for part in FIELD_PARTS]
+        # Bitset of group numbers running at the end of each gap.
+        self.gaps = [0] * len(zone.gaps)
+        # Bitset of group numbers running at each time of day, built on first use.
+        self.times: list[int] | None = None
+        self.groups: list[_IdenticalSchedules] = []
+
+    def add(self, group: _IdenticalSchedules) -> None:
+        bit = 1 << group.number
+        self.numbers |= bit
+        self.groups.append(group)
+        for bitsets, mask in zip(self.fields, group.crontab.masks):
+            for value in mask_values(mask):
+                bitsets[value] |= bit
+        for index, gap in enumerate(self.zone.gaps):
+            if _runs_at_gap(group.crontab, gap):
+                group.gaps |= 1 << index
+                self.gaps[index] |= bit
+
+    def candidates(self, group: _IdenticalSchedules) -> int:
+        """
+        Returns the numbers of groups whose fields all intersect, or which share a gap.
+        """
+        result = self.numbers
+        for bitsets, mask in zip(self.fields, group.crontab.masks):
+            matched = 0
+            for value in mask_values(mask):
+                matched |= bitsets[value]
+            result &= matched
+        for index in mask_values(group.gaps):
+            result |= self.gaps[index]
+        return result
+
+    def profile_of(self, group: _IdenticalSchedules) -> tuple[int, int]:
+        return _profile(group.crontab, self.zone, group.gaps != 0)
+
+    def time_candidates(self, times: int, shifts: Iterable[int]) -> int:
+        """
+        Returns the numbers of groups which run at any of ``times`` in another zone,
+        moved by any of ``shifts`` minutes.
+        """
+        if self.times is None:
+            self.times = [0] * MINUTES_PER_DAY
+            for group in self.groups:
+                group_times, _ = self.profile_of(group)
+                for value in mask_values(group_times):
+                    self.times[value] |= 1 << group.number
+
+        result = 0
+        for shift in shifts:
+            for value in mask_values(_rotate_times(times, shift)):
+                result |= self.times[value]
+        return result
+
+
+def _zone(tz: dt.tzinfo, start: dt.datetime, end: dt.datetime | None) -> _Zone:
+    start_utc = start.astimezone(UTC).replace(tzinfo=None, second=0, microsecond=0)
+    end_utc = end.astimezone(UTC).replace(tzinfo=None) if end else None
+    years = (start_utc.year - 1, end_utc.year + 1 if end_utc else MAX_YEAR)
+    last_year = end.astimezone(tz).year if end else MAX_YEAR
+
+    offsets = set()
+    gaps = {}
+    for year in range(start.astimezone(tz).year, min(last_year + 1, MAX_YEAR)):
+        table = transition_table(tz, year)
+        offsets.add(table.offset)
+        for transition in table.transitions:
+            offsets.add(transition.after)
+            if transition.after <= transition.before or transition.at < start_utc:
+                continue
+            if end_utc is None or transition.at < end_utc:
+                # Transitions near the start or end of a year are in both tables.
+                gaps[transition.at] = transition
+
+    gap_times = 0
+    gap_days = 0
+    for transition in gaps.values():
+        wall = transition.at + transition.after
+        gap_times |= 1 << (wall.hour * 60 + wall.minute)
+        gap_days |= 1 << (wall.date() - dt.date(years[0], 1, 1)).days
+    return _Zone(
+        tz=tz,
+        gaps=tuple(_gap(tz, gaps[at]) for at in sorted(gaps)),
+        offsets=tuple(sorted({offset // MINUTE for offset in offsets})),
+        gap_times=gap_times,
+        gap_days=gap_days,
+        years=years,
+    )
+
+
+def _gap(tz: dt.tzinfo, transition: Transition) -> _Gap:
+    wall = (transition.at + transition.before).replace(second=0)
+    last = (transition.at + transition.after).replace(second=0)
+    walls = []
+    while wall <= last:
+        hour_last = min(wall.replace(minute=59), last)
+        minutes = range_mask(wall.minute, hour_last.minute)
+        walls.append((wall.year, wall.month, wall.day, wall.hour, minutes))
+        wall = wall.replace(minute=0) + _HOUR
+    return _Gap(run=last.replace(tzinfo=tz), walls=tuple(walls))
+
+
+def _runs_at_gap(crontab: Crontab, gap: _Gap) -> bool:
+    """
+    Whether the schedule runs at the end of a skipped interval, either as it has
+    wall clock times within it or at the first wall clock time after it.
+    """
+    return any(
+        crontab.hour.mask >> hour & 1
+        and crontab.minute.mask & minutes
+        and crontab._is_valid_date(year, month, day)
+        for year, month, day, hour, minutes in gap.walls
+    )
+
+
+def _first_run(
+    crontab: Crontab, start: dt.datetime, end: dt.datetime | None
+) -> dt.datetime | None:
+    run = next(crontab.iter(start, dst_aware=True), None)
+    return run if run is not None and (end is None or run < end) else None
+
+
+def _first_same_zone(
+    a: Crontab,
+    b: Crontab,
+    start: dt.datetime,
+    end: dt.datetime | None,
+    gap_run: dt.datetime | None,
+) -> dt.datetime | None:
+    # Outside of skipped intervals both run at an instant only when both have its
+    # wall clock time, which is exactly the runs of the intersection of their fields.
+    run = None
+    masks = [x & y for x, y in zip(a.masks, b.masks)]
+    if all(masks):
+        minute, hour, monthday, month, weekday = masks
+        intersection = Crontab(
+            minute=CronPartMinute(mask=minute),
+            hour=CronPartHour(mask=hour),
+            monthday=CronPartMonthday(mask=monthday),
+            month=CronPartMonth(mask=month),
+            weekday=CronPartWeekday(mask=weekday),
+            tz=a.tz,
+            command="",
+        )
+        if intersection.is_satisfiable:
+            run = _first_run(intersection, start, end)
+
+    if gap_run is not None and (run is None or gap_run < run):
+        return gap_run
+    return run
+
+
+def _leapfrog(
+    a: Crontab, b: Crontab, start: dt.datetime, end: dt.datetime | None
+) -> dt.datetime | None:
+    """
+    Steps each schedule to the next run of the other until both run at once.
+    """
+    run = _first_run(a, start, end)
+    while run is not None:
+        other = _first_run(b, run, end)
+        if other == run:
+            return run
+        a, b, run = b, a, other
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _day_times(minute_mask: int, hour_mask: int) -> int:
+    """
+    Bitmask of the times of day of a schedule, where bit ``n`` is ``n`` minutes
+    past midnight.
+    """
+    times = 0
+    for hour in mask_values(hour_mask):
+        times |= minute_mask << hour * 60
+    return times
+
+
+def _profile(crontab: Crontab, zone: _Zone, runs_at_gaps: bool) -> tuple[int, int]:
+    """
+    Returns the (times of day, dates) of a schedule within the zone's window.
+    """
+    times = _day_times(crontab.minute.mask, crontab.hour.mask)
+    days = _window_days(
+        *zone.years, crontab.month.mask, crontab.monthday.mask, crontab.weekday.mask
+    )
+    # Runs moved to the end of a skipped interval are at a time, and possibly on
+    # a date, which is not part of the schedule.
+    if runs_at_gaps:
+        times |= zone.gap_times
+        days |= zone.gap_days
+    return times, days
+
+
+@functools.lru_cache(maxsize=256)
+def _window_days(
+    first_year: int,
+    last_year: int,
+    month_mask: int,
+    monthday_mask: int,
+    weekday_mask: int,
+) -> int:
+    """
+    Bitmask of the valid days from ``first_year`` to ``last_year``, where bit 0 is
+    the 1st of January of ``first_year``.
+    """
+    mask = 0
+    position = 0
+    for year in range(first_year, last_year + 1):
+        days = year_days_mask(year, month_mask, monthday_mask, weekday_mask)
+        mask |= days >> 1 << position
+        position += month_starts(year)[13]
+    return mask
+
+
+def _shifts(zone: _Zone, other: _Zone) -> set[int]:
+    """
+    Returns the possible number of minutes between the same instant on the wall
+    clocks of ``zone`` and ``other``.
+    """
+    return {y - x for x in zone.offsets for y in other.offsets}
+
+
+def _may_coincide(
+    a: tuple[int, int],
+    b: tuple[int, int],
+    shifts: Iterable[int],
+) -> bool:
+    """
+    Whether schedules with the given (times of day, window days) in different zones
+    may run at the same instant, when the wall clock of the second is ``shifts``
+    minutes from the first.
+    """
+    a_times, a_days = a
+    b_times, b_days = b
+    for shift in shifts:
+        # Times moved past midnight in either direction fall on another day.
+        last_carry = (shift + MINUTES_PER_DAY - 1) // MINUTES_PER_DAY
+        for carry in range(shift // MINUTES_PER_DAY, last_carry + 1):
+            first = max(carry * MINUTES_PER_DAY - shift, 0)
+            last = min((carry + 1) * MINUTES_PER_DAY - shift, MINUTES_PER_DAY) - 1
+            if first > last:
+                continue
+
+            times = a_times & range_mask(first, last)
+            offset = shift - carry * MINUTES_PER_DAY
+            times = times << offset if offset >= 0 else times >> -offset
+            if not times & b_times:
+                continue
+            days = a_days << carry if carry >= 0 else a_days >> -carry
+            if days & b_days:
+                return True
+    return False
+
+
+def _rotate_times(times: int, shift: int) -> int:
+    shift %= MINUTES_PER_DAY
+    return (times << shift | times >> (MINUTES_PER_DAY - shift)) & _DAY_TIMES_MASK
+
+
+def _pairs(
+    group: _IdenticalSchedules, other: _IdenticalSchedules, run: dt.datetime
+) -> list[Overlap]:
+    if group is other:
+        return [
+            Overlap(x, y, run)
+            for i, x in enumerate(group.indexes)
+            for y in group.indexes[i + 1 :]
+        ]
+    return [
+        Overlap(min(x, y), max(x, y), run) for x in group.indexes for y in other.indexes
+    ]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import os
+import re
+from typing import IO, Any, Iterable, Iterator, Union
+
+from croninfo.crontab import Crontab, ScheduleCache
+
+# Environment assignments, E.G. "SHELL=/bin/sh" or "MAILTO = ops@example.com"
+ENV_LINE_RE = re.compile(r"^\s*[A-Za-z_][A-Za-z0-9_]*\s*=")
+
+CrontabSource = Union[str, "os.PathLike[str]", IO[str], Iterable[str]]
+
+
+@dataclasses.dataclass(frozen=True)
+class CrontabLine:
+    """
+    Successfully parsed line of a crontab file.
+    """
+
+    lineno: int
+    crontab: Crontab
+    # Only populated for system crontabs (/etc/crontab, /etc/cron.d/*).
+    user: str | None = None
+
+    def as_dict(self, now: dt.datetime | None = None) -> dict[str, Any]:
+        """
+        JSON serialisable representation, including the next run after ``now``.
+        """
+        crontab = self.crontab
+        try:
+            next_run: str | None = crontab.next_run(now).isoformat()
+        except StopIteration:
+            next_run = None
+
+        result: dict[str, Any] = {
+            "line": self.lineno,
+            "minute": crontab.minute.values,
+            "hour": crontab.hour.values,
+            "monthday": crontab.monthday.values,
+            "month": crontab.month.values,
+            "weekday": crontab.weekday.values,
+            "tz": str(crontab.tz),
+            "command": crontab.command,
+            "next_run": next_run,
+        }
+        if self.user is not None:
+            result["user"] = self.user
+        return result
+
+
+@dataclasses.dataclass(frozen=True)
+class CrontabLineError:
+    """
+    Line of a crontab file which could not be parsed.
+    """
+
+    lineno: int
+    line: str
+    error: str
+
+    def as_dict(self, now: dt.datetime | None = None) -> dict[str, Any]:
+        """
+        JSON serialisable representation.
+        """
+        return {"line": self.lineno, "expression": self.line, "error": self.error}
+
+
+def iter_crontab(
+    source: CrontabSource,
+    *,
+    tz: dt.tzinfo,
+    system: bool = False,
+    cache: ScheduleCache | None = None,
+    start: int = 1,
+) -> Iterator[CrontabLine | CrontabLineError]:
+    """
+    Lazily parses a crontab file, path or any iterable of lines.
+
+    Comments, blank lines and environment variable assignments are skipped. Lines
+    which fail to parse are yielded as errors rather than stopping the iteration.
+    System crontabs have a user field between the schedule and the command which
+    is split out when ``system`` is set. Lines are numbered from ``start``.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8", errors="replace") as f:
+            yield from _iter_lines(f, tz=tz, system=system, cache=cache, start=start)
+    else:
+        yield from _iter_lines(source, tz=tz, system=system, cache=cache, start=start)
+
+
+def _iter_lines(
+    lines: Iterable[str],
+    *,
+    tz: dt.tzinfo,
+    system: bool,
+    cache: ScheduleCache | None,
+    start: int,
+) -> Iterator[CrontabLine | CrontabLineError]:
+    for lineno, raw_line in enumerate(lines, start=start):
+        line = raw_line.strip()
+        if not line or line.startswith("#") or ENV_LINE_RE.match(line):
+            continue
+
+        try:
+            user = None
+            expr = line
+            if system:
+                expr, user = _split_user(line)
+            crontab = Crontab.from_parse(expr=expr, tz=tz, cache=cache)
+        except ValueError as e:
+            yield CrontabLineError(lineno=lineno, line=line, error=str(e))
+        else:
+            yield CrontabLine(lineno=lineno, crontab=crontab, user=user)
+
+
+def _split_user(line: str) -> tuple[str, str]:
+    # Macros replace all five schedule fields so the user follows directly.
+    schedule_len = 1 if line.startswith("@") else 5
+    fields = line.split(maxsplit=schedule_len + 1)
+    if len(fields) < schedule_len + 2:
+        raise ValueError("System crontab line must contain a user and command")
+
+    user = fields.pop(schedule_len)
+    return " ".join(fields), user
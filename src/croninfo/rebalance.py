@@ -0,0 +1,292 @@
+"""
+Suggest new minutes (and optionally hours) for schedules to flatten their load.
+
+Schedules are moved by rotating their minutes within the hour, so each keeps its
+frequency and runs within the same hour, and optionally by shifting their hours a
+bounded amount within the day. Day of month, month and weekday are never changed.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import functools
+import heapq
+from typing import Iterable, Iterator, Sequence
+
+from croninfo.crontab import (
+    MINUTE,
+    MINUTES_PER_DAY,
+    CronPartHour,
+    CronPartMinute,
+    Crontab,
+    mask_values,
+    range_mask,
+)
+from croninfo.tz import UTC
+
+_MINUTES_MASK = range_mask(CronPartMinute.min_value, CronPartMinute.max_value)
+
+
+def rebalance(
+    crontabs: Sequence[Crontab],
+    *,
+    fixed: Iterable[Crontab] = (),
+    max_hour_shift: int = 0,
+    at: dt.datetime | None = None,
+) -> list[Crontab]:
+    """
+    Returns each crontab with its minutes, and hours when ``max_hour_shift`` is set,
+    moved to minimise the peak number of schedules running in any minute of the day.
+    Schedules in ``fixed`` contribute to the load but are not moved.
+
+    Load is counted by time of day in UTC using the UTC offset of each timezone
+    ``at`` a time (defaults to now), treating every schedule as running daily.
+
+    Schedules are placed greedily, those running most often first, each at the
+    rotation with the lowest peak load at its times. Ties prefer the lowest total
+    load then the smallest move, so schedules which already fit are left as they are.
+    """
+    if max_hour_shift < 0:
+        raise ValueError("max_hour_shift must not be negative")
+
+    at = at or dt.datetime.now(tz=UTC)
+    load = [0] * MINUTES_PER_DAY
+    for crontab in fixed:
+        _add(load, crontab.minute.mask, crontab.hour.mask, _offset(crontab, at))
+
+    result = list(crontabs)
+    order = sorted(
+        range(len(result)),
+        key=lambda i: len(result[i].minute) * len(result[i].hour),
+        reverse=True,
+    )
+    # Schedules at the same times are placed together, in the order of the first.
+    groups: dict[tuple[int, int, int], list[int]] = {}
+    for index in order:
+        crontab = result[index]
+        key = (crontab.minute.mask, crontab.hour.mask, _offset(crontab, at))
+        groups.setdefault(key, []).append(index)
+
+    for (minutes, hours, offset), indexes in groups.items():
+        placements = _placements(
+            load, minutes, hours, offset, max_hour_shift, len(indexes)
+        )
+        for index, (new_minutes, new_hours) in zip(indexes, placements):
+            if new_minutes != minutes or new_hours != hours:
+                result[index] = dataclasses.replace(
+                    result[index],
+                    minute=CronPartMinute(mask=new_minutes),
+                    hour=CronPartHour(mask=new_hours),
+                )
+    return result
+
+
+def peak_load(crontabs: Iterable[Crontab], at: dt.datetime | None = None) -> int:
+    """
+    Returns the most schedules running in any minute of the day, counted as by
+    ``rebalance``.
+    """
+    at = at or dt.datetime.now(tz=UTC)
+    load = [0] * MINUTES_PER_DAY
+    for crontab in crontabs:
+        _add(load, crontab.minute.mask, crontab.hour.mask, _offset(crontab, at))
+    return max(load)
+
+
+def _offset(crontab: Crontab, at: dt.datetime) -> int:
+    offset = at.astimezone(crontab.tz).utcoffset() or dt.timedelta()
+    return offset // MINUTE
+
+
+def _add(load: list[int], minutes: int, hours: int, offset: int) -> None:
+    for hour in mask_values(hours):
+        for minute in mask_values(minutes):
+            load[(hour * 60 + minute - offset) % MINUTES_PER_DAY] += 1
+
+
+def _placements(
+    load: list[int],
+    minutes: int,
+    hours: int,
+    offset: int,
+    max_hour_shift: int,
+    count: int,
+) -> Iterator[tuple[int, int]]:
+    """
+    Yields the (minutes, hours) masks of ``count`` schedules at the same times, each
+    placed at the lowest cost and added to ``load``, see ``rebalance``.
+    """
+    minute_values = mask_values(minutes)
+    hour_values = mask_values(hours)
+    period = _period(minutes)
+    # Unless the rotations of the minutes partition the hour, E.G. "0,5", placing a
+    # schedule changes the cost of other rotations so each is placed in turn.
+    if len(minute_values) * period != 60:
+        for _ in range(count):
+            rotation, hour_shift = _place(
+                load, minute_values, hour_values, offset, period, max_hour_shift
+            )
+            new_minutes = _rotate(minutes, rotation)
+            new_hours = _shift(hours, hour_shift)
+            _add(load, new_minutes, new_hours, offset)
+            yield new_minutes, new_hours
+        return
+
+    # Otherwise placing a schedule raises the peak of its rotation by one and only
+    # changes the cost of the same rotation in other hour shifts, so the cost of
+    # every placement is kept in a heap and just these are updated.
+    shifts = _hour_shifts(hour_values, max_hour_shift)
+    costs = {}
+    for hour_shift in shifts:
+        peaks, sums = _costs(load, minute_values, hour_values, offset, hour_shift)
+        for rotation in range(period):
+            distance = _distance(rotation, period, hour_shift)
+            costs[hour_shift, rotation] = (peaks[rotation], sums[rotation], distance)
+    heap = [(*cost, *placement) for placement, cost in costs.items()]
+    heapq.heapify(heap)
+
+    cells = len(minute_values) * len(hour_values)
+    for _ in range(count):
+        # Entries are not removed when their cost changes, so skip those outdated.
+        while True:
+            peak, total, distance, hour_shift, rotation = heapq.heappop(heap)
+            if (peak, total, distance) == costs[hour_shift, rotation]:
+                break
+
+        new_minutes = _rotate(minutes, rotation)
+        new_hours = _shift(hours, hour_shift)
+        _add(load, new_minutes, new_hours, offset)
+
+        costs[hour_shift, rotation] = (peak + 1, total + cells, distance)
+        for other_shift in shifts:
+            if other_shift != hour_shift:
+                costs[other_shift, rotation] = (
+                    *_cost(
+                        load, minute_values, hour_values, offset, other_shift, rotation
+                    ),
+                    _distance(rotation, period, other_shift),
+                )
+        for other_shift in shifts:
+            heapq.heappush(heap, (*costs[other_shift, rotation], other_shift, rotation))
+        yield new_minutes, new_hours
+
+
+def _place(
+    load: list[int],
+    minute_values: tuple[int, ...],
+    hour_values: tuple[int, ...],
+    offset: int,
+    period: int,
+    max_hour_shift: int,
+) -> tuple[int, int]:
+    """
+    Returns the (rotation, hour shift) with the lowest cost, see ``rebalance``.
+    """
+    best: tuple[int, int, int] | None = None
+    best_placement = (0, 0)
+    for hour_shift in _hour_shifts(hour_values, max_hour_shift):
+        peaks, sums = _costs(load, minute_values, hour_values, offset, hour_shift)
+        peak = min(peaks[:period])
+        total, _, rotation = min(
+            (sums[x], min(x, period - x), x)
+            for x, value in enumerate(peaks[:period])
+            if value == peak
+        )
+        cost = (peak, total, _distance(rotation, period, hour_shift))
+        if best is None or cost < best:
+            best = cost
+            best_placement = (rotation, hour_shift)
+    return best_placement
+
+
+def _costs(
+    load: list[int],
+    minute_values: tuple[int, ...],
+    hour_values: tuple[int, ...],
+    offset: int,
+    hour_shift: int,
+) -> tuple[list[int], list[int]]:
+    """
+    Returns the highest and total load at the times of each rotation of the minutes.
+    """
+    # The highest and total load of each minute past the hour, across the hours.
+    rows = [_local_row(load, hour + hour_shift, offset) for hour in hour_values]
+    if len(rows) == 1:
+        column_max = column_sum = rows[0]
+    else:
+        column_max = list(map(max, *rows))
+        column_sum = list(map(sum, zip(*rows)))
+
+    # Then of each rotation, from the columns rotated by each minute.
+    if len(minute_values) == 1:
+        (minute,) = minute_values
+        return (
+            column_max[minute:] + column_max[:minute],
+            column_sum[minute:] + column_sum[:minute],
+        )
+    peaks = list(map(max, *(column_max[x:] + column_max[:x] for x in minute_values)))
+    sums = list(
+        map(sum, zip(*(column_sum[x:] + column_sum[:x] for x in minute_values)))
+    )
+    return peaks, sums
+
+
+def _cost(
+    load: list[int],
+    minute_values: tuple[int, ...],
+    hour_values: tuple[int, ...],
+    offset: int,
+    hour_shift: int,
+    rotation: int,
+) -> tuple[int, int]:
+    """
+    Returns the highest and total load at the times of a single rotation.
+    """
+    columns = [(minute + rotation) % 60 for minute in minute_values]
+    values = [
+        row[column]
+        for row in (_local_row(load, hour + hour_shift, offset) for hour in hour_values)
+        for column in columns
+    ]
+    return max(values), sum(values)
+
+
+def _local_row(load: list[int], hour: int, offset: int) -> list[int]:
+    """
+    Returns the load of each minute of the local ``hour``, at ``offset`` from UTC.
+    """
+    start = (hour * 60 - offset) % MINUTES_PER_DAY
+    if start + 60 <= MINUTES_PER_DAY:
+        return load[start : start + 60]
+    return load[start:] + load[: start + 60 - MINUTES_PER_DAY]
+
+
+def _hour_shifts(hour_values: tuple[int, ...], max_hour_shift: int) -> list[int]:
+    # Hours are not wrapped so schedules stay on the same day.
+    return [
+        x
+        for x in range(-max_hour_shift, max_hour_shift + 1)
+        if hour_values[0] + x >= 0 and hour_values[-1] + x <= 23
+    ]
+
+
+def _distance(rotation: int, period: int, hour_shift: int) -> int:
+    return min(rotation, period - rotation) + abs(hour_shift) * 60
+
+
+@functools.lru_cache(maxsize=None)
+def _period(minutes: int) -> int:
+    """
+    Returns the number of minutes after which rotations repeat, E.G. 15 for "*/15".
+    """
+    return next(x for x in range(1, 61) if _rotate(minutes, x) == minutes)
+
+
+def _rotate(minutes: int, rotation: int) -> int:
+    rotation %= 60
+    return (minutes << rotation | minutes >> (60 - rotation)) & _MINUTES_MASK
+
+
+def _shift(hours: int, hour_shift: int) -> int:
+    return hours << hour_shift if hour_shift >= 0 else hours >> -hour_shift
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import datetime as dt
+import heapq
+import itertools
+from typing import Collection, Iterable, Iterator, NamedTuple
+
+from croninfo.crontab import Crontab
+
+
+class Firing(NamedTuple):
+    key: int
+    crontab: Crontab
+    run: dt.datetime
+
+
+class RunQueue:
+    """
+    Priority queue of schedule keys ordered by their next run.
+
+    Keys no longer in ``live`` are dropped lazily when they reach the front, call
+    ``prune`` after removing a key to drop them all once they make up most of it.
+    """
+
+    def __init__(self, live: Collection[int]) -> None:
+        self._live = live
+        self._heap: list[tuple[dt.datetime, int]] = []
+
+    def push(self, run: dt.datetime, key: int) -> None:
+        heapq.heappush(self._heap, (run, key))
+
+    def peek(self) -> tuple[dt.datetime, int] | None:
+        """
+        Returns the earliest (run, key) of a live key without removing it, None if
+        there are none.
+        """
+        while self._heap:
+            if self._heap[0][1] in self._live:
+                return self._heap[0]
+            heapq.heappop(self._heap)
+        return None
+
+    def pop(self) -> tuple[dt.datetime, int]:
+        """
+        Removes and returns the earliest (run, key) of a live key. Raises IndexError if
+        there are none.
+        """
+        if self.peek() is None:
+            raise IndexError("pop from an empty RunQueue")
+        return heapq.heappop(self._heap)
+
+    def prune(self) -> None:
+        # Rebuild once removed keys make up most of the queue to bound memory.
+        if len(self._heap) > 2 * len(self._live) + 64:
+            self._heap = [x for x in self._heap if x[1] in self._live]
+            heapq.heapify(self._heap)
+
+
+class ScheduleSet:
+    """
+    Collection of many Crontabs which yields a single time ordered stream of firings.
+
+    Each schedule is tracked by its next run in a priority queue, so yielding a firing
+    only advances the schedule which fired. Schedules can be added or removed while
+    iterating, additions start from the most recent firing.
+    """
+
+    def __init__(
+        self, crontabs: Iterable[Crontab] = (), *, start: dt.datetime | None = None
+    ) -> None:
+        self._cursor = start or dt.datetime.now(tz=dt.timezone.utc)
+        self._crontabs: dict[int, Crontab] = {}
+        self._runs: dict[int, Iterator[dt.datetime]] = {}
+        self._queue = RunQueue(self._crontabs)
+        self._keys = itertools.count()
+
+        for crontab in crontabs:
+            self.add(crontab)
+
+    def __len__(self) -> int:
+        return len(self._crontabs)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._crontabs
+
+    def __getitem__(self, key: int) -> Crontab:
+        return self._crontabs[key]
+
+    def __iter__(self) -> Iterator[Firing]:
+        return self
+
+    def __next__(self) -> Firing:
+        firing = self.peek()
+        if firing is None:
+            raise StopIteration
+
+        _, key = self._queue.pop()
+        self._cursor = firing.run
+        self._push(key, self._runs.pop(key))
+        return firing
+
+    def add(self, crontab: Crontab) -> int:
+        """
+        Adds a schedule and returns the key to later remove it by.
+        """
+        key = next(self._keys)
+        self._crontabs[key] = crontab
+        self._push(key, crontab.iter(self._cursor))
+        return key
+
+    def remove(self, key: int) -> None:
+        """
+        Removes a schedule so it no longer fires. Raises KeyError if not present.
+        """
+        del self._crontabs[key]
+        self._runs.pop(key, None)
+        self._queue.prune()
+
+    def peek(self) -> Firing | None:
+        """
+        Returns the next firing without consuming it, None if nothing will fire.
+        """
+        entry = self._queue.peek()
+        if entry is None:
+            return None
+        run, key = entry
+        return Firing(key=key, crontab=self._crontabs[key], run=run)
+
+    def _push(self, key: int, runs: Iterator[dt.datetime]) -> None:
+        run = next(runs, None)
+        if run is not None:
+            self._runs[key] = runs
+            self._queue.push(run, key)
@@ -0,0 +1,194 @@
+"""
+asyncio runtime which runs coroutines on Crontab schedules.
+
+All jobs share a single timer heap ordered by their next run, so the scheduler only
+ever sleeps until the earliest one is due regardless of the number of jobs.
+
+Schedules are followed in real time using cron's DST policy, see ``croninfo.tz``.
+Sleeps are bounded by ``max_sleep`` so that changes to the clock are noticed:
+
+- When the clock jumps forward each job whose runs were missed fires once, then
+  resumes from the new time.
+- When the clock jumps backward runs which already fired are not repeated, jobs
+  resume once the clock reaches their next run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime as dt
+import itertools
+from typing import Any, Awaitable, Callable
+
+from croninfo.crontab import MINUTE, Crontab
+from croninfo.schedule_set import RunQueue
+
+
+class Clock:
+    """
+    Source of time for a Scheduler, subclass to control time in tests.
+    """
+
+    def now(self) -> dt.datetime:
+        return dt.datetime.now(tz=dt.timezone.utc)
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+@dataclasses.dataclass
+class _Job:
+    crontab: Crontab
+    func: Callable[[], Awaitable[Any]]
+    max_concurrency: int
+    running: set[asyncio.Task[Any]] = dataclasses.field(default_factory=set)
+
+
+class Scheduler:
+    """
+    Runs coroutine functions whenever their Crontab is due, until ``run`` is cancelled.
+
+    A job which is still running ``max_concurrency`` times when it is next due skips
+    that run. Cancelling ``run`` also cancels any jobs which are still running.
+    """
+
+    def __init__(self, *, clock: Clock | None = None, max_sleep: float = 60.0) -> None:
+        if max_sleep <= 0:
+            raise ValueError("max_sleep must be greater than 0")
+
+        self._clock = clock or Clock()
+        self._max_sleep = max_sleep
+        self._jobs: dict[int, _Job] = {}
+        self._queue = RunQueue(self._jobs)
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._keys = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._jobs
+
+    def add(
+        self,
+        crontab: Crontab,
+        func: Callable[[], Awaitable[Any]],
+        *,
+        max_concurrency: int = 1,
+    ) -> int:
+        """
+        Schedules ``func`` to be called and awaited on each run of ``crontab``, from
+        the next whole minute. Returns the key to later remove the job by.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        key = next(self._keys)
+        self._jobs[key] = _Job(
+            crontab=crontab, func=func, max_concurrency=max_concurrency
+        )
+        self._push(key, _ceil_minute(self._clock.now()))
+        return key
+
+    def remove(self, key: int) -> None:
+        """
+        Removes a job so it no longer runs, any runs in progress are left to finish.
+        Raises KeyError if not present.
+        """
+        del self._jobs[key]
+        self._queue.prune()
+        self._wake()
+
+    def running(self, key: int) -> int:
+        """
+        Returns the number of runs of a job currently in progress.
+        """
+        return len(self._jobs[key].running)
+
+    async def run(self) -> None:
+        """
+        Runs jobs as they become due, forever or until cancelled.
+        """
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                now = self._clock.now()
+                self._run_due(now)
+
+                delay = self._max_sleep
+                entry = self._queue.peek()
+                if entry is not None:
+                    due = (entry[0] - now).total_seconds()
+                    delay = min(max(due, 0), delay)
+                await self._sleep(delay)
+        finally:
+            self._wakeup = None
+            tasks = list(self._tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _run_due(self, now: dt.datetime) -> None:
+        while True:
+            entry = self._queue.peek()
+            if entry is None or entry[0] > now:
+                break
+            run, key = self._queue.pop()
+            job = self._jobs[key]
+
+            if len(job.running) < job.max_concurrency:
+                task = asyncio.ensure_future(job.func())
+                job.running.add(task)
+                self._tasks.add(task)
+                task.add_done_callback(job.running.discard)
+                task.add_done_callback(self._task_done)
+
+            # Any other runs missed due to the clock jumping forward are skipped.
+            self._push(key, max(run, now.replace(second=0, microsecond=0)) + MINUTE)
+
+    def _push(self, key: int, start: dt.datetime) -> None:
+        crontab = self._jobs[key].crontab
+        run = next(crontab.iter(start, dst_aware=True), None)
+        if run is not None:
+            self._queue.push(run, key)
+            self._wake()
+
+    def _task_done(self, task: asyncio.Task[Any]) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # Report failures the same way as any other unhandled task exception,
+            # without stopping the scheduler.
+            asyncio.get_event_loop().call_exception_handler(
+                {
+                    "message": "Exception in scheduled job",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _sleep(self, delay: float) -> None:
+        """
+        Sleeps for ``delay`` seconds, or until a job is added or removed.
+        """
+        assert self._wakeup is not None
+        self._wakeup.clear()
+        waiters = {
+            asyncio.ensure_future(self._clock.sleep(delay)),
+            asyncio.ensure_future(self._wakeup.wait()),
+        }
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+
+def _ceil_minute(ts: dt.datetime) -> dt.datetime:
+    floor = ts.replace(second=0, microsecond=0)
+    return floor if floor == ts else floor + MINUTE
@@ -0,0 +1,302 @@
+"""
+Compact binary serialisation of parsed Crontabs.
+
+Schedules are stored as their field bitmasks so loading them does not re-parse any
+expressions. Many schedules can be written to a single archive which is read in
+place, E.G. from a memory mapped file, with only the entries accessed decoded.
+
+Archive layout (little endian), version 1:
+
+- Header: magic ``CRON``, version (u16), reserved (u16), number of schedules (u32),
+  number of timezones (u32), offset of the offset table (u64).
+- Timezone table: for each timezone its name length (u16) and UTF-8 name.
+- Offset table: offset of each schedule record from the start (u64).
+- Records: minute (u64), hour (u32), monthday (u32), month (u16) and weekday (u8)
+  masks, timezone table index (u16), command length (u32) and UTF-8 command.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import functools
+import mmap
+import os
+import re
+import struct
+import sys
+from typing import IO, Iterable, Iterator, TypeVar, Union
+
+from croninfo.crontab import (
+    CronPart,
+    CronPartHour,
+    CronPartMinute,
+    CronPartMonth,
+    CronPartMonthday,
+    CronPartWeekday,
+    Crontab,
+    local_fields,
+    range_mask,
+)
+
+MAGIC = b"CRON"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIIQ")
+_TZ_NAME = struct.Struct("<H")
+_OFFSET = struct.Struct("<Q")
+_RECORD = struct.Struct("<QIIHBHI")
+_Part = TypeVar("_Part", bound=CronPart)
+
+# Fixed offset timezones which are not UTC, E.G. "UTC+05:30" or "UTC-01:00:30".
+_FIXED_OFFSET_RE = re.compile(r"^UTC([+-])(\d{2}):(\d{2})(?::(\d{2}))?$")
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+def dumps(crontab: Crontab) -> bytes:
+    """
+    Serialises a single Crontab, see ``loads``.
+    """
+    data, _ = _build([crontab])
+    return data
+
+
+def loads(data: Buffer) -> Crontab:
+    """
+    Deserialises a single Crontab serialised by ``dumps``.
+    """
+    archive = ScheduleArchive(data)
+    if len(archive) != 1:
+        raise ValueError(f"Expected a single schedule, found {len(archive)}")
+    return archive[0]
+
+
+def dump(crontabs: Iterable[Crontab], fp: IO[bytes]) -> int:
+    """
+    Writes an archive of many Crontabs to a binary file, returning the number written.
+    """
+    data, count = _build(crontabs)
+    fp.write(data)
+    return count
+
+
+class ScheduleArchive:
+    """
+    Read only view of an archive of Crontabs written by ``dump``.
+
+    Entries are decoded on access, so opening an archive only reads its header and
+    timezone table regardless of the number of schedules.
+    """
+
+    def __init__(self, data: Buffer) -> None:
+        self._data = memoryview(data)
+        self._mmap: mmap.mmap | None = None
+
+        try:
+            magic, version, _, count, tz_count, table_offset = _HEADER.unpack_from(
+                self._data
+            )
+        except struct.error:
+            raise ValueError("Not a croninfo schedule archive") from None
+        if magic != MAGIC:
+            raise ValueError("Not a croninfo schedule archive")
+        if version != VERSION:
+            raise ValueError(f"Unsupported croninfo schedule archive version {version}")
+
+        if table_offset + count * _OFFSET.size > len(self._data):
+            raise ValueError("Corrupt croninfo schedule archive, truncated offsets")
+        self.count: int = count
+        self._table_offset: int = table_offset
+
+        tz_names = []
+        position = _HEADER.size
+        for _ in range(tz_count):
+            (length,) = self._unpack(_TZ_NAME, position)
+            position += _TZ_NAME.size
+            tz_names.append(str(self._slice(position, length), "utf-8"))
+            position += length
+        self.tz_names: tuple[str, ...] = tuple(tz_names)
+        self._tzs = tuple(_load_tz(name) for name in tz_names)
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str]) -> ScheduleArchive:
+        """
+        Memory maps an archive file, call ``close`` (or use as a context manager)
+        once done with it.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        archive = cls(mapped)
+        archive._mmap = mapped
+        return archive
+
+    def close(self) -> None:
+        self._data.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> ScheduleArchive:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Crontab]:
+        for index in range(self.count):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> Crontab:
+        offset = self._offset(index)
+        minute, hour, monthday, month, weekday, tz_index, length = self._unpack(
+            _RECORD, offset
+        )
+        return Crontab(
+            minute=_part(CronPartMinute, minute),
+            hour=_part(CronPartHour, hour),
+            monthday=_part(CronPartMonthday, monthday),
+            month=_part(CronPartMonth, month),
+            weekday=_part(CronPartWeekday, weekday),
+            tz=self._tzs[self._tz_index(tz_index)],
+            command=str(self._slice(offset + _RECORD.size, length), "utf-8"),
+        )
+
+    def matching(self, ts: dt.datetime) -> Iterator[int]:
+        """
+        Yields the index of each schedule which fires at the minute of ``ts``,
+        checking the stored masks directly without decoding the schedules.
+        """
+        fields_by_tz = [local_fields(ts, tz) for tz in self._tzs]
+        for index in range(self.count):
+            offset = self._offset(index)
+            *masks, tz_index, _ = self._unpack(_RECORD, offset)
+            fields = fields_by_tz[self._tz_index(tz_index)]
+            if all(mask >> value & 1 for mask, value in zip(masks, fields)):
+                yield index
+
+    def _offset(self, index: int) -> int:
+        if not 0 <= index < self.count:
+            raise IndexError("schedule index out of range")
+        (offset,) = self._unpack(_OFFSET, self._table_offset + index * _OFFSET.size)
+        return offset
+
+    def _unpack(self, fmt: struct.Struct, offset: int) -> tuple[int, ...]:
+        try:
+            return fmt.unpack_from(self._data, offset)
+        except struct.error:
+            raise ValueError(
+                f"Corrupt croninfo schedule archive, truncated at offset {offset}"
+            ) from None
+
+    def _slice(self, offset: int, length: int) -> memoryview:
+        if offset + length > len(self._data):
+            raise ValueError(
+                f"Corrupt croninfo schedule archive, truncated at offset {offset}"
+            )
+        return self._data[offset : offset + length]
+
+    def _tz_index(self, tz_index: int) -> int:
+        if tz_index >= len(self._tzs):
+            raise ValueError(
+                f"Corrupt croninfo schedule archive, unknown timezone {tz_index}"
+            )
+        return tz_index
+
+
+@functools.lru_cache(maxsize=4096)
+def _part(part: type[_Part], mask: int) -> _Part:
+    """
+    Parts are immutable, so are shared between loaded schedules with the same mask.
+    """
+    # Every field has at least one value, so an empty mask is as corrupt as one
+    # with values out of range.
+    if not mask or mask & ~range_mask(part.min_value, part.max_value):
+        raise ValueError(f"Invalid {part.name} mask {mask:#x}")
+    return part(mask=mask)
+
+
+def _build(crontabs: Iterable[Crontab]) -> tuple[bytes, int]:
+    tz_indexes: dict[str, int] = {}
+    records = []
+    for crontab in crontabs:
+        tz_index = tz_indexes.setdefault(_tz_name(crontab.tz), len(tz_indexes))
+        command = crontab.command.encode("utf-8")
+        records.append(
+            _RECORD.pack(
+                crontab.minute.mask,
+                crontab.hour.mask,
+                crontab.monthday.mask,
+                crontab.month.mask,
+                crontab.weekday.mask,
+                tz_index,
+                len(command),
+            )
+            + command
+        )
+
+    tz_table = b"".join(
+        _TZ_NAME.pack(len(encoded)) + encoded
+        for encoded in (name.encode("utf-8") for name in tz_indexes)
+    )
+    table_offset = _HEADER.size + len(tz_table)
+    offsets = []
+    position = table_offset + _OFFSET.size * len(records)
+    for record in records:
+        offsets.append(_OFFSET.pack(position))
+        position += len(record)
+
+    header = _HEADER.pack(
+        MAGIC, VERSION, 0, len(records), len(tz_indexes), table_offset
+    )
+    return b"".join([header, tz_table, *offsets, *records]), len(records)
+
+
+def _tz_name(tz: dt.tzinfo) -> str:
+    # zoneinfo.ZoneInfo and pytz timezones respectively.
+    name = getattr(tz, "key", None) or getattr(tz, "zone", None)
+    if isinstance(name, str):
+        return name
+
+    offset = tz.utcoffset(None)
+    if isinstance(tz, dt.timezone) and offset is not None:
+        if not offset:
+            return "UTC"
+        if offset.microseconds:
+            raise ValueError(
+                f"Timezone {tz!r} can not be serialised, "
+                "offsets must be a whole number of seconds"
+            )
+        sign = "-" if offset < dt.timedelta() else "+"
+        minutes, seconds = divmod(int(abs(offset).total_seconds()), 60)
+        hours, minutes = divmod(minutes, 60)
+        if seconds:
+            return f"UTC{sign}{hours:02}:{minutes:02}:{seconds:02}"
+        return f"UTC{sign}{hours:02}:{minutes:02}"
+
+    raise ValueError(
+        f"Timezone {tz!r} can not be serialised, "
+        "use a zoneinfo.ZoneInfo or datetime.timezone"
+    )
+
+
+def _load_tz(name: str) -> dt.tzinfo:
+    if name == "UTC":
+        return dt.timezone.utc
+
+    match = _FIXED_OFFSET_RE.match(name)
+    if match:
+        sign, hours, minutes, seconds = match.groups()
+        offset = dt.timedelta(
+            hours=int(hours), minutes=int(minutes), seconds=int(seconds or 0)
+        )
+        return dt.timezone(-offset if sign == "-" else offset)
+
+    # Backports is required for Python versions <3.9
+    if sys.version_info >= (3, 9):
+        import zoneinfo
+    else:
+        from backports import zoneinfo
+
+    return zoneinfo.ZoneInfo(name)
@@ -0,0 +1,78 @@
+"""
+Optional counters for diagnosing slow schedule lookups.
+
+Counters are only recorded while a collector is active, otherwise the hot paths
+pay a single ``None`` check per call::
+
+    with croninfo.stats.collect() as stats:
+        crontab = Crontab.from_parse(expr="0 0 29 2 1 /usr/bin/find", tz=tz)
+        crontab.next_scheduled_run
+    print(stats.as_dict())
+
+The active collector is held in a context variable, so collectors in concurrent
+threads or asyncio tasks each only receive the counts of their own lookups. Tasks
+inherit the collector active when they are created, new threads do not.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import dataclasses
+from typing import Iterator
+
+_active: contextvars.ContextVar[Stats | None] = contextvars.ContextVar(
+    "croninfo_stats", default=None
+)
+
+
+@dataclasses.dataclass
+class Stats:
+    """
+    Counters recorded while searching for and parsing schedules.
+
+    A candidate is rejected whenever the solver has to move a field on from the
+    value it was given, E.G. a day which does not match the weekday.
+    """
+
+    days_scanned: int = 0
+    months_scanned: int = 0
+    """
+    Months passed over by the scan of the year's day mask, rather than checked one by
+    one, counting the month the scan stops in.
+    """
+    years_rolled: int = 0
+    rejected_months: int = 0
+    """
+    Months passed over by the scan of the year's day mask without a matching day.
+    """
+    rejected_days: int = 0
+    rejected_hours: int = 0
+    rejected_minutes: int = 0
+    parses: int = 0
+    parse_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        return dataclasses.asdict(self)
+
+
+def current() -> Stats | None:
+    """
+    Returns the active collector, or None if counters are not being recorded.
+    """
+    return _active.get()
+
+
+@contextlib.contextmanager
+def collect() -> Iterator[Stats]:
+    """
+    Records counters into a new ``Stats`` for the duration of the context.
+
+    Collectors may be nested, only the innermost receives counts.
+    """
+    stats = Stats()
+    token = _active.set(stats)
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
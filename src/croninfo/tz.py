@@ -0,0 +1,148 @@
+"""
+Timezone helpers for resolving wall clock schedules across DST transitions.
+
+Cron schedules are defined in wall clock time, which across DST transitions
+either does not exist (clocks spring forward) or occurs twice (clocks fall back).
+The policy followed here matches that of Vixie cron / cronie:
+
+- Schedules within a skipped interval run once, at the first instant after it.
+- Schedules within a repeated interval run once, on their first occurrence.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import functools
+
+UTC = dt.timezone.utc
+EPOCH = dt.datetime(1970, 1, 1)
+
+
+@dataclasses.dataclass(frozen=True)
+class Transition:
+    """
+    A change of UTC offset for a timezone.
+    """
+
+    # Instant of the transition, as a naive UTC datetime.
+    at: dt.datetime
+    before: dt.timedelta
+    after: dt.timedelta
+
+
+@dataclasses.dataclass(frozen=True)
+class TransitionTable:
+    """
+    UTC offset transitions which affect wall clock times within a year.
+    """
+
+    # Offset in effect before the first transition.
+    offset: dt.timedelta
+    transitions: tuple[Transition, ...]
+
+
+@functools.lru_cache(maxsize=1024)
+def transition_table(tz: dt.tzinfo, year: int) -> TransitionTable:
+    """
+    Returns the transitions of ``tz`` which affect wall clock times in ``year``.
+
+    Offsets are sampled daily, then each change is bisected down to the second.
+    Results are cached so a zone is only inspected once per year.
+    """
+    # Fixed offset timezones have no transitions.
+    fixed_offset = tz.utcoffset(None)
+    if fixed_offset is not None:
+        return TransitionTable(offset=fixed_offset, transitions=())
+
+    # Pad either side of the year by more than any UTC offset so that transitions
+    # affecting the first and last wall clock days are included.
+    start = dt.datetime(year, 1, 1) - dt.timedelta(days=2)
+    end = dt.datetime(year + 1, 1, 1) + dt.timedelta(days=2)
+
+    initial = _utcoffset(tz, start)
+    transitions = []
+    prev_at, prev_offset = start, initial
+    at = start
+    while at < end:
+        at += dt.timedelta(days=1)
+        offset = _utcoffset(tz, at)
+        if offset != prev_offset:
+            transitions.append(_bisect(tz, prev_at, at, prev_offset, offset))
+        prev_at, prev_offset = at, offset
+
+    return TransitionTable(offset=initial, transitions=tuple(transitions))
+
+
+@functools.lru_cache(maxsize=1024)
+def offset_changes(
+    tz: dt.tzinfo, year: int
+) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """
+    Returns the UTC offsets of ``tz`` around ``year`` as seconds since the epoch at
+    which each offset starts and the offset in seconds, for looking up the offset of
+    a timestamp without converting it to a datetime. The first offset is in effect
+    from the start of the transition table.
+    """
+    table = transition_table(tz, year)
+    starts = (float("-inf"),) + tuple(
+        (x.at - EPOCH).total_seconds() for x in table.transitions
+    )
+    offsets = (table.offset.total_seconds(),) + tuple(
+        x.after.total_seconds() for x in table.transitions
+    )
+    return starts, offsets
+
+
+def localize(tz: dt.tzinfo, wall: dt.datetime) -> tuple[dt.datetime, dt.datetime]:
+    """
+    Resolves a naive wall clock time in ``tz`` following the cron DST policy.
+
+    Returns a tuple of the naive UTC instant and the aware datetime in ``tz``. Wall
+    times skipped by a transition are moved to the first instant after it and
+    repeated wall times resolve to their first occurrence.
+    """
+    table = transition_table(tz, wall.year)
+
+    offset = table.offset
+    for transition in table.transitions:
+        before, after = transition.before, transition.after
+        if wall < transition.at + min(before, after):
+            break
+        if wall >= transition.at + max(before, after):
+            offset = after
+            continue
+
+        # Skipped by clocks springing forward, run at the end of the gap.
+        if after > before:
+            return transition.at, (transition.at + after).replace(tzinfo=tz)
+        # Repeated by clocks falling back, the first occurrence is before it.
+        offset = before
+        break
+
+    return wall - offset, wall.replace(tzinfo=tz, fold=0)
+
+
+def _utcoffset(tz: dt.tzinfo, at: dt.datetime) -> dt.timedelta:
+    # "at" is a naive UTC datetime.
+    offset = at.replace(tzinfo=UTC).astimezone(tz).utcoffset()
+    assert offset is not None
+    return offset
+
+
+def _bisect(
+    tz: dt.tzinfo,
+    lo: dt.datetime,
+    hi: dt.datetime,
+    before: dt.timedelta,
+    after: dt.timedelta,
+) -> Transition:
+    # Narrow down to the first second which has the new offset.
+    while hi - lo > dt.timedelta(seconds=1):
+        mid = lo + (hi - lo) / 2
+        mid = mid.replace(microsecond=0)
+        if _utcoffset(tz, mid) == before:
+            lo = mid
+        else:
+            hi = mid
+    return Transition(at=hi, before=before, after=after)
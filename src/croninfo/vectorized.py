@@ -0,0 +1,94 @@
+"""
+NumPy backed evaluation of a Crontab over a window of minutes.
+
+Requires the optional numpy dependency, ``pip install croninfo[numpy]``.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from croninfo.crontab import CronPart, Crontab
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "croninfo.vectorized requires numpy, install with `pip install croninfo[numpy]`"
+    ) from e
+
+
+def minute_range(crontab: Crontab, start: dt.datetime, end: dt.datetime) -> np.ndarray:
+    """
+    Returns every minute from ``start`` (inclusive) to ``end`` (exclusive) as
+    ``datetime64[m]`` values, in the wall clock of the crontab's timezone.
+    """
+    first, last = _window(crontab, start, end)
+    return np.arange(first, last, dtype="datetime64[m]")
+
+
+def firing_mask(crontab: Crontab, start: dt.datetime, end: dt.datetime) -> np.ndarray:
+    """
+    Returns a boolean mask aligned with ``minute_range`` which is True for each
+    minute the crontab fires.
+
+    The mask is built per day (monthday, month and weekday) and per minute of the
+    day (hour and minute) then combined with an outer product, so there is no
+    Python level loop over minutes.
+    """
+    first, last = _window(crontab, start, end)
+    if last <= first:
+        return np.zeros(0, dtype=bool)
+
+    first_day = first.astype("datetime64[D]")
+    last_day = (last - 1).astype("datetime64[D]")
+    days = np.arange(first_day, last_day + 1, dtype="datetime64[D]")
+
+    months = days.astype("datetime64[M]")
+    monthday = (days - months.astype("datetime64[D]")).astype(np.int64) + 1
+    month = months.astype(np.int64) % 12 + 1
+    # Epoch (1970-01-01) was a Thursday, weekdays are 1-based from Monday.
+    weekday = (days.astype(np.int64) + 3) % 7 + 1
+    valid_days = (
+        _lookup(crontab.monthday)[monthday]
+        & _lookup(crontab.month)[month]
+        & _lookup(crontab.weekday)[weekday]
+    )
+
+    valid_minutes = np.outer(
+        _lookup(crontab.hour)[:24], _lookup(crontab.minute)[:60]
+    ).ravel()
+
+    mask = np.outer(valid_days, valid_minutes).ravel()
+    offset = int((first - first_day.astype("datetime64[m]")).astype(np.int64))
+    return mask[offset : offset + int((last - first).astype(np.int64))]
+
+
+def firing_times(crontab: Crontab, start: dt.datetime, end: dt.datetime) -> np.ndarray:
+    """
+    Returns the ``datetime64[m]`` firings of the crontab from ``start`` (inclusive)
+    to ``end`` (exclusive), in the wall clock of the crontab's timezone.
+    """
+    first, _ = _window(crontab, start, end)
+    mask = firing_mask(crontab, start, end)
+    return first + np.flatnonzero(mask).astype("timedelta64[m]")
+
+
+def _window(
+    crontab: Crontab, start: dt.datetime, end: dt.datetime
+) -> tuple[np.datetime64, np.datetime64]:
+    # Same as Crontab.iter, the minute of start is included even if it has
+    # partially passed. Any minute which starts before end is included.
+    first = start.astimezone(crontab.tz).replace(tzinfo=None, second=0, microsecond=0)
+    last = end.astimezone(crontab.tz).replace(tzinfo=None)
+    last_minute = last.replace(second=0, microsecond=0)
+    if last_minute != last:
+        last_minute += dt.timedelta(minutes=1)
+    return np.datetime64(first, "m"), np.datetime64(last_minute, "m")
+
+
+def _lookup(part: CronPart) -> np.ndarray:
+    # Boolean lookup table indexed by value, E.G. table[15] for minute 15.
+    table = np.zeros(part.max_value + 1, dtype=bool)
+    table[list(part)] = True
+    return table
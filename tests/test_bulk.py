@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+
+from croninfo.bulk import analyse
+from croninfo.reader import iter_crontab
+
+NOW = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+LINES = [
+    "# Comments are skipped",
+    "@weekly /usr/bin/find / -name x",
+    "*/15 0 1,15 * 1-5",
+    "0 12 1 JAN * /usr/bin/find",
+    "0 0 29 2 1 /usr/bin/leap",
+    "0 0 31 2 * /usr/bin/never",
+]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+def test_analyse__input_order(workers, chunk_size):
+    """
+    Given lines sharded across workers expect the same records, in input order,
+    as parsing them sequentially.
+    """
+    lines = LINES * 20
+    expected = [entry.as_dict(NOW) for entry in iter_crontab(lines, tz=NOW.tzinfo)]
+
+    result = list(
+        analyse(
+            lines, tz=dt.timezone.utc, now=NOW, workers=workers, chunk_size=chunk_size
+        )
+    )
+
+    assert expected == result
+    assert [2, 3, 4, 5, 6, 8] == [record["line"] for record in result[:6]]
+
+
+def test_analyse__streams():
+    """
+    Given the consumer stops early, expect the remaining input not to be read.
+    """
+    consumed = []
+
+    def lines():
+        for lineno in range(1, 100_000):
+            consumed.append(lineno)
+            yield "* * * * * /usr/bin/find"
+
+    records = analyse(lines(), tz=dt.timezone.utc, now=NOW, workers=2, chunk_size=10)
+    first = next(records)
+    records.close()
+
+    assert 1 == first["line"]
+    assert len(consumed) < 100
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"workers": 0}, "workers must be at least 1"),
+        ({"chunk_size": 0}, "chunk_size must be at least 1"),
+    ],
+)
+def test_analyse__invalid_args(kwargs, expected):
+    """
+    Given invalid worker or chunk sizes expect a ValueError.
+    """
+    with pytest.raises(ValueError, match=expected):
+        list(analyse(LINES, tz=dt.timezone.utc, **kwargs))
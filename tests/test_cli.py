@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import datetime as dt
+import json
 import sys
+from textwrap import dedent
 
 import pytest
 import time_machine
 
-from croninfo.cli import __version__, cli
+from croninfo import __version__
+from croninfo.cli import cli
 
 # Backports is required for Python versions <3.9
 if sys.version_info >= (3, 9):
@@ -227,7 +230,7 @@ def test_parse_command__opts_output(expr, expected, tzinfo, typer_runner, mocker
     cmds.extend(expr)
 
     # Ensure tzlocal always picks up the expected tzinfo being passed.
-    mocker.patch("croninfo.cli.tzlocal.get_localzone", return_value=tzinfo)
+    mocker.patch("tzlocal.get_localzone", return_value=tzinfo)
 
     result = typer_runner(cli, cmds)
 
@@ -298,3 +301,209 @@ def test_version_arg__is_eager(typer_runner):
 
     assert 0 == result.exit_code
     result.assert_cli_output(f"Version: {__version__}")
+
+
+@time_machine.travel(
+    dt.datetime(
+        year=2022, month=1, day=1, hour=1, minute=1, second=1, tzinfo=dt.timezone.utc
+    )
+)
+def test_batch_command__output(typer_runner):
+    """
+    Given many cron expressions expect one JSON record per expression, with invalid
+    expressions outputting an error record rather than aborting.
+    """
+    expressions = "\n".join(
+        [
+            "# Comments are skipped",
+            "@weekly /usr/bin/find / -name x",
+            "*/15 0 1,15 * 1-5",
+            "0 12 1 JAN * /usr/bin/find",
+        ]
+    )
+    result = typer_runner(cli, ["batch", "--chunk-size", "1"], input=expressions)
+
+    assert 1 == result.exit_code
+    assert [
+        {
+            "line": 2,
+            "minute": [0],
+            "hour": [0],
+            "monthday": list(range(1, 32)),
+            "month": list(range(1, 13)),
+            "weekday": [7],
+            "tz": "UTC",
+            "command": "/usr/bin/find / -name x",
+            "next_run": "2022-01-02T00:00:00+00:00",
+        },
+        {
+            "line": 3,
+            "expression": "*/15 0 1,15 * 1-5",
+            "error": "Crontab expression must be of 6 fields, Received: 5",
+        },
+        {
+            "line": 4,
+            "minute": [0],
+            "hour": [12],
+            "monthday": [1],
+            "month": [1],
+            "weekday": list(range(1, 8)),
+            "tz": "UTC",
+            "command": "/usr/bin/find",
+            "next_run": "2022-01-01T12:00:00+00:00",
+        },
+    ] == [json.loads(line) for line in result.output.splitlines()]
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_bulk_command__matches_batch(workers, typer_runner):
+    """
+    Given many cron expressions expect the same records, in the same order, as the
+    batch command regardless of the number of workers.
+    """
+    expressions = "\n".join(
+        [
+            "@weekly /usr/bin/find / -name x",
+            "*/15 0 1,15 * 1-5",
+            "0 12 1 JAN * /usr/bin/find",
+        ]
+        * 5
+    )
+    now = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+    with time_machine.travel(now, tick=False):
+        batch = typer_runner(cli, ["batch"], input=expressions)
+        result = typer_runner(
+            cli,
+            ["bulk", "--workers", workers, "--chunk-size", "2"],
+            input=expressions,
+        )
+
+    assert 1 == result.exit_code
+    assert batch.output == result.output
+
+
+def test_batch_command__file(typer_runner, tmp_path):
+    """
+    Given a file of valid cron expressions expect every record to be output and a
+    successful exit code.
+    """
+    path = tmp_path / "expressions.txt"
+    path.write_text("@daily /usr/bin/find\n@hourly /usr/bin/find\n" * 3)
+
+    result = typer_runner(cli, ["batch", str(path), "--chunk-size", "4"])
+
+    assert 0 == result.exit_code
+    assert [1, 2, 3, 4, 5, 6] == [
+        json.loads(line)["line"] for line in result.output.splitlines()
+    ]
+
+
+@time_machine.travel(
+    dt.datetime(
+        year=2022, month=1, day=1, hour=1, minute=1, second=1, tzinfo=dt.timezone.utc
+    )
+)
+def test_parse_command__zones_output(typer_runner):
+    """
+    Given IANA timezones expect the next run to also be output in each of them.
+    """
+    result = typer_runner(
+        cli,
+        [
+            "parse",
+            "0 9 * * MON-FRI /usr/bin/find",
+            "--tz",
+            "Europe/London",
+            "--tz",
+            "Asia/Tokyo",
+        ],
+    )
+
+    assert 0 == result.exit_code
+    assert dedent("""
+            ╭─ Next Scheduled Run by Zone ─────────────────────────────────────────────────╮
+            │ Europe/London        2022-01-03T09:00:00+00:00 (in 2 days, 7 hours, 58       │
+            │ minutes and 58 seconds)                                                      │
+            │ Asia/Tokyo           2022-01-03T09:00:00+09:00 (in 1 day, 22 hours, 58       │
+            │ minutes and 58 seconds)                                                      │
+            ╰──────────────────────────────────────────────────────────────────────────────╯
+            """).strip() in result.output
+
+
+def test_parse_command__invalid_zone(typer_runner):
+    """
+    Given an unknown timezone expect a usage error.
+    """
+    result = typer_runner(
+        cli, ["parse", "0 9 * * MON-FRI /usr/bin/find", "--tz", "Europe/Nowhere"]
+    )
+
+    assert 2 == result.exit_code
+    assert "'Europe/Nowhere' is not a valid IANA timezone" in result.output
+
+
+def test_parse_command__stats(typer_runner):
+    """
+    Given the stats flag, expect the wall time and counters to be output.
+    """
+    result = typer_runner(cli, ["parse", "0 0 29 2 1 /usr/bin/find", "--stats"])
+
+    assert 0 == result.exit_code
+    assert "Stats" in result.output
+    assert "Wall Time" in result.output
+    assert "Parses               1" in result.output
+    assert "Years Rolled" in result.output
+
+
+def test_load_command__peaks(typer_runner):
+    """
+    Given many cron expressions expect the busiest minutes with the lines firing in
+    them, with invalid expressions reported and an exit code of 1.
+    """
+    expressions = "\n".join(
+        [
+            "*/30 * * * * /usr/bin/find",
+            "0 * * * * /usr/bin/find",
+            "61 * * * * /usr/bin/find",
+            "0 0 * * * /usr/bin/find",
+        ]
+    )
+    now = dt.datetime(2022, 1, 1, 0, 0, 30, tzinfo=dt.timezone.utc)
+    with time_machine.travel(now, tick=False):
+        result = typer_runner(
+            cli, ["load", "--days", "1", "--top", "2"], input=expressions
+        )
+
+    assert 1 == result.exit_code
+    assert [
+        "Line 3: Minute value must be in range of [0, 59]",
+        "╭─ Peak Load ──────────────────────────────────────╮",
+        "│ 2022-01-02T00:00:00+00:00       3  lines 1, 2, 4 │",
+        "│ 2022-01-01T01:00:00+00:00       2  lines 1, 2    │",
+        "╰─ 3 schedules over 1 days ────────────────────────╯",
+    ] == [line.rstrip() for line in result.output.splitlines()]
+
+
+def test_rebalance_command(typer_runner):
+    """
+    Given cron expressions firing at the same minute expect them to be spread out,
+    with invalid expressions reported and an exit code of 1.
+    """
+    expressions = "\n".join(
+        [
+            "0 * * * * /usr/bin/a",
+            "0 * * * * /usr/bin/b",
+            "61 * * * * /usr/bin/c",
+            "*/30 * * * * /usr/bin/d",
+        ]
+    )
+    result = typer_runner(cli, ["rebalance"], input=expressions)
+
+    assert 1 == result.exit_code
+    assert [
+        "Line 3: Minute value must be in range of [0, 59]",
+        "1 * * * * /usr/bin/a",
+        "59 * * * * /usr/bin/b",
+        "0,30 * * * * /usr/bin/d",
+        "Peak load 3 -> 1",
+    ] == result.output.splitlines()
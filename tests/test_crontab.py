@@ -1,10 +1,35 @@
 from __future__ import annotations
 
+import calendar
+import dataclasses
 import datetime as dt
+import itertools
+import pickle
+import sys
 
 import pytest
 
-from croninfo.crontab import Crontab
+from croninfo.crontab import (
+    MAX_YEAR,
+    CacheInfo,
+    CronPartHour,
+    CronPartMinute,
+    CronPartMonth,
+    CronPartMonthday,
+    CronPartWeekday,
+    Crontab,
+    ScheduleCache,
+    local_fields,
+    mask_values,
+    match_many,
+    year_days_mask,
+)
+
+# Backports is required for Python versions <3.9
+if sys.version_info >= (3, 9):
+    import zoneinfo
+else:
+    from backports import zoneinfo
 
 
 @pytest.mark.parametrize(
@@ -256,6 +281,21 @@ def test_crontab_parse__valid(expr, expected):
             ValueError,
             r"Crontab expression must be of 6 fields, Received: 4",
         ),
+        (
+            "0 0 31 2 * /usr/bin/find",
+            ValueError,
+            r"Crontab expression can never run, no month contains the day\(s\) of month \[31\]",
+        ),
+        (
+            "0 0 30,31 2 * /usr/bin/find",
+            ValueError,
+            r"Crontab expression can never run, no month contains the day\(s\) of month \[30, 31\]",
+        ),
+        (
+            "0 0 31 APR,JUN,SEP,NOV * /usr/bin/find",
+            ValueError,
+            r"Crontab expression can never run, no month contains the day\(s\) of month \[31\]",
+        ),
     ],
 )
 def test_crontab_parse__invalid(expr, exc, expected):
@@ -264,3 +304,803 @@ def test_crontab_parse__invalid(expr, exc, expected):
     """
     with pytest.raises(exc, match=expected):
         Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "part_cls, expr, expected",
+    [
+        (CronPartMinute, "*/15", [0, 15, 30, 45]),
+        (CronPartMinute, "59,0,30", [0, 30, 59]),
+        (CronPartHour, "6-8,10-12", [6, 7, 8, 10, 11, 12]),
+        (CronPartMonth, "JAN-DEC/2", [1, 3, 5, 7, 9, 11]),
+        (CronPartWeekday, "SUN,TUE-fri", [2, 3, 4, 5, 7]),
+    ],
+)
+def test_cron_part__bitmask(part_cls, expr, expected):
+    """
+    Given any valid part expression expect the bitmask to expand to sorted values
+    with constant time membership.
+    """
+    part = part_cls.from_expr(expr)
+
+    assert expected == list(part)
+    assert expected[::-1] == list(reversed(part))
+    assert len(expected) == len(part)
+    assert all(x in part for x in expected)
+    assert not any(
+        x in part
+        for x in range(part.min_value, part.max_value + 1)
+        if x not in expected
+    )
+    assert part == part_cls.from_values(expected)
+    assert hash(part) == hash(part_cls.from_values(expected))
+
+
+@pytest.mark.parametrize(
+    "part_cls, expr, expected",
+    [
+        (CronPartMinute, "0-59", "*"),
+        (CronPartMinute, "*/15", "*/15"),
+        (CronPartMinute, "5-59/15", "5-50/15"),
+        (CronPartMinute, "0,30", "0,30"),
+        (CronPartHour, "1,2,3,7,9,10", "1-3,7,9,10"),
+        (CronPartMonth, "JAN-MAY", "1-5"),
+        (CronPartWeekday, "SUN", "7"),
+    ],
+)
+def test_cron_part__to_expr(part_cls, expr, expected):
+    """
+    Given any valid part expression expect the shortest equivalent expression which
+    parses back to the same part.
+    """
+    part = part_cls.from_expr(expr)
+
+    assert expected == part.to_expr()
+    assert part == part_cls.from_expr(part.to_expr())
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (-1, 0),
+        (0, 0),
+        (1, 15),
+        (15, 15),
+        (46, None),
+        (60, None),
+    ],
+)
+def test_cron_part__next_value(value, expected):
+    """
+    Given any value expect the next set value at or after it to be returned.
+    """
+    part = CronPartMinute.from_expr("*/15")
+    assert expected == part.next_value(value)
+
+
+def test_cron_part__compact():
+    """
+    Cron parts should only carry their bitmask and survive a pickle round trip.
+    """
+    part = CronPartMinute.from_expr("*/15")
+
+    assert not hasattr(part, "__dict__")
+    assert part == pickle.loads(pickle.dumps(part))
+
+
+@pytest.mark.parametrize(
+    "expr, start, expected",
+    [
+        (
+            "* * * * * /usr/bin/find",
+            dt.datetime(2022, 1, 1, 1, 1, 1),
+            dt.datetime(2022, 1, 1, 1, 1),
+        ),
+        (
+            "0 0 29 2 1 /usr/bin/find",
+            dt.datetime(2022, 1, 1),
+            dt.datetime(2044, 2, 29),
+        ),
+        (
+            "30 23 31 * * /usr/bin/find",
+            dt.datetime(2022, 4, 1),
+            dt.datetime(2022, 5, 31, 23, 30),
+        ),
+        (
+            "59 23 31 12 * /usr/bin/find",
+            dt.datetime(2022, 12, 31, 23, 59, 30),
+            dt.datetime(2022, 12, 31, 23, 59),
+        ),
+        (
+            "0 0 1 1 * /usr/bin/find",
+            dt.datetime(2022, 12, 31, 23, 59),
+            dt.datetime(2023, 1, 1),
+        ),
+        (
+            "18-25 1-2 1 JAN-DEC/2 SUN,TUE-fri /usr/bin/find",
+            dt.datetime(2022, 1, 1, 1, 1, 1),
+            dt.datetime(2022, 3, 1, 1, 18),
+        ),
+        (
+            "0 9 * 11,7 4 /usr/bin/find",
+            dt.datetime(2020, 7, 14, 19, 48),
+            dt.datetime(2020, 7, 16, 9),
+        ),
+    ],
+)
+def test_crontab_next_run(expr, start, expected):
+    """
+    Given any valid cron expression expect the next run to be solved directly
+    and agree with the first iterated schedule.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    start = start.replace(tzinfo=dt.timezone.utc)
+    expected = expected.replace(tzinfo=dt.timezone.utc)
+
+    assert expected == crontab.next_run(start)
+    assert expected == next(crontab.iter(start))
+
+
+def test_crontab_next_run__none():
+    """
+    Given a cron expression which can never run expect no schedules.
+    """
+    crontab = dataclasses.replace(
+        Crontab.from_parse(expr="0 0 * 2 * /usr/bin/find", tz=dt.timezone.utc),
+        monthday=CronPartMonthday.from_expr("31"),
+    )
+    start = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+
+    assert not crontab.is_satisfiable
+    assert crontab.next_possible_year(2022) is None
+    with pytest.raises(StopIteration):
+        crontab.next_run(start)
+    with pytest.raises(StopIteration):
+        crontab.previous_run(start)
+    assert [] == list(crontab.iter(start))
+    assert [] == list(crontab.iter_previous(start))
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "*/7 */5 * * * /usr/bin/find",
+        "15 6 1,15,31 * 1-5 /usr/bin/find",
+        "0 12 * 2 SAT,SUN /usr/bin/find",
+        "45 23 28-31 * * /usr/bin/find",
+    ],
+)
+def test_crontab_next_run__matches_iter(expr):
+    """
+    Chaining next_run from one minute after each schedule should produce the
+    same schedules as iter.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    start = dt.datetime(2023, 12, 30, 22, 13, tzinfo=dt.timezone.utc)
+
+    expected = list(itertools.islice(crontab.iter(start), 500))
+    result = []
+    cursor = start
+    for _ in range(500):
+        cursor = crontab.next_run(cursor)
+        result.append(cursor)
+        cursor += dt.timedelta(minutes=1)
+
+    assert expected == result
+
+
+@pytest.mark.parametrize(
+    "expr, start, expected",
+    [
+        (
+            "* * * * * /usr/bin/find",
+            dt.datetime(2022, 1, 1, 1, 1, 1),
+            dt.datetime(2022, 1, 1, 1, 1),
+        ),
+        (
+            "0 0 29 2 1 /usr/bin/find",
+            dt.datetime(2043, 1, 1),
+            dt.datetime(2016, 2, 29),
+        ),
+        (
+            "30 23 31 * * /usr/bin/find",
+            dt.datetime(2022, 7, 1),
+            dt.datetime(2022, 5, 31, 23, 30),
+        ),
+        (
+            "0 0 1 1 * /usr/bin/find",
+            dt.datetime(2022, 12, 31, 23, 59),
+            dt.datetime(2022, 1, 1),
+        ),
+        (
+            "59 23 31 12 * /usr/bin/find",
+            dt.datetime(2023, 1, 1),
+            dt.datetime(2022, 12, 31, 23, 59),
+        ),
+        (
+            "15 10-12 * * SAT /usr/bin/find",
+            dt.datetime(2022, 1, 3, 10, 14),
+            dt.datetime(2022, 1, 1, 12, 15),
+        ),
+    ],
+)
+def test_crontab_previous_run(expr, start, expected):
+    """
+    Given any valid cron expression expect the previous run to be solved directly
+    and agree with the first schedule iterated backwards.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    start = start.replace(tzinfo=dt.timezone.utc)
+    expected = expected.replace(tzinfo=dt.timezone.utc)
+
+    assert expected == crontab.previous_run(start)
+    assert expected == next(crontab.iter_previous(start))
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "*/7 */5 * * * /usr/bin/find",
+        "15 6 1,15,31 * 1-5 /usr/bin/find",
+        "0 12 29 2 * /usr/bin/find",
+        "45 23 28-31 * * /usr/bin/find",
+    ],
+)
+def test_crontab_iter_previous__matches_iter(expr):
+    """
+    Iterating backwards should produce the same schedules as iterating forwards
+    over the same window, in reverse.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    start = dt.datetime(2024, 3, 1, 0, 0, tzinfo=dt.timezone.utc)
+
+    result = list(itertools.islice(crontab.iter_previous(start), 500))
+    expected = list(itertools.takewhile(lambda x: x <= start, crontab.iter(result[-1])))
+
+    assert expected[::-1] == result
+
+
+def test_crontab_parse__cache():
+    """
+    Given a cache expect schedules to be shared between equivalent expressions with
+    only the command differing.
+    """
+    cache = ScheduleCache(maxsize=2)
+
+    first = Crontab.from_parse(
+        expr="0 0 * jan * /usr/bin/find", tz=dt.timezone.utc, cache=cache
+    )
+    second = Crontab.from_parse(
+        expr="0  0 * JAN * /usr/bin/find", tz=dt.timezone.utc, cache=cache
+    )
+    third = Crontab.from_parse(
+        expr="0 0 * JAN * /usr/bin/true", tz=dt.timezone.utc, cache=cache
+    )
+
+    assert first is second
+    assert "/usr/bin/true" == third.command
+    assert first.month is third.month
+    assert CacheInfo(hits=2, misses=1, maxsize=2, currsize=1) == cache.info()
+    assert first == Crontab.from_parse(
+        expr="0 0 * JAN * /usr/bin/find", tz=dt.timezone.utc
+    )
+
+
+def test_crontab_parse__cache_keyed_by_tz():
+    """
+    The same expression in different timezones should be cached separately.
+    """
+    cache = ScheduleCache()
+    tz = dt.timezone(dt.timedelta(hours=1))
+
+    utc = Crontab.from_parse(
+        expr="@daily /usr/bin/find", tz=dt.timezone.utc, cache=cache
+    )
+    offset = Crontab.from_parse(expr="@daily /usr/bin/find", tz=tz, cache=cache)
+
+    assert utc.tz != offset.tz
+    assert 2 == cache.info().misses
+
+
+def test_crontab_parse__cache_eviction():
+    """
+    The least recently used schedule should be evicted once the cache is full and
+    clearing should reset the cache entirely.
+    """
+    cache = ScheduleCache(maxsize=2)
+    for expr in ["@daily x", "@hourly x", "@daily x", "@weekly x", "@hourly x"]:
+        Crontab.from_parse(expr=expr, tz=dt.timezone.utc, cache=cache)
+
+    assert CacheInfo(hits=1, misses=4, maxsize=2, currsize=2) == cache.info()
+
+    cache.clear()
+    assert CacheInfo(hits=0, misses=0, maxsize=2, currsize=0) == cache.info()
+
+
+def test_crontab_parse__cache_invalid_size():
+    """
+    A cache must be able to hold at least one schedule.
+    """
+    with pytest.raises(ValueError, match="ScheduleCache maxsize must be >= 1"):
+        ScheduleCache(maxsize=0)
+
+
+def test_crontab__hashable():
+    """
+    Parsed crontabs are immutable and should be usable as set members.
+    """
+    crontabs = {
+        Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+        for expr in ["@daily x", "0 0 * * * x", "@hourly x"]
+    }
+    assert 2 == len(crontabs)
+
+
+@pytest.mark.parametrize(
+    "expr, expected",
+    [
+        ("* * * * * /usr/bin/find / -name x", "/usr/bin/find / -name x"),
+        ("* * * * *   echo  'a  b'  ", "echo  'a  b'"),
+        ("@daily /usr/bin/find / -name x", "/usr/bin/find / -name x"),
+    ],
+)
+def test_crontab_parse__command(expr, expected):
+    """
+    Given a command containing whitespace expect it to be kept intact.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    assert expected == crontab.command
+
+
+@pytest.mark.parametrize(
+    "expr, expected",
+    [
+        ("@daily /usr/bin/find", "0 0 * * * /usr/bin/find"),
+        ("*/20 9-17 * * MON-FRI echo  'a  b'", "*/20 9-17 * * 1-5 echo  'a  b'"),
+    ],
+)
+def test_crontab_to_expr(expr, expected):
+    """
+    Given any valid expression expect an equivalent expression including the command.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+
+    assert expected == crontab.to_expr()
+    assert crontab == Crontab.from_parse(expr=crontab.to_expr(), tz=crontab.tz)
+
+
+@pytest.mark.parametrize(
+    "expr, expected",
+    [
+        ("", "Crontab expression must be of 6 fields, Received: 0"),
+        ("@daily", "Crontab expression must be of 6 fields, Received: 5"),
+    ],
+)
+def test_crontab_parse__missing_command(expr, expected):
+    """
+    Given an expression without a command expect a ValueError.
+    """
+    with pytest.raises(ValueError, match=expected):
+        Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "expr, ts, expected",
+    [
+        ("* * * * * /usr/bin/find", dt.datetime(2022, 1, 1, 1, 1, 59), True),
+        ("*/15 9-17 * * MON-FRI /usr/bin/find", dt.datetime(2022, 1, 3, 9, 45), True),
+        ("*/15 9-17 * * MON-FRI /usr/bin/find", dt.datetime(2022, 1, 2, 9, 45), False),
+        ("*/15 9-17 * * MON-FRI /usr/bin/find", dt.datetime(2022, 1, 3, 18, 0), False),
+        ("*/15 9-17 * * MON-FRI /usr/bin/find", dt.datetime(2022, 1, 3, 9, 46), False),
+        ("0 0 29 2 * /usr/bin/find", dt.datetime(2024, 2, 29), True),
+        ("0 0 29 2 * /usr/bin/find", dt.datetime(2024, 3, 29), False),
+    ],
+)
+def test_crontab_matches(expr, ts, expected):
+    """
+    Given any timestamp expect whether the crontab fires at that minute.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    ts = ts.replace(tzinfo=dt.timezone.utc)
+
+    assert expected is crontab.matches(ts)
+    assert [expected] == crontab.matches_many([ts])
+    assert [expected] == match_many([crontab], ts)
+
+
+@pytest.mark.parametrize(
+    "tz",
+    [dt.timezone.utc, dt.timezone(dt.timedelta(hours=2)), zoneinfo.ZoneInfo("UTC")],
+)
+def test_crontab_matches__naive(tz):
+    """
+    Given a naive timestamp expect a ValueError, instead of it being read in the
+    system's local timezone.
+    """
+    crontab = Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=tz)
+    ts = dt.datetime(2022, 1, 1)
+
+    with pytest.raises(ValueError, match="must be timezone aware"):
+        crontab.matches(ts)
+    with pytest.raises(ValueError, match="must be timezone aware"):
+        crontab.matches_many([ts])
+    with pytest.raises(ValueError, match="must be timezone aware"):
+        match_many([crontab], ts)
+
+
+@pytest.mark.parametrize(
+    "tz",
+    [
+        dt.timezone(dt.timedelta(hours=-9, minutes=-30)),
+        zoneinfo.ZoneInfo("Europe/London"),
+        zoneinfo.ZoneInfo("Australia/Lord_Howe"),
+        zoneinfo.ZoneInfo("America/St_Johns"),
+        zoneinfo.ZoneInfo("Pacific/Apia"),
+    ],
+)
+@pytest.mark.parametrize("year", [1970, 2011, 2022, 2098])
+def test_local_fields(tz, year):
+    """
+    Given timestamps throughout a year, including across DST transitions, expect the
+    same fields as converting them with astimezone.
+    """
+    start = dt.datetime(year, 1, 1, tzinfo=dt.timezone.utc) - dt.timedelta(days=1)
+    for x in range(0, 60 * 24 * 368, 29):
+        ts = start + dt.timedelta(minutes=x, seconds=59)
+        local = ts.astimezone(tz)
+        assert (
+            local.minute,
+            local.hour,
+            local.day,
+            local.month,
+            local.isoweekday(),
+        ) == local_fields(ts, tz)
+
+
+@pytest.mark.parametrize(
+    "tz",
+    [
+        dt.timezone.utc,
+        dt.timezone(dt.timedelta(hours=5, minutes=30)),
+        dt.timezone(-dt.timedelta(hours=9)),
+        zoneinfo.ZoneInfo("Europe/London"),
+    ],
+)
+def test_crontab_matches__timezone(tz):
+    """
+    Timestamps should be compared in the crontab's timezone regardless of their own.
+    """
+    crontab = Crontab.from_parse(expr="*/20 1,13 1-7 * MON /usr/bin/find", tz=tz)
+    start = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+    timestamps = [start + dt.timedelta(minutes=x) for x in range(0, 60 * 24 * 120, 10)]
+
+    expected = set(
+        itertools.takewhile(lambda x: x <= timestamps[-1], crontab.iter(start))
+    )
+
+    assert [x in expected for x in timestamps] == crontab.matches_many(timestamps)
+
+
+def test_match_many():
+    """
+    Given a timestamp expect it to be checked against each crontab in its timezone.
+    """
+    ts = dt.datetime(2022, 1, 3, 9, 0, tzinfo=dt.timezone.utc)
+    crontabs = [
+        Crontab.from_parse(expr="0 9 * * * /usr/bin/find", tz=dt.timezone.utc),
+        Crontab.from_parse(
+            expr="0 9 * * * /usr/bin/find", tz=zoneinfo.ZoneInfo("Europe/Berlin")
+        ),
+        Crontab.from_parse(
+            expr="0 10 * * * /usr/bin/find", tz=zoneinfo.ZoneInfo("Europe/Berlin")
+        ),
+        Crontab.from_parse(expr="0 9 * * SUN /usr/bin/find", tz=dt.timezone.utc),
+    ]
+
+    assert [True, False, True, False] == match_many(crontabs, ts)
+
+
+@pytest.mark.parametrize(
+    "expr, start, end, expected",
+    [
+        (
+            "* * * * * /usr/bin/find",
+            dt.datetime(2022, 1, 1),
+            dt.datetime(2022, 4, 1),
+            90 * 24 * 60,
+        ),
+        (
+            "* * * * * /usr/bin/find",
+            dt.datetime(2022, 1, 1, 1, 1, 30),
+            dt.datetime(2022, 1, 1, 1, 2, 30),
+            2,
+        ),
+        (
+            "*/15 9-17 * * MON-FRI /usr/bin/find",
+            dt.datetime(2022, 1, 3, 9, 46),
+            dt.datetime(2022, 1, 3, 17, 15),
+            29,
+        ),
+        (
+            "0 0 29 2 * /usr/bin/find",
+            dt.datetime(2000, 1, 1),
+            dt.datetime(2800, 1, 1),
+            194,
+        ),
+        (
+            "@daily /usr/bin/find",
+            dt.datetime(2022, 1, 1),
+            dt.datetime(2022, 1, 1),
+            0,
+        ),
+        (
+            "@daily /usr/bin/find",
+            dt.datetime(2022, 1, 2),
+            dt.datetime(2022, 1, 1),
+            0,
+        ),
+    ],
+)
+def test_crontab_count_between(expr, start, end, expected):
+    """
+    Given any window expect the number of schedules within it.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    start = start.replace(tzinfo=dt.timezone.utc)
+    end = end.replace(tzinfo=dt.timezone.utc)
+
+    assert expected == crontab.count_between(start, end)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "*/7 */5 * * * /usr/bin/find",
+        "15 6 1,15,31 * 1-5 /usr/bin/find",
+        "0 12 29 2 * /usr/bin/find",
+        "45 23 28-31 JAN,DEC * /usr/bin/find",
+    ],
+)
+def test_crontab_count_between__matches_iter(expr):
+    """
+    Counting should agree with enumerating the schedules over the same window.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    start = dt.datetime(2023, 12, 30, 22, 13, 20, tzinfo=dt.timezone.utc)
+    end = dt.datetime(2028, 3, 1, 6, 15, 1, tzinfo=dt.timezone.utc)
+
+    expected = len(list(itertools.takewhile(lambda x: x < end, crontab.iter(start))))
+
+    assert expected == crontab.count_between(start, end)
+
+
+@pytest.mark.parametrize(
+    "expr, year, expected",
+    [
+        ("@daily /usr/bin/find", 2022, 2022),
+        ("0 0 29 2 * /usr/bin/find", 2022, 2024),
+        ("0 0 29 2 MON /usr/bin/find", 2022, 2044),
+        ("0 0 29 2 MON /usr/bin/find", 2044, 2044),
+        ("0 0 29 2 MON /usr/bin/find", 2045, 2072),
+        ("0 0 29 2 MON /usr/bin/find", 2098, None),
+    ],
+)
+def test_crontab_next_possible_year(expr, year, expected):
+    """
+    Given a rare schedule expect the first year it can run in.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+
+    assert crontab.is_satisfiable
+    assert expected == crontab.next_possible_year(year)
+
+
+@pytest.mark.parametrize(
+    "expr, start, expected",
+    [
+        (
+            "15 0-3 * * * /usr/bin/find",
+            dt.datetime(2022, 3, 26, 23, 0),
+            [
+                "2022-03-27T00:15:00+00:00",
+                "2022-03-27T02:00:00+01:00",
+                "2022-03-27T02:15:00+01:00",
+                "2022-03-27T03:15:00+01:00",
+            ],
+        ),
+        (
+            "*/30 1-2 * * * /usr/bin/find",
+            dt.datetime(2022, 3, 26, 23, 0),
+            [
+                "2022-03-27T02:00:00+01:00",
+                "2022-03-27T02:30:00+01:00",
+                "2022-03-28T01:00:00+01:00",
+            ],
+        ),
+        (
+            "15 0-3 * * * /usr/bin/find",
+            dt.datetime(2022, 10, 29, 23, 0),
+            [
+                "2022-10-30T00:15:00+01:00",
+                "2022-10-30T01:15:00+01:00",
+                "2022-10-30T02:15:00+00:00",
+                "2022-10-30T03:15:00+00:00",
+            ],
+        ),
+        # Anchored on the second occurrence of a repeated hour.
+        (
+            "30 1 * * * /usr/bin/find",
+            dt.datetime(2022, 10, 30, 1, 10),
+            ["2022-10-31T01:30:00+00:00"],
+        ),
+        # Anchored just after clocks spring forward.
+        (
+            "30 1 * * * /usr/bin/find",
+            dt.datetime(2022, 3, 27, 1, 0, 10),
+            ["2022-03-27T02:00:00+01:00"],
+        ),
+    ],
+)
+def test_crontab_iter__dst_aware(expr, start, expected):
+    """
+    Given a zone with DST expect skipped schedules to run once after the transition
+    and repeated schedules to run once on their first occurrence.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=zoneinfo.ZoneInfo("Europe/London"))
+    start = start.replace(tzinfo=dt.timezone.utc)
+
+    result = itertools.islice(crontab.iter(start, dst_aware=True), len(expected))
+    assert expected == [x.isoformat() for x in result]
+
+
+def test_crontab_iter__dst_aware_fixed_offset():
+    """
+    Without transitions DST aware iteration should match wall clock iteration.
+    """
+    crontab = Crontab.from_parse(expr="*/7 */5 * * * /usr/bin/find", tz=dt.timezone.utc)
+    start = dt.datetime(2022, 3, 26, 23, 0, tzinfo=dt.timezone.utc)
+
+    assert list(itertools.islice(crontab.iter(start), 500)) == list(
+        itertools.islice(crontab.iter(start, dst_aware=True), 500)
+    )
+
+
+def test_crontab_next_run_in_zones():
+    """
+    Given many timezones expect the next run in each to match parsing the
+    expression in that timezone.
+    """
+    expr = "0 9 * * MON-FRI /usr/bin/find"
+    start = dt.datetime(2022, 3, 27, 0, 30, tzinfo=dt.timezone.utc)
+    zones = [
+        dt.timezone.utc,
+        zoneinfo.ZoneInfo("Europe/London"),
+        zoneinfo.ZoneInfo("Europe/Berlin"),
+        zoneinfo.ZoneInfo("Asia/Tokyo"),
+        zoneinfo.ZoneInfo("America/New_York"),
+        zoneinfo.ZoneInfo("Pacific/Kiritimati"),
+    ]
+
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    result = crontab.next_run_in_zones(zones, start)
+
+    assert zones == list(result)
+    for zone in zones:
+        expected = Crontab.from_parse(expr=expr, tz=zone).next_run(start)
+        assert expected == result[zone]
+        assert zone is result[zone].tzinfo
+
+
+@pytest.mark.parametrize(
+    "expr, end, limit, expected",
+    [
+        (
+            "*/15 * * * * /usr/bin/find",
+            dt.datetime(2022, 1, 1, 0, 45, tzinfo=dt.timezone.utc),
+            None,
+            ["2022-01-01T00:15:00+00:00", "2022-01-01T00:30:00+00:00"],
+        ),
+        (
+            "*/15 * * * * /usr/bin/find",
+            None,
+            3,
+            [
+                "2022-01-01T00:15:00+00:00",
+                "2022-01-01T00:30:00+00:00",
+                "2022-01-01T00:45:00+00:00",
+            ],
+        ),
+        (
+            "0 12 29 2 * /usr/bin/find",
+            dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc),
+            10,
+            ["2024-02-29T12:00:00+00:00"],
+        ),
+    ],
+)
+def test_crontab_iter__end_limit(expr, end, limit, expected):
+    """
+    Given an end and a limit expect schedules before the end, up to the limit.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    start = dt.datetime(2022, 1, 1, 0, 1, tzinfo=dt.timezone.utc)
+
+    result = crontab.iter(start, end, limit=limit)
+
+    assert expected == [x.isoformat() for x in result]
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "*/7 */5 * * * /usr/bin/find",
+        "15 6 1,15,31 * 1-5 /usr/bin/find",
+        "0 12 29 2 * /usr/bin/find",
+        "*/20 1-2 * * SUN /usr/bin/find",
+    ],
+)
+@pytest.mark.parametrize("dst_aware", [False, True])
+def test_crontab_nth_run__matches_iter(expr, dst_aware):
+    """
+    The nth run should agree with enumerating the schedules, including across DST
+    transitions.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=zoneinfo.ZoneInfo("Europe/London"))
+    start = dt.datetime(2023, 12, 30, 22, 13, 20, tzinfo=dt.timezone.utc)
+
+    expected = list(itertools.islice(crontab.iter(start, dst_aware=dst_aware), 2000))
+
+    # Sparse expressions have fewer schedules before MAX_YEAR.
+    for n in [0, 1, len(expected) // 3, len(expected) // 2, len(expected) - 1]:
+        assert expected[n] == crontab.nth_run(n, start, dst_aware=dst_aware)
+
+
+def test_crontab_nth_run__invalid():
+    """
+    Given a negative n expect a ValueError, and StopIteration past the last schedule.
+    """
+    crontab = Crontab.from_parse(expr="0 0 1 1 * /usr/bin/find", tz=dt.timezone.utc)
+    start = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+
+    with pytest.raises(ValueError, match="must not be negative"):
+        crontab.nth_run(-1, start)
+    with pytest.raises(StopIteration, match="no future schedule"):
+        crontab.nth_run(MAX_YEAR - 2022, start)
+    assert dt.datetime(MAX_YEAR - 1, 1, 1, tzinfo=dt.timezone.utc) == crontab.nth_run(
+        MAX_YEAR - 2023, start
+    )
+
+
+@pytest.mark.parametrize("year", [1900, 2000, 2022, 2024])
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "0 0 * * * /usr/bin/find",
+        "0 0 13 * * /usr/bin/find",
+        "0 0 * * 5 /usr/bin/find",
+        "0 0 13 * 5 /usr/bin/find",
+        "0 0 29-31 2,4 * /usr/bin/find",
+        "0 0 1-7 */3 0 /usr/bin/find",
+    ],
+)
+def test_year_days_mask(year, expr):
+    """
+    Given leap, non-leap and century years expect the days of the year matching the
+    month, day of month and day of week, where a day must match both day fields so
+    "*" in either leaves it to the other.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    expected = [
+        dt.date(year, month, day).timetuple().tm_yday
+        for month in range(1, 13)
+        for day, weekday in calendar.Calendar().itermonthdays2(year, month)
+        if day
+        and month in crontab.month
+        and day in crontab.monthday
+        and weekday + 1 in crontab.weekday
+    ]
+
+    mask = year_days_mask(
+        year, crontab.month.mask, crontab.monthday.mask, crontab.weekday.mask
+    )
+    assert expected == list(mask_values(mask))
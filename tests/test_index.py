@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+
+import pytest
+
+from croninfo.crontab import Crontab
+from croninfo.index import ScheduleIndex
+
+# Backports is required for Python versions <3.9
+if sys.version_info >= (3, 9):
+    import zoneinfo
+else:
+    from backports import zoneinfo
+
+START = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+LONDON = zoneinfo.ZoneInfo("Europe/London")
+
+
+@pytest.mark.parametrize(
+    "ts, expected",
+    [
+        (START, [0, 1, 2, 3]),
+        (START.replace(minute=15), [0]),
+        # Saturday 1st and Monday 3rd January.
+        (START.replace(hour=9, minute=30), [0, 3]),
+        (START.replace(day=3, hour=9, minute=30), [0, 3, 4]),
+        # London is UTC+1 in July.
+        (START.replace(month=7, day=4, hour=8, minute=30), [0, 3, 4, 5]),
+    ],
+)
+def test_schedule_index__matching(ts, expected):
+    """
+    Given schedules across timezones expect the keys of those which fire at the
+    minute of the timestamp.
+    """
+    crontabs = [
+        Crontab.from_parse(expr="* * * * * /usr/bin/a", tz=dt.timezone.utc),
+        Crontab.from_parse(expr="@daily /usr/bin/b", tz=dt.timezone.utc),
+        Crontab.from_parse(expr="0 0 1 JAN * /usr/bin/c", tz=dt.timezone.utc),
+        Crontab.from_parse(expr="*/30 * * * * /usr/bin/d", tz=LONDON),
+        Crontab.from_parse(expr="30 9 * * MON-FRI /usr/bin/e", tz=LONDON),
+        Crontab.from_parse(expr="30 9 4 JUL * /usr/bin/f", tz=LONDON),
+    ]
+
+    index = ScheduleIndex(crontabs)
+
+    assert expected == sorted(index.matching(ts.replace(second=45)))
+    assert expected == [
+        key for key, crontab in enumerate(crontabs) if crontab.matches(ts)
+    ]
+
+
+def test_schedule_index__add_remove():
+    """
+    Given schedules added and removed after the index is built expect only those
+    remaining to match, with the slots of removed schedules reused.
+    """
+    crontab = Crontab.from_parse(expr="0 * * * * /usr/bin/find", tz=dt.timezone.utc)
+    index = ScheduleIndex([crontab] * 3)
+
+    index.remove(1)
+    added = index.add(crontab)
+    keys = index.update([crontab, crontab])
+
+    assert [3] == [added]
+    assert [4, 5] == keys
+    assert 1 not in index
+    assert 5 == len(index)
+    assert crontab is index[added]
+    assert [0, 2, 3, 4, 5] == sorted(index.matching(START))
+    assert [] == index.matching(START.replace(minute=1))
+    with pytest.raises(KeyError):
+        index.remove(1)
+
+
+def test_schedule_index__many():
+    """
+    Given more schedules than are applied individually expect the same keys as
+    checking each schedule.
+    """
+    crontabs = [
+        Crontab.from_parse(expr=f"{i % 60} */{i % 5 + 1} * * * /x", tz=dt.timezone.utc)
+        for i in range(1000)
+    ]
+    index = ScheduleIndex(crontabs)
+
+    for hour in range(4):
+        ts = START.replace(hour=hour, minute=12)
+        assert [i for i, x in enumerate(crontabs) if x.matches(ts)] == sorted(
+            index.matching(ts)
+        )
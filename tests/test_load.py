@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import collections
+import datetime as dt
+import sys
+
+import pytest
+
+from croninfo.crontab import Crontab
+from croninfo.load import LoadHistogram, Peak
+
+# Backports is required for Python versions <3.9
+if sys.version_info >= (3, 9):
+    import zoneinfo
+else:
+    from backports import zoneinfo
+
+LONDON = zoneinfo.ZoneInfo("Europe/London")
+NEW_YORK = zoneinfo.ZoneInfo("America/New_York")
+_MINUTE = dt.timedelta(minutes=1)
+
+
+def _brute_force(crontabs, start, end):
+    start = start.replace(second=0, microsecond=0)
+    counts = collections.Counter()
+    for crontab in crontabs:
+        for run in crontab.iter(start, dst_aware=True):
+            if run >= end:
+                break
+            counts[(run - start) // _MINUTE] += 1
+    return counts
+
+
+@pytest.mark.parametrize(
+    "start, days",
+    [
+        # Spans a month and year boundary.
+        (dt.datetime(2021, 12, 30, 22, 17, 30, tzinfo=dt.timezone.utc), 3),
+        # Spring forward in London and New York.
+        (dt.datetime(2022, 3, 12, tzinfo=dt.timezone.utc), 16),
+        # Fall back in London and New York.
+        (dt.datetime(2022, 10, 29, 12, tzinfo=dt.timezone.utc), 9),
+    ],
+)
+def test_load_histogram__matches_runs(start, days):
+    """
+    Given schedules across timezones and DST transitions expect the count of each
+    minute to equal the number of runs within it.
+    """
+    expressions = [
+        ("*/15 * * * *", dt.timezone.utc),
+        ("30 1 * * *", LONDON),
+        ("30 1 * * *", LONDON),
+        ("0 2 * * SUN", NEW_YORK),
+        ("5-10 0-3 1,13,31 * *", NEW_YORK),
+        ("0 0 29 2 *", dt.timezone(dt.timedelta(hours=5, minutes=30))),
+        ("@hourly", LONDON),
+    ]
+    crontabs = [
+        Crontab.from_parse(expr=f"{expr} /usr/bin/find", tz=tz)
+        for expr, tz in expressions
+    ]
+    end = start + dt.timedelta(days=days)
+
+    histogram = LoadHistogram(crontabs, start, end)
+
+    expected = _brute_force(crontabs, start, end)
+    assert -(-(end - start.replace(second=0)) // _MINUTE) == len(histogram)
+    assert dict(expected) == {i: x for i, x in enumerate(histogram.counts) if x}
+
+
+def test_load_histogram__peaks():
+    """
+    Given schedules which coincide expect the busiest minutes, earliest first for
+    ties, along with the schedules firing in them.
+    """
+    crontabs = [
+        Crontab.from_parse(expr=f"{expr} /usr/bin/find", tz=dt.timezone.utc)
+        for expr in ["0 * * * *", "*/30 * * * *", "0 0 * * *", "0 * * * *"]
+    ]
+    start = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+
+    histogram = LoadHistogram(crontabs, start, start + dt.timedelta(hours=2))
+
+    assert [
+        Peak(start, 4, (0, 1, 2, 3)),
+        Peak(start + dt.timedelta(hours=1), 3, (0, 1, 3)),
+        Peak(start + dt.timedelta(minutes=30), 1, (1,)),
+    ] == histogram.peaks(3)
+    assert (1,) == histogram.schedules(90)
+    assert () == histogram.schedules(91)
+
+
+def test_load_histogram__peaks_across_transition():
+    """
+    Given a schedule whose run is moved by a DST transition expect it to contribute
+    to the minute it actually runs in.
+    """
+    crontabs = [
+        Crontab.from_parse(expr="30 1 * * * /usr/bin/find", tz=LONDON),
+        Crontab.from_parse(expr="0 1 * * * /usr/bin/find", tz=dt.timezone.utc),
+    ]
+    start = dt.datetime(2022, 3, 27, tzinfo=dt.timezone.utc)
+
+    histogram = LoadHistogram(crontabs, start, start + dt.timedelta(days=1))
+
+    # 01:30 does not exist in London so runs at the end of the gap, 01:00 UTC.
+    assert [Peak(start + dt.timedelta(hours=1), 2, (0, 1))] == histogram.peaks(1)
+
+
+def test_load_histogram__empty_window():
+    """
+    Given an end before the start expect no minutes and no peaks.
+    """
+    crontab = Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+    start = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+
+    histogram = LoadHistogram([crontab], start, start - _MINUTE)
+
+    assert 0 == len(histogram)
+    assert [] == histogram.peaks()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+import sys
+
+import pytest
+
+from croninfo.crontab import Crontab
+from croninfo.overlap import Overlap, find_overlaps, first_overlap
+
+# Backports is required for Python versions <3.9
+if sys.version_info >= (3, 9):
+    import zoneinfo
+else:
+    from backports import zoneinfo
+
+START = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+LONDON = zoneinfo.ZoneInfo("Europe/London")
+KOLKATA = dt.timezone(dt.timedelta(hours=5, minutes=30))
+
+
+def _crontab(expr, tz=dt.timezone.utc):
+    return Crontab.from_parse(expr=f"{expr} /usr/bin/find", tz=tz)
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        (
+            _crontab("*/15 * * * *"),
+            _crontab("0 12 * * *"),
+            dt.datetime(2022, 1, 1, 12, tzinfo=dt.timezone.utc),
+        ),
+        (
+            _crontab("0 0 * * MON"),
+            _crontab("0 0 13 * *"),
+            dt.datetime(2022, 6, 13, tzinfo=dt.timezone.utc),
+        ),
+        # Fields intersect but there is no date on which both run.
+        (_crontab("0 0 31 * *"), _crontab("0 0 * FEB *"), None),
+        (_crontab("0 0 * * *"), _crontab("30 * * * *"), None),
+        # 01:30 does not exist in London so runs with 02:00 at the end of the gap.
+        (
+            _crontab("30 1 * * *", LONDON),
+            _crontab("0 2 * * *", LONDON),
+            dt.datetime(2022, 3, 27, 2, tzinfo=LONDON),
+        ),
+        # London is UTC+1 in the summer.
+        (
+            _crontab("0 9 * * *", LONDON),
+            _crontab("0 8 * JUN *"),
+            dt.datetime(2022, 6, 1, 8, tzinfo=dt.timezone.utc),
+        ),
+        # Crosses midnight, 23:30 on Sunday in Kolkata is 18:00 UTC.
+        (
+            _crontab("30 23 * * SUN", KOLKATA),
+            _crontab("0 18 * * *"),
+            dt.datetime(2022, 1, 2, 23, 30, tzinfo=KOLKATA),
+        ),
+        (_crontab("30 23 * * SUN", KOLKATA), _crontab("0 18 * * MON"), None),
+        (_crontab("0 * * * *", KOLKATA), _crontab("0 * * * *"), None),
+    ],
+)
+def test_first_overlap(a, b, expected):
+    """
+    Given two schedules expect the first instant at which both run, or None if
+    they never do.
+    """
+    assert expected == first_overlap(a, b, START)
+    assert expected == first_overlap(b, a, START)
+
+
+def test_first_overlap__end():
+    """
+    Given an end before the schedules first run together expect None.
+    """
+    a = _crontab("0 0 * * MON")
+    b = _crontab("0 0 13 * *")
+
+    assert first_overlap(a, b, START, START + dt.timedelta(days=162)) is None
+
+
+def test_find_overlaps__matches_pairwise():
+    """
+    Given a fleet of schedules across timezones expect the same overlaps as
+    comparing the runs of every pair.
+    """
+    crontabs = [
+        _crontab("*/20 * * * *"),
+        _crontab("0 3 * * SUN", LONDON),
+        _crontab("30 1 * * *", LONDON),
+        _crontab("0 2 * * *", LONDON),
+        _crontab("0 2 * * *", LONDON),
+        _crontab("0 1 * * SUN"),
+        _crontab("30 6 * * *", KOLKATA),
+        _crontab("15 * 1-7 * *"),
+        _crontab("0 0 29 2 *"),
+    ]
+    end = START + dt.timedelta(days=120)
+
+    runs = [
+        set(itertools.takewhile(lambda x: x < end, x.iter(START, dst_aware=True)))
+        for x in crontabs
+    ]
+    expected = []
+    for i, j in itertools.combinations(range(len(crontabs)), 2):
+        common = runs[i] & runs[j]
+        if common:
+            expected.append(Overlap(i, j, min(common)))
+
+    assert expected == find_overlaps(crontabs, START, end)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import datetime as dt
+import io
+from textwrap import dedent
+
+import pytest
+
+from croninfo.crontab import Crontab, ScheduleCache
+from croninfo.reader import CrontabLine, CrontabLineError, iter_crontab
+
+CRONTAB = dedent("""\
+    # m h dom mon dow command
+    SHELL=/bin/sh
+    MAILTO = ops@example.com
+
+    */15 0 1,15 * 1-5 /usr/bin/find / -name "*.tmp" -delete
+      @daily   /usr/bin/backup --full
+    61 * * * * /usr/bin/find
+    0 0 * * * /usr/bin/find
+    """)
+
+
+def test_iter_crontab():
+    """
+    Given a crontab file expect comments, blank and environment lines to be skipped
+    and entries to be yielded with their line numbers.
+    """
+    result = list(iter_crontab(io.StringIO(CRONTAB), tz=dt.timezone.utc))
+
+    assert [
+        CrontabLine(
+            lineno=5,
+            crontab=Crontab.from_parse(
+                expr='*/15 0 1,15 * 1-5 /usr/bin/find / -name "*.tmp" -delete',
+                tz=dt.timezone.utc,
+            ),
+        ),
+        CrontabLine(
+            lineno=6,
+            crontab=Crontab.from_parse(
+                expr="@daily /usr/bin/backup --full", tz=dt.timezone.utc
+            ),
+        ),
+        CrontabLineError(
+            lineno=7,
+            line="61 * * * * /usr/bin/find",
+            error="Minute value must be in range of [0, 59]",
+        ),
+        CrontabLine(
+            lineno=8,
+            crontab=Crontab.from_parse(
+                expr="0 0 * * * /usr/bin/find", tz=dt.timezone.utc
+            ),
+        ),
+    ] == result
+    assert '/usr/bin/find / -name "*.tmp" -delete' == result[0].crontab.command
+
+
+def test_iter_crontab__path(tmp_path):
+    """
+    Given a path expect the file to be opened and streamed.
+    """
+    path = tmp_path / "crontab"
+    path.write_text(CRONTAB)
+
+    result = list(iter_crontab(path, tz=dt.timezone.utc))
+    assert [5, 6, 7, 8] == [x.lineno for x in result]
+
+    result = list(iter_crontab(str(path), tz=dt.timezone.utc))
+    assert [5, 6, 7, 8] == [x.lineno for x in result]
+
+
+def test_iter_crontab__lazy():
+    """
+    Lines should only be consumed as entries are requested.
+    """
+    consumed = []
+
+    def lines():
+        for line in CRONTAB.splitlines():
+            consumed.append(line)
+            yield line
+
+    result = iter_crontab(lines(), tz=dt.timezone.utc)
+    assert 5 == next(result).lineno
+    assert 5 == len(consumed)
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        (
+            "17 * * * * root cd / && run-parts --report /etc/cron.hourly",
+            CrontabLine(
+                lineno=1,
+                crontab=Crontab.from_parse(
+                    expr="17 * * * * cd / && run-parts --report /etc/cron.hourly",
+                    tz=dt.timezone.utc,
+                ),
+                user="root",
+            ),
+        ),
+        (
+            "@weekly nobody /usr/bin/find",
+            CrontabLine(
+                lineno=1,
+                crontab=Crontab.from_parse(
+                    expr="@weekly /usr/bin/find", tz=dt.timezone.utc
+                ),
+                user="nobody",
+            ),
+        ),
+        (
+            "17 * * * * root",
+            CrontabLineError(
+                lineno=1,
+                line="17 * * * * root",
+                error="System crontab line must contain a user and command",
+            ),
+        ),
+    ],
+)
+def test_iter_crontab__system(line, expected):
+    """
+    Given a system crontab expect the user field to be split out of the command.
+    """
+    result = list(iter_crontab([line], tz=dt.timezone.utc, system=True))
+    assert [expected] == result
+
+
+def test_iter_crontab__cache():
+    """
+    Given a cache expect repeated schedules to be shared.
+    """
+    cache = ScheduleCache()
+    lines = ["@daily /usr/bin/find", "0 0 * * * /usr/bin/true", "@daily /usr/bin/find"]
+
+    result = list(iter_crontab(lines, tz=dt.timezone.utc, cache=cache))
+
+    assert result[0].crontab is result[2].crontab
+    assert 2 == cache.info().hits
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+
+import pytest
+
+from croninfo.crontab import Crontab
+from croninfo.rebalance import peak_load, rebalance
+
+# Backports is required for Python versions <3.9
+if sys.version_info >= (3, 9):
+    import zoneinfo
+else:
+    from backports import zoneinfo
+
+AT = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+LONDON = zoneinfo.ZoneInfo("Europe/London")
+KOLKATA = dt.timezone(dt.timedelta(hours=5, minutes=30))
+
+
+def _crontab(expr, tz=dt.timezone.utc):
+    return Crontab.from_parse(expr=f"{expr} /usr/bin/find", tz=tz)
+
+
+@pytest.mark.parametrize(
+    "exprs, expected",
+    [
+        (["0 * * * *"] * 60, 1),
+        (["*/15 * * * *"] * 15 + ["0 * * * *"] * 4, 2),
+        (["0 9 * * MON-FRI"] * 3 + ["30 9 1 * *"], 1),
+        (["* 9 * * *", "0 9 * * *", "0 10 * * *"], 2),
+    ],
+)
+def test_rebalance__peak(exprs, expected):
+    """
+    Given schedules firing at the same minutes expect them spread out to the lowest
+    peak, keeping how often and in which hours each fires.
+    """
+    crontabs = [_crontab(x) for x in exprs]
+
+    rebalanced = rebalance(crontabs, at=AT)
+
+    assert expected == peak_load(rebalanced, AT)
+    for before, after in zip(crontabs, rebalanced):
+        assert len(before.minute) == len(after.minute)
+        assert before.hour == after.hour
+        assert before.monthday == after.monthday
+        assert before.weekday == after.weekday
+        assert before.command == after.command
+
+
+def test_rebalance__fixed():
+    """
+    Given fixed schedules expect them to count towards the load, with schedules
+    already clear of them left unchanged.
+    """
+    fixed = [_crontab("0 * * * *", LONDON), _crontab("0 * * * *", KOLKATA)]
+    crontabs = [_crontab("0 * * * *"), _crontab("15 * * * *"), _crontab("0 * * * *")]
+
+    rebalanced = rebalance(crontabs, fixed=fixed, at=AT)
+
+    assert 1 == peak_load([*fixed, *rebalanced], AT)
+    assert crontabs[1] is rebalanced[1]
+    assert [1, 15, 59] == [x.minute.mask.bit_length() - 1 for x in rebalanced]
+
+
+def test_rebalance__max_hour_shift():
+    """
+    Given a maximum hour shift expect schedules to move within it, not wrapping
+    around midnight.
+    """
+    crontabs = [_crontab("* 0 * * *"), _crontab("* 0 * * *"), _crontab("* 23 * * *")]
+
+    rebalanced = rebalance(crontabs, max_hour_shift=1, at=AT)
+
+    assert 1 == peak_load(rebalanced, AT)
+    assert [[0], [1], [23]] == [x.hour.values for x in rebalanced]
+    with pytest.raises(ValueError, match="must not be negative"):
+        rebalance(crontabs, max_hour_shift=-1)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+
+import pytest
+
+from croninfo.crontab import Crontab
+from croninfo.schedule_set import Firing, RunQueue, ScheduleSet
+
+START = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _crontab(expr):
+    return Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+
+
+def test_schedule_set__merged_timeline():
+    """
+    Given many schedules expect a single time ordered stream of their firings.
+    """
+    hourly = _crontab("0 * * * * /usr/bin/hourly")
+    half = _crontab("30 * * * * /usr/bin/half")
+    daily = _crontab("@daily /usr/bin/daily")
+
+    schedules = ScheduleSet([hourly, half, daily], start=START)
+    result = [(x.crontab.command, x.run) for x in itertools.islice(schedules, 5)]
+
+    assert [
+        ("/usr/bin/hourly", START),
+        ("/usr/bin/daily", START),
+        ("/usr/bin/half", START.replace(minute=30)),
+        ("/usr/bin/hourly", START.replace(hour=1)),
+        ("/usr/bin/half", START.replace(hour=1, minute=30)),
+    ] == result
+
+
+def test_schedule_set__matches_individual_iteration():
+    """
+    The merged stream should contain exactly the firings of each schedule.
+    """
+    crontabs = [
+        _crontab("*/7 * * * * /usr/bin/a"),
+        _crontab("*/11 */2 * * * /usr/bin/b"),
+        _crontab("0 0 29 2 * /usr/bin/c"),
+    ]
+    end = START + dt.timedelta(days=3)
+
+    result = list(
+        itertools.takewhile(lambda x: x.run < end, ScheduleSet(crontabs, start=START))
+    )
+
+    assert [x.run for x in result] == sorted(x.run for x in result)
+    for key, crontab in enumerate(crontabs):
+        expected = list(itertools.takewhile(lambda x: x < end, crontab.iter(START)))
+        assert expected == [x.run for x in result if x.key == key]
+
+
+def test_schedule_set__add_remove_while_iterating():
+    """
+    Schedules added while iterating should start from the latest firing and removed
+    schedules should stop firing.
+    """
+    schedules = ScheduleSet([_crontab("*/20 * * * * /usr/bin/a")], start=START)
+    assert START == next(schedules).run
+
+    key = schedules.add(_crontab("*/30 * * * * /usr/bin/b"))
+    assert key in schedules
+    assert 2 == len(schedules)
+    assert [
+        (key, START),
+        (0, START.replace(minute=20)),
+        (key, START.replace(minute=30)),
+        (0, START.replace(minute=40)),
+    ] == [(x.key, x.run) for x in itertools.islice(schedules, 4)]
+
+    schedules.remove(0)
+    assert 0 not in schedules
+    assert Firing(key=key, crontab=schedules[key], run=START.replace(hour=1)) == next(
+        schedules
+    )
+
+    schedules.remove(key)
+    assert schedules.peek() is None
+    assert [] == list(schedules)
+
+    with pytest.raises(KeyError):
+        schedules.remove(key)
+
+
+def test_schedule_set__peek():
+    """
+    Peeking should not consume the next firing.
+    """
+    schedules = ScheduleSet([_crontab("@hourly /usr/bin/a")], start=START)
+
+    assert schedules.peek() == schedules.peek() == next(schedules)
+    assert START.replace(hour=1) == schedules.peek().run
+
+
+def test_run_queue__drops_removed_keys():
+    """
+    Given keys removed from the live collection expect them to be skipped, and pruned
+    once they make up most of the queue.
+    """
+    live = dict.fromkeys(range(200))
+    queue = RunQueue(live)
+    for key in reversed(range(200)):
+        queue.push(START + dt.timedelta(minutes=key), key)
+
+    for key in range(199):
+        del live[key]
+        queue.prune()
+    assert len(queue._heap) <= 2 * len(live) + 64
+    assert (START + dt.timedelta(minutes=199), 199) == queue.peek() == queue.pop()
+
+    assert queue.peek() is None
+    with pytest.raises(IndexError):
+        queue.pop()
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime as dt
+
+import pytest
+
+from croninfo.crontab import Crontab
+from croninfo.scheduler import Clock, Scheduler
+
+START = dt.datetime(2022, 1, 1, second=30, tzinfo=dt.timezone.utc)
+
+
+class FakeClock(Clock):
+    """
+    Clock whose wall time only moves when advanced or jumped by the test. Sleeps are
+    measured in elapsed time, like the event loop, so are unaffected by jumps.
+    """
+
+    def __init__(self, now: dt.datetime) -> None:
+        self.current = now
+        self.elapsed = 0.0
+
+    def now(self) -> dt.datetime:
+        return self.current
+
+    async def sleep(self, seconds: float) -> None:
+        deadline = self.elapsed + seconds
+        while self.elapsed < deadline:
+            await asyncio.sleep(0)
+
+    async def advance(self, seconds: float, *, step: float = 30) -> None:
+        end = self.elapsed + seconds
+        while self.elapsed < end:
+            delta = min(step, end - self.elapsed)
+            self.elapsed += delta
+            self.current += dt.timedelta(seconds=delta)
+            # Give the scheduler and any jobs it started a chance to run.
+            for _ in range(20):
+                await asyncio.sleep(0)
+
+
+def _crontab(expr):
+    return Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+
+
+def _run(scheduler, scenario):
+    async def main():
+        task = asyncio.ensure_future(scheduler.run())
+        try:
+            await scenario()
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    asyncio.run(main())
+
+
+def _recorder(clock, runs, name):
+    async def job():
+        runs.append((name, clock.now()))
+
+    return job
+
+
+def test_scheduler__runs_due_jobs():
+    """
+    Given many jobs expect each to run at its scheduled times, in time order.
+    """
+    clock = FakeClock(START)
+    runs = []
+    scheduler = Scheduler(clock=clock)
+    scheduler.add(_crontab("*/15 * * * * quarterly"), _recorder(clock, runs, "quarter"))
+    scheduler.add(_crontab("0 * * * * hourly"), _recorder(clock, runs, "hourly"))
+
+    _run(scheduler, lambda: clock.advance(3600))
+
+    assert [
+        ("quarter", START.replace(minute=15, second=0)),
+        ("quarter", START.replace(minute=30, second=0)),
+        ("quarter", START.replace(minute=45, second=0)),
+        ("quarter", START.replace(hour=1, second=0)),
+        ("hourly", START.replace(hour=1, second=0)),
+    ] == runs
+
+
+def test_scheduler__clock_jumps_forward():
+    """
+    Given the clock jumps forward expect missed runs to fire once, rather than
+    once for every missed run.
+    """
+    clock = FakeClock(START)
+    runs = []
+    scheduler = Scheduler(clock=clock, max_sleep=60)
+    scheduler.add(_crontab("* * * * * minutely"), _recorder(clock, runs, "minutely"))
+    scheduler.add(_crontab("0 * * * * hourly"), _recorder(clock, runs, "hourly"))
+
+    async def scenario():
+        await clock.advance(90)
+        clock.current += dt.timedelta(hours=3)
+        await clock.advance(90)
+
+    _run(scheduler, scenario)
+
+    assert [
+        ("minutely", START.replace(minute=1, second=0)),
+        ("minutely", START.replace(minute=2, second=0)),
+        ("minutely", START.replace(hour=3, minute=3, second=0)),
+        ("hourly", START.replace(hour=3, minute=3, second=0)),
+    ] == runs
+
+
+def test_scheduler__clock_jumps_forward_while_sleeping():
+    """
+    Given the clock jumps forward while waiting for a distant run, expect it to be
+    noticed within max_sleep.
+    """
+    clock = FakeClock(START)
+    runs = []
+    scheduler = Scheduler(clock=clock, max_sleep=60)
+    scheduler.add(_crontab("0 * * * * hourly"), _recorder(clock, runs, "hourly"))
+
+    async def scenario():
+        await clock.advance(30)
+        clock.current += dt.timedelta(hours=3)
+        await clock.advance(60)
+
+    _run(scheduler, scenario)
+
+    assert [("hourly", START.replace(hour=3, minute=2, second=0))] == runs
+
+
+def test_scheduler__clock_jumps_backward():
+    """
+    Given the clock jumps backward expect runs which already fired not to repeat.
+    """
+    clock = FakeClock(START)
+    runs = []
+    scheduler = Scheduler(clock=clock, max_sleep=60)
+    scheduler.add(_crontab("* * * * * minutely"), _recorder(clock, runs, "minutely"))
+
+    async def scenario():
+        await clock.advance(90)
+        clock.current -= dt.timedelta(minutes=5)
+        await clock.advance(6 * 60)
+
+    _run(scheduler, scenario)
+
+    assert [
+        START.replace(minute=1, second=0),
+        START.replace(minute=2, second=0),
+        START.replace(minute=3, second=0),
+    ] == [run for _, run in runs]
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_scheduler__max_concurrency(max_concurrency):
+    """
+    Given a job which is still running when next due, expect runs to be skipped
+    once max_concurrency are in progress.
+    """
+    clock = FakeClock(START)
+    started = []
+    scheduler = Scheduler(clock=clock)
+
+    async def job():
+        started.append(clock.now())
+        await asyncio.Event().wait()
+
+    key = scheduler.add(
+        _crontab("* * * * * forever"), job, max_concurrency=max_concurrency
+    )
+
+    async def scenario():
+        await clock.advance(5 * 60)
+        assert max_concurrency == scheduler.running(key)
+
+    _run(scheduler, scenario)
+
+    assert max_concurrency == len(started)
+
+
+def test_scheduler__cancel():
+    """
+    Given the scheduler is cancelled, expect jobs in progress to also be cancelled.
+    """
+    clock = FakeClock(START)
+    cancelled = []
+    scheduler = Scheduler(clock=clock)
+
+    async def job():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(clock.now())
+            raise
+
+    key = scheduler.add(_crontab("* * * * * forever"), job)
+    _run(scheduler, lambda: clock.advance(60))
+
+    assert [START.replace(minute=1)] == cancelled
+    assert 0 == scheduler.running(key)
+
+
+def test_scheduler__remove():
+    """
+    Given a job is removed, expect it to no longer run.
+    """
+    clock = FakeClock(START)
+    runs = []
+    scheduler = Scheduler(clock=clock)
+    key = scheduler.add(_crontab("* * * * * minutely"), _recorder(clock, runs, "a"))
+
+    async def scenario():
+        await clock.advance(60)
+        scheduler.remove(key)
+        await clock.advance(180)
+
+    _run(scheduler, scenario)
+
+    assert [("a", START.replace(minute=1, second=0))] == runs
+    assert key not in scheduler
+    assert 0 == len(scheduler)
+
+
+def test_scheduler__job_exception():
+    """
+    Given a job raises, expect it reported to the loop and the scheduler to continue.
+    """
+    clock = FakeClock(START)
+    errors = []
+    scheduler = Scheduler(clock=clock)
+
+    async def job():
+        raise RuntimeError(clock.now())
+
+    scheduler.add(_crontab("* * * * * failing"), job)
+
+    async def scenario():
+        asyncio.get_event_loop().set_exception_handler(
+            lambda loop, context: errors.append(context["exception"])
+        )
+        await clock.advance(180)
+
+    _run(scheduler, scenario)
+
+    assert 3 == len(errors)
+    assert all(isinstance(error, RuntimeError) for error in errors)
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"max_sleep": 0}, "max_sleep must be greater than 0"),
+        ({"max_concurrency": 0}, "max_concurrency must be at least 1"),
+    ],
+)
+def test_scheduler__invalid_args(kwargs, expected):
+    """
+    Given invalid limits expect a ValueError.
+    """
+    with pytest.raises(ValueError, match=expected):
+        scheduler = Scheduler(max_sleep=kwargs.get("max_sleep", 60))
+        scheduler.add(
+            _crontab("* * * * * job"),
+            lambda: asyncio.sleep(0),
+            max_concurrency=kwargs.get("max_concurrency", 1),
+        )
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import io
+import sys
+
+import pytest
+
+from croninfo.crontab import Crontab, match_many
+from croninfo.serialize import ScheduleArchive, dump, dumps, loads
+
+# Backports is required for Python versions <3.9
+if sys.version_info >= (3, 9):
+    import zoneinfo
+else:
+    from backports import zoneinfo
+
+LONDON = zoneinfo.ZoneInfo("Europe/London")
+
+
+def _archive_bytes(crontabs):
+    buffer = io.BytesIO()
+    dump(crontabs, buffer)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "expr, tz",
+    [
+        ("* * * * * /usr/bin/find", dt.timezone.utc),
+        ("*/15 0 1,15 JAN-MAR MON-FRI /usr/bin/find / -name x", LONDON),
+        ("0 0 29 2 0 /usr/bin/leap", dt.timezone(dt.timedelta(hours=5, minutes=30))),
+        ("@hourly /usr/bin/☃", dt.timezone(-dt.timedelta(hours=9))),
+        # Historical zones can have offsets with seconds, E.G. LMT.
+        ("@daily /usr/bin/find", dt.timezone(-dt.timedelta(hours=1, seconds=30))),
+    ],
+)
+def test_dumps_loads__round_trip(expr, tz):
+    """
+    Given a parsed Crontab expect the loaded schedule to be equal to it.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=tz)
+
+    assert crontab == loads(dumps(crontab))
+
+
+def test_dumps__unsupported_tz():
+    """
+    Given a timezone which can not be looked up by name expect a ValueError.
+    """
+
+    class CustomTZ(dt.tzinfo):
+        def utcoffset(self, ts):
+            return dt.timedelta(hours=1) if ts else None
+
+    crontab = Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+    crontab = dataclasses.replace(crontab, tz=CustomTZ())
+
+    with pytest.raises(ValueError, match="can not be serialised"):
+        dumps(crontab)
+
+
+def test_archive__mmap(tmp_path):
+    """
+    Given many schedules written to an archive expect random access to each of them
+    from the memory mapped file.
+    """
+    crontabs = [
+        Crontab.from_parse(expr=f"{i % 60} * * * * /usr/bin/job{i}", tz=tz)
+        for i in range(200)
+        for tz in (dt.timezone.utc, LONDON)
+    ]
+    path = tmp_path / "schedules.bin"
+    with open(path, "wb") as f:
+        assert len(crontabs) == dump(crontabs, f)
+
+    with ScheduleArchive.open(path) as archive:
+        assert len(crontabs) == len(archive)
+        assert ("UTC", "Europe/London") == archive.tz_names
+        assert crontabs[123] == archive[123]
+        assert crontabs == list(archive)
+        with pytest.raises(IndexError):
+            archive[len(crontabs)]
+
+
+def test_archive__matching():
+    """
+    Given a timestamp expect the indexes of the schedules firing at it, without
+    decoding them, to agree with evaluating the schedules.
+    """
+    crontabs = [
+        Crontab.from_parse(expr=expr, tz=tz)
+        for expr in ["0 * * * * a", "30 12 * * * b", "* 12 * * SAT c", "@daily d"]
+        for tz in (dt.timezone.utc, LONDON, dt.timezone(dt.timedelta(hours=-12)))
+    ]
+    archive = ScheduleArchive(_archive_bytes(crontabs))
+    ts = dt.datetime(2022, 7, 2, 11, 30, tzinfo=dt.timezone.utc)
+
+    expected = [i for i, match in enumerate(match_many(crontabs, ts)) if match]
+    assert expected == list(archive.matching(ts))
+    assert expected
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"", "Not a croninfo schedule archive"),
+        (b"JUNK" + bytes(20), "Not a croninfo schedule archive"),
+        (
+            b"CRON\x02\x00" + bytes(18),
+            "Unsupported croninfo schedule archive version 2",
+        ),
+    ],
+)
+def test_loads__invalid(data, expected):
+    """
+    Given data which is not a supported archive expect a ValueError.
+    """
+    with pytest.raises(ValueError, match=expected):
+        loads(data)
+
+
+def test_loads__multiple():
+    """
+    Given an archive of many schedules expect loads to reject it.
+    """
+    crontab = Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+
+    with pytest.raises(ValueError, match="Expected a single schedule, found 2"):
+        loads(_archive_bytes([crontab, crontab]))
+
+
+def test_archive__invalid_mask():
+    """
+    Given a corrupt record with values out of range expect a ValueError on access.
+    """
+    crontab = Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+    data = bytearray(dumps(crontab))
+    # The minute mask is the first field of the last (only) record.
+    record = len(data) - len(crontab.command) - 25
+    data[record + 7] = 0xFF
+
+    with pytest.raises(ValueError, match="Invalid Minute mask"):
+        loads(data)
+
+
+def test_archive__empty_mask():
+    """
+    Given a corrupt record with no values for a field expect a ValueError on access.
+    """
+    crontab = Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+    data = bytearray(dumps(crontab))
+    # The hour mask follows the minute mask of the last (only) record.
+    record = len(data) - len(crontab.command) - 25
+    data[record + 8 : record + 12] = bytes(4)
+
+    with pytest.raises(ValueError, match="Invalid Hour mask 0x0"):
+        loads(data)
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        # Offsets table cut short.
+        (-len("/usr/bin/find") - 30, "truncated offsets"),
+        # Record cut short.
+        (-len("/usr/bin/find") - 5, "truncated at offset"),
+        # Command cut short.
+        (-2, "truncated at offset"),
+    ],
+)
+def test_archive__truncated(size, expected):
+    """
+    Given an archive cut short expect a ValueError rather than a struct error.
+    """
+    crontab = Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+    data = dumps(crontab)[:size]
+
+    with pytest.raises(ValueError, match=expected):
+        loads(data)
+
+
+def test_archive__truncated_matching():
+    """
+    Given an archive with a record cut short expect matching to raise a ValueError.
+    """
+    crontab = Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+    archive = ScheduleArchive(dumps(crontab)[: -len(crontab.command) - 5])
+
+    with pytest.raises(ValueError, match="truncated at offset"):
+        list(archive.matching(dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)))
+
+
+def test_archive__unknown_tz():
+    """
+    Given a record referring to a timezone not in the table expect a ValueError.
+    """
+    crontab = Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+    data = bytearray(dumps(crontab))
+    # The timezone index precedes the command length of the last (only) record.
+    record = len(data) - len(crontab.command) - 25
+    data[record + 19] = 7
+
+    with pytest.raises(ValueError, match="unknown timezone 7"):
+        loads(data)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _imported_modules(statement: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Each line is of the form "import time: self | cumulative | module".
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+@pytest.mark.parametrize(
+    "module", ["importlib.metadata", "importlib_metadata", "typer", "rich", "tzlocal"]
+)
+def test_import__does_not_load_heavy_dependencies(module: str) -> None:
+    """
+    Given the library is imported without using the CLI or version,
+    expect no CLI or package metadata dependencies are loaded.
+    """
+    assert module not in _imported_modules("import croninfo")
+
+
+def test_import__version_is_lazy() -> None:
+    """
+    Given the version is accessed on the package, expect it resolved on demand.
+    """
+    modules = _imported_modules("import croninfo; croninfo.__version__")
+    assert {"importlib.metadata", "importlib_metadata"} & modules
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "concurrent.futures",
+        "croninfo.bulk",
+        "croninfo.load",
+        "croninfo.reader",
+        "croninfo.rebalance",
+        "json",
+        "rich",
+    ],
+)
+def test_import_cli__does_not_load_command_dependencies(module: str) -> None:
+    """
+    Given the CLI is imported (as for --version), expect the dependencies of
+    individual commands are not loaded.
+    """
+    assert module not in _imported_modules("import croninfo.cli")
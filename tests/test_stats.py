@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import itertools
+import threading
+
+from croninfo import stats
+from croninfo.crontab import Crontab
+
+START = dt.datetime(year=2022, month=1, day=1, hour=13, tzinfo=dt.timezone.utc)
+
+
+def test_collect__solver_counters():
+    """
+    Given a leap day schedule which also has to match a weekday,
+    expect the years rolled over to find it to be counted.
+    """
+    with stats.collect() as collected:
+        crontab = Crontab.from_parse(
+            expr="0 0 29 2 1 /usr/bin/find", tz=dt.timezone.utc
+        )
+        assert crontab.next_run(START) == dt.datetime(
+            2044, 2, 29, tzinfo=dt.timezone.utc
+        )
+
+    assert 1 == collected.parses
+    assert collected.parse_seconds > 0
+    assert 22 == collected.years_rolled
+    assert 22 * 12 + 2 == collected.months_scanned
+    assert 23 == collected.rejected_days
+
+
+def test_collect__iter_counters():
+    """
+    Given iteration starts after the hour of the schedule has passed,
+    expect the skipped hour to be counted as rejected.
+    """
+    crontab = Crontab.from_parse(expr="30 12 * * * /usr/bin/find", tz=dt.timezone.utc)
+    with stats.collect() as collected:
+        list(itertools.islice(crontab.iter(START), 2))
+
+    assert 0 == collected.parses
+    assert 3 == collected.days_scanned
+    assert 1 == collected.rejected_hours
+    assert 0 == collected.rejected_minutes
+
+
+def test_collect__inactive():
+    """
+    Given no collector is active, expect no counters to be recorded.
+    """
+    assert stats.current() is None
+    with stats.collect() as collected:
+        assert stats.current() is collected
+    Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+
+    assert stats.current() is None
+    assert 0 == collected.parses
+
+
+def test_collect__nested():
+    """
+    Given nested collectors, expect only the innermost to receive counts.
+    """
+    with stats.collect() as outer:
+        with stats.collect() as inner:
+            Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+        assert stats.current() is outer
+
+    assert 0 == outer.parses
+    assert 1 == inner.parses
+
+
+def test_collect__concurrent_tasks():
+    """
+    Given collectors in concurrent asyncio tasks, expect each to only receive the
+    counts of its own task and to be restored independently.
+    """
+
+    async def parse(count):
+        with stats.collect() as collected:
+            for _ in range(count):
+                Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+                # Switch to the other task while both collectors are active.
+                await asyncio.sleep(0)
+            assert stats.current() is collected
+        assert stats.current() is None
+        return collected
+
+    async def main():
+        return await asyncio.gather(parse(2), parse(5))
+
+    first, second = asyncio.run(main())
+
+    assert 2 == first.parses
+    assert 5 == second.parses
+
+
+def test_collect__concurrent_threads():
+    """
+    Given collectors in concurrent threads, expect each to only receive the counts
+    of its own thread.
+    """
+    barrier = threading.Barrier(2)
+    results = {}
+
+    def parse(count):
+        with stats.collect() as collected:
+            barrier.wait()
+            for _ in range(count):
+                Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+            barrier.wait()
+        results[count] = collected
+
+    threads = [threading.Thread(target=parse, args=(x,)) for x in (2, 5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert 2 == results[2].parses
+    assert 5 == results[5].parses
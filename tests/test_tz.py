@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+
+import pytest
+
+from croninfo.tz import Transition, localize, transition_table
+
+# Backports is required for Python versions <3.9
+if sys.version_info >= (3, 9):
+    import zoneinfo
+else:
+    from backports import zoneinfo
+
+LONDON = zoneinfo.ZoneInfo("Europe/London")
+
+
+def test_transition_table():
+    """
+    Given a zone with DST expect its transitions for the year to the second.
+    """
+    table = transition_table(LONDON, 2022)
+
+    assert dt.timedelta(0) == table.offset
+    assert (
+        Transition(
+            at=dt.datetime(2022, 3, 27, 1, 0),
+            before=dt.timedelta(0),
+            after=dt.timedelta(hours=1),
+        ),
+        Transition(
+            at=dt.datetime(2022, 10, 30, 1, 0),
+            before=dt.timedelta(hours=1),
+            after=dt.timedelta(0),
+        ),
+    ) == table.transitions
+    assert table is transition_table(LONDON, 2022)
+
+
+@pytest.mark.parametrize(
+    "tz, expected",
+    [
+        (dt.timezone.utc, dt.timedelta(0)),
+        (dt.timezone(dt.timedelta(hours=-5)), dt.timedelta(hours=-5)),
+        (zoneinfo.ZoneInfo("Asia/Tokyo"), dt.timedelta(hours=9)),
+    ],
+)
+def test_transition_table__fixed_offset(tz, expected):
+    """
+    Given a zone without DST expect no transitions.
+    """
+    table = transition_table(tz, 2022)
+
+    assert expected == table.offset
+    assert () == table.transitions
+
+
+@pytest.mark.parametrize(
+    "wall, expected_utc, expected_local",
+    [
+        # Before spring forward.
+        (
+            dt.datetime(2022, 3, 27, 0, 59),
+            dt.datetime(2022, 3, 27, 0, 59),
+            "2022-03-27T00:59:00+00:00",
+        ),
+        # Skipped, moved to the end of the gap.
+        (
+            dt.datetime(2022, 3, 27, 1, 30),
+            dt.datetime(2022, 3, 27, 1, 0),
+            "2022-03-27T02:00:00+01:00",
+        ),
+        (
+            dt.datetime(2022, 3, 27, 2, 0),
+            dt.datetime(2022, 3, 27, 1, 0),
+            "2022-03-27T02:00:00+01:00",
+        ),
+        # Repeated, first occurrence.
+        (
+            dt.datetime(2022, 10, 30, 1, 30),
+            dt.datetime(2022, 10, 30, 0, 30),
+            "2022-10-30T01:30:00+01:00",
+        ),
+        (
+            dt.datetime(2022, 10, 30, 2, 0),
+            dt.datetime(2022, 10, 30, 2, 0),
+            "2022-10-30T02:00:00+00:00",
+        ),
+    ],
+)
+def test_localize(wall, expected_utc, expected_local):
+    """
+    Given a wall clock time expect it to be resolved following the cron DST policy.
+    """
+    utc, local = localize(LONDON, wall)
+
+    assert expected_utc == utc
+    assert expected_local == local.isoformat()
+    assert utc == local.astimezone(dt.timezone.utc).replace(tzinfo=None)
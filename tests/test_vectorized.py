@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+
+import pytest
+
+from croninfo.crontab import Crontab
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("croninfo.vectorized")
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "* * * * * /usr/bin/find",
+        "*/7 9-17 1-15 * MON-FRI /usr/bin/find",
+        "0 0 29 2 * /usr/bin/find",
+        "30 23 31 * SUN /usr/bin/find",
+    ],
+)
+def test_firing_times__matches_iter(expr):
+    """
+    Given any valid cron expression expect the vectorized firings to match iter
+    over the same window.
+    """
+    crontab = Crontab.from_parse(expr=expr, tz=dt.timezone.utc)
+    start = dt.datetime(2023, 12, 30, 22, 13, 20, tzinfo=dt.timezone.utc)
+    end = dt.datetime(2024, 4, 2, 0, 0, 1, tzinfo=dt.timezone.utc)
+
+    expected = [
+        np.datetime64(x.replace(tzinfo=None), "m")
+        for x in itertools.takewhile(lambda x: x < end, crontab.iter(start))
+    ]
+    result = vectorized.firing_times(crontab, start, end)
+
+    assert "datetime64[m]" == str(result.dtype)
+    assert expected == list(result)
+
+
+def test_firing_mask():
+    """
+    The mask should align with the minutes of the window.
+    """
+    crontab = Crontab.from_parse(expr="*/15 * * * * /usr/bin/find", tz=dt.timezone.utc)
+    start = dt.datetime(2022, 1, 1, 0, 10, tzinfo=dt.timezone.utc)
+    end = dt.datetime(2022, 1, 1, 1, 0, tzinfo=dt.timezone.utc)
+
+    minutes = vectorized.minute_range(crontab, start, end)
+    mask = vectorized.firing_mask(crontab, start, end)
+
+    assert 50 == len(minutes) == len(mask)
+    assert [
+        np.datetime64("2022-01-01T00:15"),
+        np.datetime64("2022-01-01T00:30"),
+        np.datetime64("2022-01-01T00:45"),
+    ] == list(minutes[mask])
+
+
+def test_firing_mask__timezone():
+    """
+    The window should be evaluated in the wall clock of the crontab's timezone.
+    """
+    tz = dt.timezone(dt.timedelta(hours=2))
+    crontab = Crontab.from_parse(expr="0 9 * * * /usr/bin/find", tz=tz)
+    start = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+    end = dt.datetime(2022, 1, 3, tzinfo=dt.timezone.utc)
+
+    assert [
+        np.datetime64("2022-01-01T09:00"),
+        np.datetime64("2022-01-02T09:00"),
+    ] == list(vectorized.firing_times(crontab, start, end))
+
+
+def test_firing_mask__empty_window():
+    """
+    Given an end before the start expect no minutes.
+    """
+    crontab = Crontab.from_parse(expr="* * * * * /usr/bin/find", tz=dt.timezone.utc)
+    start = dt.datetime(2022, 1, 1, tzinfo=dt.timezone.utc)
+
+    assert 0 == len(vectorized.firing_mask(crontab, start, start))
+    assert 0 == len(
+        vectorized.firing_times(crontab, start, start - dt.timedelta(days=1))
+    )